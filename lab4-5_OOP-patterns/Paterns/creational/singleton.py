@@ -1,5 +1,6 @@
 import sqlite3
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 
 class DatabaseConnection:
@@ -7,80 +8,87 @@ class DatabaseConnection:
     Singleton для управления подключением к базе данных SQLite.
     
     Гарантирует единственное подключение к БД в рамках приложения.
+    В режиме пула (enable_pool) выдает каждому потоку свое подключение.
     """
     
     _instance: Optional['DatabaseConnection'] = None
     _connection: Optional[sqlite3.Connection] = None
+    _pool: Optional['ConnectionPool'] = None
     
     def __new__(cls):
-      """ создание нового экземпляра"""
+        """ создание нового экземпляра"""
         if cls._instance is None:
             cls._instance = super(DatabaseConnection, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
-      """ инициализация"""
+        """ инициализация"""
         if self._connection is None:
             self._connection = None
     
     @classmethod
     def get_instance(cls) -> 'DatabaseConnection':
-      """
-      Получить единственный экземпляр класса.
-      """
+        """
+        Получить единственный экземпляр класса.
+        """
         if cls._instance is None:
             cls._instance = cls()
         return cls._instance
     
     def get_connection(self, db_path: str = "company.db") -> sqlite3.Connection:
-     """ получить подключение к бд""" 
+        """ получить подключение к бд (общее для всех потоков)"""
         if self._connection is None:
             self._connection = sqlite3.connect(db_path)
             self._connection.row_factory = sqlite3.Row
-            self._create_tables()
+            self._create_tables(self._connection)
         return self._connection
     
+    def enable_pool(self, db_path: str = "company.db", size: int = 5, **pragmas) -> 'ConnectionPool':
+        """
+        Включить режим пула подключений.
+
+        Args:
+            db_path: Путь к файлу БД
+            size: Число подключений в пуле
+            **pragmas: journal_mode, synchronous, cache_size, busy_timeout (см. ConnectionPool)
+        """
+        from data_base.pool import ConnectionPool
+        
+        if self._pool is not None:
+            self._pool.close()
+        self._pool = ConnectionPool(db_path, size, on_connect=self._create_tables, **pragmas)
+        return self._pool
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Подключение на время блока with.
+        С пулом - подключение текущего потока, без пула - общее подключение.
+        """
+        if self._pool is None:
+            yield self.get_connection()
+        else:
+            with self._pool.connection() as connection:
+                yield connection
+    
     def close_connection(self) -> None:
         if self._connection is not None:
             self._connection.close()
             self._connection = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
     
-    def _create_tables(self) -> None:
-      """создание таблицы в бд"""
-        if self._connection is None:
-            return
-        
-        cursor = self._connection.cursor()
-        # сотрудники
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS employees (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                department TEXT NOT NULL,
-                base_salary REAL NOT NULL,
-                employee_type TEXT NOT NULL,
-                bonus REAL,
-                tech_stack TEXT,
-                seniority_level TEXT,
-                commission_rate REAL,
-                sales_volume REAL
-            )
-        """)
-        # отделы
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS departments (
-                name TEXT PRIMARY KEY
-            )
-        """)
+    def _create_tables(self, connection: sqlite3.Connection) -> None:
+        """создание таблиц и индексов в бд (миграция существующего файла до текущей схемы)"""
+        from core_OOP.migrations import migrate
         
-        self._connection.commit()
+        migrate(connection)
     
     def reset_instance(self) -> None:
-      """
+        """
         Сбросить экземпляр
         FOR TEST ONLY
         """
-        if self._connection is not None:
-            self._connection.close()
-        self._connection = None
+        self.close_connection()
         DatabaseConnection._instance = None
@@ -2,6 +2,10 @@ from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 
 class AbstractEmployee(ABC):
+    # Наблюдатели за изменением зарплаты и ID (список создается при первой подписке).
+    # Слоты позволяют подклассам с __slots__ обходиться без __dict__
+    __slots__ = ('_salary_observers',)
+
     @abstractmethod
     def calculate_salary(self) -> float:
         pass
@@ -21,6 +25,62 @@ class AbstractEmployee(ABC):
         """Создает объект из словаря"""
         pass
 
+    # наблюдение за зарплатой
+    def add_salary_observer(self, observer) -> None:
+        """
+        Подписывает наблюдателя с методом on_salary_changed(employee, old_salary, new_salary)
+        и/или on_employee_id_changed(employee, old_id, new_id) - владельцы индексов по ID
+        (отдел, проект) получают его при смене ID сотрудника
+        """
+        observers = getattr(self, '_salary_observers', None)
+        if observers is None:
+            self._salary_observers = [observer]
+        else:
+            observers.append(observer)
+
+    def remove_salary_observer(self, observer) -> None:
+        """Отписывает наблюдателя от изменений зарплаты"""
+        self._salary_observers.remove(observer)
+
+    def _notify_salary_changed(self, old_salary: float) -> None:
+        """
+        Уведомляет наблюдателей об изменении зарплаты.
+        Вызывается подклассами после изменения базовой зарплаты, бонуса, комиссии и т.п.
+
+        Args:
+            old_salary: Значение calculate_salary() до изменения
+        """
+        observers = getattr(self, '_salary_observers', None)
+        if not observers:
+            return
+        new_salary = self.calculate_salary()
+        for observer in list(observers):
+            on_changed = getattr(observer, 'on_salary_changed', None)
+            if on_changed is not None:
+                on_changed(self, old_salary, new_salary)
+
+    def _notify_id_changed(self, old_id: int, new_id: int) -> None:
+        """
+        Сообщает наблюдателям о смене ID, чтобы они перестроили свои индексы.
+        Наблюдатель может отклонить смену исключением (например, ID уже занят) -
+        тогда уже уведомленные получают обратную смену new_id -> old_id
+
+        Args:
+            old_id: ID до изменения
+            new_id: Новый ID
+        """
+        notified = []
+        try:
+            for observer in list(getattr(self, '_salary_observers', None) or ()):
+                on_changed = getattr(observer, 'on_employee_id_changed', None)
+                if on_changed is not None:
+                    on_changed(self, old_id, new_id)
+                    notified.append(on_changed)
+        except Exception:
+            for on_changed in reversed(notified):
+                on_changed(self, new_id, old_id)
+            raise
+
     # перезагрузка сотрудников
     def __eq__(self, other) -> bool:
         """ сотрудников по ID"""
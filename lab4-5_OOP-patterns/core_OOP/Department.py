@@ -1,6 +1,7 @@
 import json
+from bisect import bisect_left
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
 from .exceptions import (
     EmployeeNotFoundError,
@@ -8,6 +9,13 @@ from .exceptions import (
     DuplicateIdError,
     InvalidDataError
 )
+from .Abctract_emp import AbstractEmployee
+from .Employee import CompactEmployee, Employee
+
+# Классы сотрудников по полю 'type' из to_dict(); load_from_file(trusted=True)
+# создает их без валидации полей
+_EMPLOYEE_TYPES = {'Employee': Employee, 'CompactEmployee': CompactEmployee}
+_ROW_FIELDS = ('id', 'name', 'department', 'base_salary')
 
 
 class Department:
@@ -21,7 +29,18 @@ class Department:
         if not isinstance(name, str) or name.strip() == "":
             raise InvalidDataError("Название отдела не должно быть пустой строкой")
         self.__name = name
+        # Упорядоченный список для индексации и срезов, словарь ID -> сотрудник для O(1) поиска.
+        # Номера вставки растут вдоль списка, поэтому позиция удаляемого сотрудника
+        # находится двоичным поиском и список не приходится пересобирать
         self.__employees: List[AbstractEmployee] = []
+        self.__employees_by_id: Dict[int, AbstractEmployee] = {}
+        self.__sequence: List[int] = []
+        self.__sequence_by_id: Dict[int, int] = {}
+        self.__next_sequence = 0
+        # Текущая сумма зарплат, обновляется при добавлении/удалении и изменении зарплат
+        self.__total_salary = 0.0
+        # Наблюдатели за составом отдела (например, компания с глобальным индексом)
+        self.__observers: List[Any] = []
 
     @property
     def name(self) -> str:
@@ -34,27 +53,117 @@ class Department:
             raise InvalidDataError("Название отдела не должно быть пустой строкой")
         self.__name = value
 
-     def add_employee(self, employee):
+    def add_observer(self, observer) -> None:
+        """
+        Подписывает наблюдателя на изменения состава отдела
+
+        Args:
+            observer: Объект с методами on_employee_added(department, employee),
+                      on_employee_removed(department, employee)
+                      и on_employee_id_changed(department, employee, old_id, new_id)
+        """
+        self.__observers.append(observer)
+
+    def remove_observer(self, observer) -> None:
+        """Отписывает наблюдателя от изменений состава отдела"""
+        self.__observers.remove(observer)
+
+    def add_employee(self, employee):
         """Добавляет сотрудника с проверкой уникальности ID"""
         # Проверка уникальности ID
-        for emp in self.__employees:
-            if emp.id == employee.id:
-                raise DuplicateIdError(
-                    entity_type="Сотрудник",
-                    entity_id=employee.id
-                )
-        
+        if employee.id in self.__employees_by_id:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=employee.id
+            )
+
+        # Наблюдатели уведомляются до добавления и могут отклонить его исключением;
+        # тогда уже уведомленные получают on_employee_removed и отдел не меняется
+        notified = []
+        try:
+            for observer in list(self.__observers):
+                observer.on_employee_added(self, employee)
+                notified.append(observer)
+        except Exception:
+            for observer in reversed(notified):
+                observer.on_employee_removed(self, employee)
+            raise
+
+        self.__employees_by_id[employee.id] = employee
         self.__employees.append(employee)
-    
+        self.__sequence.append(self.__next_sequence)
+        self.__sequence_by_id[employee.id] = self.__next_sequence
+        self.__next_sequence += 1
+
+        self.__total_salary += employee.calculate_salary()
+        employee.add_salary_observer(self)
+
+    def add_employees(self, employees) -> None:
+        """
+        Добавляет сотрудников пачкой (загрузка файлов и снимков).
+        Пачка добавляется целиком или не добавляется вовсе.
+
+        Args:
+            employees: Сотрудники в порядке добавления
+
+        Raises:
+            DuplicateIdError: Если ID повторяется в пачке или уже есть в отделе
+        """
+        employees = list(employees)
+        batch: Dict[int, AbstractEmployee] = {employee.id: employee for employee in employees}
+        if len(batch) != len(employees) or not self.__employees_by_id.keys().isdisjoint(batch):
+            seen = set(self.__employees_by_id)
+            for employee in employees:
+                if employee.id in seen:
+                    raise DuplicateIdError(
+                        entity_type="Сотрудник",
+                        entity_id=employee.id
+                    )
+                seen.add(employee.id)
+
+        # Как в add_employee: любой отказ наблюдателя откатывает всю пачку
+        notified = []
+        try:
+            for observer in list(self.__observers):
+                for employee in employees:
+                    observer.on_employee_added(self, employee)
+                    notified.append((observer, employee))
+        except Exception:
+            for observer, employee in reversed(notified):
+                observer.on_employee_removed(self, employee)
+            raise
+
+        first = self.__next_sequence
+        self.__next_sequence += len(employees)
+        self.__employees_by_id.update(batch)
+        self.__employees.extend(employees)
+        self.__sequence.extend(range(first, self.__next_sequence))
+        self.__sequence_by_id.update(zip(batch, range(first, self.__next_sequence)))
+
+        self.__total_salary += sum(employee.calculate_salary() for employee in employees)
+        for employee in employees:
+            employee.add_salary_observer(self)
+
     def remove_employee(self, employee_id: int):
         """Удаляет сотрудника по ID"""
-        for i, emp in enumerate(self.__employees):
-            if emp.id == employee_id:
-                del self.__employees[i]
-                return
-        
-        raise EmployeeNotFoundError(employee_id)
-    
+        employee = self.__employees_by_id.pop(employee_id, None)
+        if employee is None:
+            raise EmployeeNotFoundError(employee_id)
+
+        position = bisect_left(self.__sequence, self.__sequence_by_id.pop(employee_id))
+        del self.__employees[position]
+        del self.__sequence[position]
+
+        employee.remove_salary_observer(self)
+        if self.__employees_by_id:
+            self.__total_salary -= employee.calculate_salary()
+        else:
+            # Пустой отдел: сбрасываем накопленную погрешность
+            self.__total_salary = 0.0
+
+        for observer in self.__observers:
+            observer.on_employee_removed(self, employee)
+
 
     def get_employees(self) -> List[AbstractEmployee]:
         """
@@ -63,18 +172,71 @@ class Department:
         Returns:
             Копию списка сотрудников
         """
-        return self.__employees.copy()
+        return list(self.__employees)
+
+    def iter_employees(self) -> Iterator[AbstractEmployee]:
+        """
+        Итератор по сотрудникам без копирования внутреннего хранилища
+
+        Состав отдела нельзя менять во время обхода.
+
+        Returns:
+            Итератор по сотрудникам в порядке добавления
+        """
+        return iter(self.__employees)
+
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Обновляет сумму зарплат при изменении зарплаты сотрудника отдела"""
+        self.__total_salary += new_salary - old_salary
+
+    def on_employee_id_changed(self, employee, old_id: int, new_id: int) -> None:
+        """
+        Переносит сотрудника отдела на новый ID в индексах отдела и наблюдателей
+
+        DuplicateIdError: Если новый ID уже занят в отделе или у наблюдателя (компании)
+        """
+        if new_id in self.__employees_by_id:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=new_id
+            )
+        notified = []
+        try:
+            for observer in list(self.__observers):
+                observer.on_employee_id_changed(self, employee, old_id, new_id)
+                notified.append(observer)
+        except Exception:
+            for observer in reversed(notified):
+                observer.on_employee_id_changed(self, employee, new_id, old_id)
+            raise
+        self.__employees_by_id[new_id] = self.__employees_by_id.pop(old_id)
+        self.__sequence_by_id[new_id] = self.__sequence_by_id.pop(old_id)
 
     def calculate_total_salary(self) -> float:
         """
-        Вычисляет общую ЗП всех сотрудников
+        Возвращает общую ЗП всех сотрудников
+
+        Сумма поддерживается инкрементально, поэтому вызов стоит O(1).
+
+        Return:
+            Сумма зарплат всех сотрудников
+        """
+        return self.__total_salary
+
+    def recalculate_total_salary(self) -> float:
+        """
+        Пересчитывает сумму зарплат по всем сотрудникам
+
+        Нужен, если зарплата изменилась в обход уведомлений
+        (например, поле изменено напрямую).
 
         Return:
             Сумма зарплат всех сотрудников
         """
         total = 0.0
-        for employee in self.__employees:
+        for employee in self.__employees_by_id.values():
             total += employee.calculate_salary()
+        self.__total_salary = total
         return total
 
     def get_employee_count(self) -> dict[str, int]:
@@ -91,7 +253,7 @@ class Department:
             "Salesperson": 0
         }
 
-        for employee in self.__employees:
+        for employee in self.__employees_by_id.values():
             class_name = employee.__class__.__name__
             if class_name in counts:
                 counts[class_name] += 1
@@ -103,11 +265,14 @@ class Department:
 
     def find_employee_by_id(self, employee_id: int):
         """Ищет сотрудника по ID"""
-        for employee in self.__employees:
-            if employee.id == employee_id:
-                return employee
-        
-        raise EmployeeNotFoundError(employee_id)
+        employee = self.__employees_by_id.get(employee_id)
+        if employee is None:
+            raise EmployeeNotFoundError(employee_id)
+        return employee
+
+    def try_find_employee(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """Ищет сотрудника по ID без исключения: None, если сотрудника нет"""
+        return self.__employees_by_id.get(employee_id)
 
     def to_dict(self) -> dict:
         """Конвертирует отдел в словарь"""
@@ -116,9 +281,29 @@ class Department:
             'employees': [emp.to_dict() for emp in self.__employees]
         }
 
+    @staticmethod
+    def __trusted_rows(records: List[dict]):
+        """
+        (класс, строки) для from_trusted_rows, если все записи - обычные сотрудники
+        одного типа без дополнительных полей; иначе None
+        """
+        types = {record.get('type') for record in records}
+        if len(types) != 1:
+            return None
+        employee_cls = _EMPLOYEE_TYPES.get(types.pop())
+        if employee_cls is None or any(len(record) != len(_ROW_FIELDS) + 1 for record in records):
+            return None
+        try:
+            rows = [tuple(record[field] for field in _ROW_FIELDS) for record in records]
+        except KeyError:
+            return None
+        return employee_cls, rows
+
     def save_to_file(self, filename: str) -> None:
         """
         Сохраняет всех сотрудников отдела в JSON файл.
+        Для отдела из обычных сотрудников добавляется контрольная сумма строк,
+        которая позволяет загрузить файл через load_from_file(trusted=True).
 
         Args:
             filename: Имя файла для сохранения
@@ -127,18 +312,25 @@ class Department:
         """
         try:
             data = self.to_dict()
+            trusted = self.__trusted_rows(data['employees'])
+            if trusted is not None:
+                employee_cls, rows = trusted
+                data['checksum'] = employee_cls.rows_checksum(rows)
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except (IOError, OSError) as e:
             raise IOError(f"Не удалось сохранить файл {filename}: {e}")
 
     @classmethod
-    def load_from_file(cls, filename: str) -> 'Department':
+    def load_from_file(cls, filename: str, trusted: bool = False) -> 'Department':
         """
         Загружает отдел из JSON
 
         Args:
             filename: Имя файла для загрузки
+            trusted: Файл сохранен нами (save_to_file): сотрудники создаются
+                     без валидации полей, строки сверяются с контрольной суммой.
+                     Без контрольной суммы в файле загрузка идет обычным путем
 
         Returns:
             Загруженный отдел
@@ -159,20 +351,103 @@ class Department:
 
         department = cls(data['name'])
 
+        plain = cls.__trusted_rows(data['employees']) if trusted and 'checksum' in data else None
+        if plain is not None:
+            employee_cls, rows = plain
+            # InvalidDataError, если строки не совпадают с контрольной суммой
+            department.add_employees(employee_cls.from_trusted_rows(rows, checksum=data['checksum']))
+            return department
+
         for emp_data in data['employees']:
-            try:
-                employee = EmployeeFactory.from_dict(emp_data)
-                department.add_employee(employee)
-            except (InvalidDataError, DuplicateIdError) as e:
-                print(f"Предупреждение: не удалось загрузить сотрудника: {e}")
-                continue
+            department.__add_employee_from_dict(emp_data)
+
+        return department
+
+    def __add_employee_from_dict(self, emp_data: dict) -> None:
+        """Создает сотрудника из словаря и добавляет его, пропуская некорректные записи"""
+        try:
+            # Записи без 'type' - из старых файлов, это обычные Employee
+            employee_cls = _EMPLOYEE_TYPES.get(emp_data.get('type', 'Employee'))
+            if employee_cls is None:
+                raise InvalidDataError(
+                    field="тип сотрудника",
+                    value=emp_data.get('type'),
+                    expected=", ".join(_EMPLOYEE_TYPES)
+                )
+            self.add_employee(employee_cls.from_dict(emp_data))
+        except (InvalidDataError, DuplicateIdError) as e:
+            print(f"Предупреждение: не удалось загрузить сотрудника: {e}")
+
+    def __iter_jsonl_lines(self) -> Iterator[str]:
+        """Генерирует строки JSON Lines: заголовок отдела, затем по строке на сотрудника"""
+        yield json.dumps({'name': self.__name}, ensure_ascii=False) + "\n"
+        for employee in self.__employees:
+            yield json.dumps(employee.to_dict(), ensure_ascii=False) + "\n"
+
+    def save_to_jsonl(self, filename: str) -> None:
+        """
+        Потоково сохраняет отдел в формате JSON Lines.
+
+        Первая строка содержит {"name": ...}, каждая следующая - одного сотрудника.
+        Дерево to_dict() целиком не строится, поэтому расход памяти не зависит
+        от размера отдела.
+
+        Args:
+            filename: Имя файла для сохранения
+
+        Error: Если не удалось сохранить файл
+        """
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.writelines(self.__iter_jsonl_lines())
+        except (IOError, OSError) as e:
+            raise IOError(f"Не удалось сохранить файл {filename}: {e}")
+
+    @classmethod
+    def load_from_jsonl(cls, filename: str) -> 'Department':
+        """
+        Потоково загружает отдел из файла JSON Lines (см. save_to_jsonl).
+
+        Файл читается построчно, сотрудники добавляются по одному.
+
+        Args:
+            filename: Имя файла для загрузки
+
+        Returns:
+            Загруженный отдел
+
+        Error: Если не удалось прочитать файл или строка не является JSON
+        ValueError: Если в заголовке нет названия отдела
+        """
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or 'null')
+                if not isinstance(header, dict) or 'name' not in header:
+                    raise InvalidDataError(
+                        field="заголовок файла",
+                        value=header,
+                        expected="объект с полем 'name' в первой строке"
+                    )
+
+                department = cls(header['name'])
+
+                for line_number, line in enumerate(f, start=2):
+                    if not line.strip():
+                        continue
+                    try:
+                        emp_data = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise IOError(f"Строка {line_number}: {e}")
+                    department.__add_employee_from_dict(emp_data)
+        except (IOError, OSError, json.JSONDecodeError) as e:
+            raise IOError(f"Не удалось загрузить файл {filename}: {e}")
 
         return department
 
     # Перегрузка операторов
     def __len__(self) -> int:
         """Возвращает количество сотрудников в отделе"""
-        return len(self.__employees)
+        return len(self.__employees_by_id)
 
     def __getitem__(self, key) -> AbstractEmployee:
         """
@@ -187,14 +462,15 @@ class Department:
         IndError: Если индекс вне диапазона
         TypeError: Если ключ не int или slice
         """
+        employees = self.__employees
         if isinstance(key, int):
             if key < 0:
-                key = len(self.__employees) + key
-            if 0 <= key < len(self.__employees):
-                return self.__employees[key]
-            raise IndexError(f"Индекс {key} вне диапазона [0, {len(self.__employees) - 1}]")
+                key = len(employees) + key
+            if 0 <= key < len(employees):
+                return employees[key]
+            raise IndexError(f"Индекс {key} вне диапазона [0, {len(employees) - 1}]")
         elif isinstance(key, slice):
-            return self.__employees[key]
+            return employees[key]
         else:
             raise TypeError(f"Индекс должен быть int или slice, а не {type(key).__name__}")
 
@@ -211,10 +487,7 @@ class Department:
         if not isinstance(employee, AbstractEmployee):
             return False
 
-        for emp in self.__employees:
-            if emp == employee:
-                return True
-        return False
+        return employee.id in self.__employees_by_id
 
     def __str__(self) -> str:
         """Строковое представление отдела"""
@@ -226,7 +499,7 @@ class Department:
 
     def __repr__(self) -> str:
         """Официальное строковое представление"""
-        return f"Department(name='{self.__name}', employees={len(self.__employees)})"
+        return f"Department(name='{self.__name}', employees={len(self.__employees_by_id)})"
 
     # связи
     def has_employees(self) -> bool:
@@ -236,7 +509,7 @@ class Department:
         Returns:
             True если есть сотрудники, иначе False
         """
-        return len(self.__employees) > 0
+        return len(self.__employees_by_id) > 0
 
     def get_employee_ids(self) -> List[int]:
         """
@@ -245,4 +518,4 @@ class Department:
         Returns:
             Список ID сотрудников
         """
-        return [emp.id for emp in self.__employees]
+        return [employee.id for employee in self.__employees]
@@ -1,7 +1,14 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
+from .exceptions import (
+    EmployeeNotFoundError,
+    DuplicateIdError,
+    InvalidDataError,
+    InvalidStatusError
+)
 
 
 class Project:
@@ -31,7 +38,10 @@ class Project:
         self.__description = description
         self.__deadline = deadline
         self.__status = status
-        self.__team: List[AbstractEmployee] = []
+        # Команда: ID сотрудника -> сотрудник (словарь сохраняет порядок добавления)
+        self.__team: Dict[int, AbstractEmployee] = {}
+        # Наблюдатели за составом команды (например, компания с обратным индексом)
+        self.__observers: List[Any] = []
 
     def __validate_project_id(self, value):
         if not isinstance(value, int) or value <= 0:
@@ -78,6 +88,22 @@ class Project:
         """Возвращает статус"""
         return self.__status
 
+    def add_observer(self, observer) -> None:
+        """
+        Подписывает наблюдателя на изменения команды проекта
+
+        Args:
+            observer: Объект с методами on_team_member_added(project, employee),
+                      on_team_member_removed(project, employee),
+                      on_team_member_id_changed(project, employee, old_id, new_id)
+                      и on_project_status_changed(project, old_status)
+        """
+        self.__observers.append(observer)
+
+    def remove_observer(self, observer) -> None:
+        """Отписывает наблюдателя от изменений команды проекта"""
+        self.__observers.remove(observer)
+
     def add_team_member(self, employee: AbstractEmployee) -> None:
         """
         Добавляет сотрудника
@@ -94,11 +120,36 @@ class Project:
             raise InvalidStatusError(f"Нельзя добавить сотрудника в проект со статусом '{self.__status}'")
 
         # Проверка если ли уже сотрудник
-        for team_member in self.__team:
-            if team_member.id == employee.id:
-                raise DuplicateIdError(f"Сотрудник с ID {employee.id} уже в проекте")
+        if employee.id in self.__team:
+            raise DuplicateIdError(f"Сотрудник с ID {employee.id} уже в проекте")
+
+        for observer in self.__observers:
+            observer.on_team_member_added(self, employee)
+
+        self.__team[employee.id] = employee
+        employee.add_salary_observer(self)
 
-        self.__team.append(employee)
+    def on_employee_id_changed(self, employee, old_id: int, new_id: int) -> None:
+        """
+        Переносит участника команды на новый ID (порядок команды сохраняется)
+
+        DuplicateIdError: Если новый ID уже есть в команде
+        """
+        if new_id in self.__team:
+            raise DuplicateIdError(f"Сотрудник с ID {new_id} уже в проекте")
+        notified = []
+        try:
+            for observer in list(self.__observers):
+                observer.on_team_member_id_changed(self, employee, old_id, new_id)
+                notified.append(observer)
+        except Exception:
+            for observer in reversed(notified):
+                observer.on_team_member_id_changed(self, employee, new_id, old_id)
+            raise
+        self.__team = {
+            new_id if member_id == old_id else member_id: member
+            for member_id, member in self.__team.items()
+        }
 
     def remove_team_member(self, employee_id: int) -> None:
         """
@@ -112,18 +163,27 @@ class Project:
         if not isinstance(employee_id, int) or employee_id <= 0:
             raise InvalidDataError("ID должен быть положительным целым числом")
 
-        for i, team_member in enumerate(self.__team):
-            if team_member.id == employee_id:
-                del self.__team[i]
-                return
+        employee = self.__team.pop(employee_id, None)
+        if employee is None:
+            raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в проекте")
 
-        raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в проекте")
+        employee.remove_salary_observer(self)
+        for observer in self.__observers:
+            observer.on_team_member_removed(self, employee)
 
     def get_team(self) -> List[AbstractEmployee]:
         """
         Возвращает список команды
         """
-        return self.__team.copy()
+        return list(self.__team.values())
+
+    def iter_team(self) -> Iterator[AbstractEmployee]:
+        """
+        Итератор по команде без копирования
+
+        Состав команды нельзя менять во время обхода.
+        """
+        return iter(self.__team.values())
 
     def get_team_size(self) -> int:
         """
@@ -142,7 +202,7 @@ class Project:
             Сумма зарплат
         """
         total = 0.0
-        for employee in self.__team:
+        for employee in self.__team.values():
             total += employee.calculate_salary()
         return total
 
@@ -172,8 +232,13 @@ class Project:
         if new_status not in self.VALID_STATUSES:
             raise InvalidStatusError(f"Статус должен быть одним из: {self.VALID_STATUSES}")
 
+        old_status = self.__status
         self.__status = new_status
 
+        if old_status != new_status:
+            for observer in self.__observers:
+                observer.on_project_status_changed(self, old_status)
+
     def __str__(self) -> str:
         """Строковое представление проекта"""
         return f"Проект: {self.__name} (Статус: {self.__status}, Команда: {len(self.__team)} чел.)"
@@ -187,10 +252,7 @@ class Project:
         if not isinstance(employee, AbstractEmployee):
             return False
 
-        for team_member in self.__team:
-            if team_member == employee:
-                return True
-        return False
+        return employee.id in self.__team
 
     # проверка команды
     def has_team(self) -> bool:
@@ -209,4 +271,4 @@ class Project:
         Returns:
             Список ID сотрудников
         """
-        return [emp.id for emp in self.__team]
+        return list(self.__team)
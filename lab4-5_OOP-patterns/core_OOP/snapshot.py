@@ -0,0 +1,464 @@
+"""
+Компактный бинарный снимок компании (отделы, сотрудники, проекты, команды).
+
+Формат (little-endian):
+    заголовок:   b"CSNP", версия u16
+    строки:      u32 количество, затем для каждой u32 длина + UTF-8 байты
+    тело:        ссылки на строки - u32 индекс в таблице строк
+    отдел:       имя, u32 число серий; серия - u8 вид, u32 число сотрудников
+    серия строк: u32 тип, u32 контрольная сумма rows_checksum(), затем колонки
+                 i64 id, u32 имя, u32 отдел, u8 тег зарплаты (int или float)
+                 и 8 байт зарплаты (i64 или f64 по тегу)
+    сотрудник:   u32 тип, i64 id, u32 имя, u32 отдел, базовая зарплата
+                 значением с тегом (int или float), u16 число доп. полей
+
+Каждая строка (имена, отделы, типы, ключи полей) хранится один раз,
+поэтому повторяющиеся названия отделов и типов почти не занимают места.
+Подряд идущие обычные сотрудники одного класса пишутся серией строк
+и загружаются через from_trusted_rows без повторной валидации полей;
+остальные (с дополнительными полями) - записями через from_dict.
+"""
+
+import struct
+import sys
+from array import array
+from itertools import groupby
+from datetime import datetime
+from typing import Any, Dict, List
+
+from . import Employee as employee_module
+from .Abctract_emp import AbstractEmployee
+from .Department import Department
+from .Project import Project
+from .exceptions import InvalidDataError
+
+MAGIC = b"CSNP"
+VERSION = 1
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_EMPLOYEE = struct.Struct("<IqII")  # тип, id, имя, отдел; зарплата - значение с тегом
+_RUN = struct.Struct("<BI")  # вид серии, число сотрудников
+_ROWS = struct.Struct("<II")  # тип, контрольная сумма строк
+
+# Теги значений дополнительных полей сотрудника
+_TAG_NONE, _TAG_FALSE, _TAG_TRUE, _TAG_INT, _TAG_FLOAT, _TAG_STR, _TAG_LIST, _TAG_DICT = range(8)
+
+# Участник команды: ссылка на сотрудника компании или запись сотрудника целиком
+_MEMBER_REF, _MEMBER_INLINE = 0, 1
+
+# Серия сотрудников отдела: колонки строк или записи по одной
+_RUN_ROWS, _RUN_RECORDS = 0, 1
+
+_BASE_FIELDS = ('type', 'id', 'name', 'department', 'base_salary')
+
+# Классы, чьи экземпляры целиком описываются строкой get_all()
+_ROW_CLASSES = (employee_module.CompactEmployee, employee_module.Employee)
+
+
+def _row_class(employee: AbstractEmployee):
+    """Класс для серии строк или None, если сотрудника нужно писать записью"""
+    cls = type(employee)
+    if cls in _ROW_CLASSES and type(employee.base_salary) in (int, float):
+        return cls
+    return None
+
+
+def _column(typecode: str, values) -> bytes:
+    """Колонка значений одного типа в little-endian"""
+    column = array(typecode, values)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column.tobytes()
+
+
+def _salary_column(salaries) -> bytes:
+    """Зарплаты по 8 байт: i64 для int и f64 для float"""
+    kinds = {type(salary) for salary in salaries}
+    if kinds == {int}:
+        return _column('q', salaries)
+    if kinds == {float}:
+        return _column('d', salaries)
+    return b"".join(
+        _I64.pack(salary) if type(salary) is int else _F64.pack(salary)
+        for salary in salaries
+    )
+
+
+class _SnapshotWriter:
+    """Кодирует записи в буфер, собирая таблицу строк"""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.buffer = bytearray()
+
+    def string(self, value: str) -> None:
+        self.buffer += _U32.pack(self.string_index(value))
+
+    def string_index(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def u8(self, value: int) -> None:
+        self.buffer += _U8.pack(value)
+
+    def u32(self, value: int) -> None:
+        self.buffer += _U32.pack(value)
+
+    def i64(self, value: int) -> None:
+        try:
+            self.buffer += _I64.pack(value)
+        except struct.error:
+            raise InvalidDataError(field="целое в снимке", value=value, expected="64-битное целое")
+
+    def value(self, value: Any) -> None:
+        """Записывает значение с тегом типа (аналог msgpack)"""
+        if value is None:
+            self.u8(_TAG_NONE)
+        elif value is True:
+            self.u8(_TAG_TRUE)
+        elif value is False:
+            self.u8(_TAG_FALSE)
+        elif isinstance(value, int):
+            self.u8(_TAG_INT)
+            self.i64(value)
+        elif isinstance(value, float):
+            self.u8(_TAG_FLOAT)
+            self.buffer += _F64.pack(value)
+        elif isinstance(value, str):
+            self.u8(_TAG_STR)
+            self.string(value)
+        elif isinstance(value, (list, tuple)):
+            self.u8(_TAG_LIST)
+            self.u32(len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            self.u8(_TAG_DICT)
+            self.u32(len(value))
+            for key, item in value.items():
+                self.string(str(key))
+                self.value(item)
+        else:
+            raise InvalidDataError(
+                field="значение в снимке",
+                value=repr(value),
+                expected="None, bool, int, float, str, list или dict"
+            )
+
+    def employee(self, employee: AbstractEmployee) -> None:
+        data = employee.to_dict()
+        try:
+            self.buffer += _EMPLOYEE.pack(
+                self.string_index(data['type']),
+                data['id'],
+                self.string_index(data['name']),
+                self.string_index(data['department'])
+            )
+        except struct.error:
+            raise InvalidDataError(field="ID сотрудника", value=data['id'], expected="64-битное целое")
+        self.value(data['base_salary'])
+        extras = [(key, value) for key, value in data.items() if key not in _BASE_FIELDS]
+        self.buffer += _U16.pack(len(extras))
+        for key, value in extras:
+            self.string(key)
+            self.value(value)
+
+    def employee_rows(self, employee_cls, employees: List[AbstractEmployee]) -> None:
+        rows = [employee.get_all() for employee in employees]
+        ids, names, departments, salaries = zip(*rows)
+        self.buffer += _ROWS.pack(self.string_index(employee_cls.__name__), employee_cls.rows_checksum(rows))
+        try:
+            id_column = _column('q', ids)
+            salary_column = _salary_column(salaries)
+        except (OverflowError, struct.error) as e:
+            raise InvalidDataError(field="строки сотрудников", value=str(e), expected="64-битные значения")
+        self.buffer += id_column
+        self.buffer += _column('I', map(self.string_index, names))
+        self.buffer += _column('I', map(self.string_index, departments))
+        self.buffer += bytes(_TAG_INT if type(salary) is int else _TAG_FLOAT for salary in salaries)
+        self.buffer += salary_column
+
+    def to_bytes(self) -> bytes:
+        header = bytearray(MAGIC)
+        header += _U16.pack(VERSION)
+        header += _U32.pack(len(self.strings))
+        for value in self.strings:  # словарь хранит порядок индексов
+            encoded = value.encode('utf-8')
+            header += _U32.pack(len(encoded))
+            header += encoded
+        return bytes(header + self.buffer)
+
+
+def _corrupted(reason: str) -> InvalidDataError:
+    return InvalidDataError(field="снимок", value=reason, expected="целый снимок CSNP")
+
+
+class _SnapshotReader:
+    """Последовательно декодирует снимок из буфера
+
+    Обрезанные и испорченные данные дают InvalidDataError, а не struct.error/IndexError.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+        if bytes(self.data[:4]) != MAGIC:
+            raise InvalidDataError(field="снимок", value="неизвестный формат", expected="заголовок CSNP")
+        self.offset = 4
+        version = self.unpack(_U16)
+        if version != VERSION:
+            raise InvalidDataError(field="версия снимка", value=version, expected=str(VERSION))
+
+        count = self.unpack(_U32)
+        strings: List[str] = []
+        for _ in range(count):
+            length = self.unpack(_U32)
+            end = self.offset + length
+            if end > len(self.data):
+                raise _corrupted("строка за концом данных")
+            try:
+                strings.append(str(self.data[self.offset:end], 'utf-8'))
+            except UnicodeDecodeError:
+                raise _corrupted("строка не в UTF-8")
+            self.offset = end
+        self.strings = strings
+
+    def unpack(self, packer: struct.Struct):
+        return self.unpack_all(packer)[0]
+
+    def unpack_all(self, packer: struct.Struct) -> tuple:
+        try:
+            values = packer.unpack_from(self.data, self.offset)
+        except struct.error:
+            raise _corrupted("данные обрываются")
+        self.offset += packer.size
+        return values
+
+    def take(self, size: int) -> memoryview:
+        end = self.offset + size
+        if end > len(self.data):
+            raise _corrupted("данные обрываются")
+        chunk = self.data[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def column(self, typecode: str, count: int) -> array:
+        return self.column_of(typecode, self.take(array(typecode).itemsize * count))
+
+    def string(self) -> str:
+        return self.string_at(self.unpack(_U32))
+
+    def strings_column(self, count: int) -> List[str]:
+        strings = self.strings
+        try:
+            return [strings[index] for index in self.column('I', count)]
+        except IndexError:
+            raise _corrupted("ссылка на строку вне таблицы")
+
+    def string_at(self, index: int) -> str:
+        try:
+            return self.strings[index]
+        except IndexError:
+            raise _corrupted(f"ссылка на строку {index} вне таблицы")
+
+    def datetime(self) -> datetime:
+        try:
+            return datetime.fromisoformat(self.string())
+        except ValueError:
+            raise _corrupted("дата не в формате ISO")
+
+    def value(self) -> Any:
+        tag = self.unpack(_U8)
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_INT:
+            return self.unpack(_I64)
+        if tag == _TAG_FLOAT:
+            return self.unpack(_F64)
+        if tag == _TAG_STR:
+            return self.string()
+        if tag == _TAG_LIST:
+            return [self.value() for _ in range(self.unpack(_U32))]
+        if tag == _TAG_DICT:
+            return {self.string(): self.value() for _ in range(self.unpack(_U32))}
+        raise InvalidDataError(field="тег значения", value=tag, expected="известный тег снимка")
+
+    def employee(self) -> AbstractEmployee:
+        type_idx, emp_id, name_idx, dept_idx = self.unpack_all(_EMPLOYEE)
+        base_salary = self.value()
+        data = {
+            'type': self.string_at(type_idx),
+            'id': emp_id,
+            'name': self.string_at(name_idx),
+            'department': self.string_at(dept_idx),
+            'base_salary': base_salary
+        }
+        for _ in range(self.unpack(_U16)):
+            key = self.string()
+            data[key] = self.value()
+        return _employee_class(data['type']).from_dict(data)
+
+    def employee_rows(self, count: int) -> List[AbstractEmployee]:
+        type_idx, checksum = self.unpack_all(_ROWS)
+        employee_cls = _employee_class(self.string_at(type_idx))
+        if employee_cls not in _ROW_CLASSES:
+            raise _corrupted(f"серия строк класса {employee_cls.__name__}")
+        ids = self.column('q', count)
+        names = self.strings_column(count)
+        departments = self.strings_column(count)
+        tags = bytes(self.take(count))
+        raw_salaries = self.take(8 * count)
+
+        if tags.count(_TAG_INT) == count:
+            salaries = self.column_of('q', raw_salaries)
+        elif tags.count(_TAG_FLOAT) == count:
+            salaries = self.column_of('d', raw_salaries)
+        elif tags.count(_TAG_INT) + tags.count(_TAG_FLOAT) == count:
+            ints = self.column_of('q', raw_salaries)
+            floats = self.column_of('d', raw_salaries)
+            salaries = [
+                ints[i] if tag == _TAG_INT else floats[i]
+                for i, tag in enumerate(tags)
+            ]
+        else:
+            raise _corrupted("неизвестный тег зарплаты")
+
+        # InvalidDataError, если строки не совпадают с контрольной суммой
+        return employee_cls.from_trusted_rows(
+            list(zip(ids, names, departments, salaries)),
+            checksum
+        )
+
+    @staticmethod
+    def column_of(typecode: str, raw: memoryview) -> array:
+        column = array(typecode)
+        column.frombytes(raw)
+        if sys.byteorder == 'big':
+            column.byteswap()
+        return column
+
+
+def _employee_class(type_name: str):
+    """Находит класс сотрудника по имени типа из to_dict()"""
+    cls = getattr(employee_module, type_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, AbstractEmployee)):
+        raise InvalidDataError(
+            field="тип сотрудника",
+            value=type_name,
+            expected="класс из модуля Employee"
+        )
+    return cls
+
+
+def dump_company(company) -> bytes:
+    """
+    Кодирует компанию в бинарный снимок
+
+    Args:
+        company: Компания для сохранения
+
+    Returns:
+        Байты снимка
+    """
+    writer = _SnapshotWriter()
+    writer.string(company.name)
+
+    departments = list(company.iter_departments())
+    writer.u32(len(departments))
+    for department in departments:
+        writer.string(department.name)
+        runs = [(cls, list(run)) for cls, run in groupby(department.iter_employees(), key=_row_class)]
+        writer.u32(len(runs))
+        for employee_cls, employees in runs:
+            if employee_cls is None:
+                writer.buffer += _RUN.pack(_RUN_RECORDS, len(employees))
+                for employee in employees:
+                    writer.employee(employee)
+            else:
+                writer.buffer += _RUN.pack(_RUN_ROWS, len(employees))
+                writer.employee_rows(employee_cls, employees)
+
+    projects = list(company.iter_projects())
+    writer.u32(len(projects))
+    for project in projects:
+        writer.i64(project.project_id)
+        writer.string(project.name)
+        writer.string(project.description)
+        writer.string(project.deadline.isoformat())
+        writer.string(project.status)
+        writer.u32(project.get_team_size())
+        for member in project.iter_team():
+            if company.find_employee_by_id(member.id) is member:
+                writer.u8(_MEMBER_REF)
+                writer.i64(member.id)
+            else:
+                # Участник проекта не числится ни в одном отделе компании
+                writer.u8(_MEMBER_INLINE)
+                writer.employee(member)
+
+    return writer.to_bytes()
+
+
+def load_company(data: bytes, company_cls):
+    """
+    Восстанавливает компанию из бинарного снимка
+
+    Args:
+        data: Байты снимка
+        company_cls: Класс компании для создания
+
+    Returns:
+        Восстановленная компания
+    """
+    reader = _SnapshotReader(data)
+    company = company_cls(reader.string())
+
+    for _ in range(reader.unpack(_U32)):
+        department = Department(reader.string())
+        employees: List[AbstractEmployee] = []
+        for _ in range(reader.unpack(_U32)):
+            kind, count = reader.unpack_all(_RUN)
+            if kind == _RUN_ROWS:
+                employees += reader.employee_rows(count)
+            elif kind == _RUN_RECORDS:
+                employees += [reader.employee() for _ in range(count)]
+            else:
+                raise _corrupted(f"неизвестный вид серии {kind}")
+        department.add_employees(employees)
+        company.add_department(department)
+
+    for _ in range(reader.unpack(_U32)):
+        project_id = reader.unpack(_I64)
+        name = reader.string()
+        description = reader.string()
+        deadline = reader.datetime()
+        status = reader.string()
+        # Команду набираем в статусе planning: в завершенный проект добавлять нельзя
+        project = Project(project_id, name, description, deadline)
+        for _ in range(reader.unpack(_U32)):
+            if reader.unpack(_U8) == _MEMBER_REF:
+                member_id = reader.unpack(_I64)
+                member = company.find_employee_by_id(member_id)
+                if member is None:
+                    raise InvalidDataError(
+                        field="участник проекта",
+                        value=member_id,
+                        expected="сотрудник одного из отделов"
+                    )
+            else:
+                member = reader.employee()
+            project.add_team_member(member)
+        project.change_status(status)
+        company.add_project(project)
+
+    return company
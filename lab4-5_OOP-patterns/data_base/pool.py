@@ -0,0 +1,148 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from core_OOP.exceptions import DatabaseError, InvalidDataError
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class ConnectionPool:
+    """
+    Пул подключений SQLite.
+
+    Каждый поток берет свое подключение на время работы и возвращает его в пул,
+    поэтому потоки не делят один sqlite3.Connection. В режиме WAL читатели
+    (отчеты) не блокируют писателя (расчет зарплаты) и наоборот.
+    Пул рассчитан на файловую БД: у каждого подключения к ":memory:" своя база.
+    """
+
+    def __init__(self, db_path: str = "company.db", size: int = 5,
+                 journal_mode: str = "WAL", synchronous: str = "NORMAL",
+                 cache_size: int = -2000, busy_timeout: float = 5.0,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None):
+        """
+        Args:
+            db_path: Путь к файлу БД
+            size: Максимальное число подключений
+            journal_mode: PRAGMA journal_mode (WAL - читатели не блокируют писателя)
+            synchronous: PRAGMA synchronous (NORMAL достаточно для WAL)
+            cache_size: PRAGMA cache_size (отрицательное значение - размер в КиБ)
+            busy_timeout: Сколько секунд ждать блокировку БД и свободное подключение
+            on_connect: Вызывается для каждого нового подключения (например, создание таблиц)
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise InvalidDataError(field="size", value=size, expected="положительное целое число")
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise InvalidDataError(field="journal_mode", value=journal_mode, expected=", ".join(JOURNAL_MODES))
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise InvalidDataError(field="synchronous", value=synchronous, expected=", ".join(SYNCHRONOUS_MODES))
+        if not isinstance(cache_size, int):
+            raise InvalidDataError(field="cache_size", value=cache_size, expected="целое число")
+
+        self.db_path = db_path
+        self.size = size
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size = cache_size
+        self.busy_timeout = busy_timeout
+        self._on_connect = on_connect
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Создает подключение и применяет настройки"""
+        # Подключение переходит между потоками только через пул, по одному владельцу за раз
+        connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        connection.execute(f"PRAGMA synchronous={self.synchronous}")
+        connection.execute(f"PRAGMA cache_size={self.cache_size}")
+        if self._on_connect is not None:
+            self._on_connect(connection)
+        return connection
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Выдает подключение текущему потоку.
+        Повторный вызов в том же потоке возвращает то же подключение.
+        """
+        held = getattr(self._local, "connection", None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+        if self._closed:
+            raise DatabaseError("Пул подключений закрыт")
+
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = None
+            with self._lock:
+                if len(self._all) < self.size:
+                    connection = self._connect()
+                    self._all.append(connection)
+            if connection is None:
+                try:
+                    connection = self._idle.get(timeout=self.busy_timeout)
+                except queue.Empty:
+                    raise DatabaseError(f"Нет свободных подключений в пуле (размер {self.size})")
+
+        self._local.connection = connection
+        self._local.depth = 1
+        return connection
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Возвращает подключение текущего потока в пул"""
+        if getattr(self._local, "connection", None) is not connection:
+            raise DatabaseError("Подключение не выдано текущему потоку")
+        self._local.depth -= 1
+        if self._local.depth:
+            return
+        self._local.connection = None
+        if connection.in_transaction:
+            connection.rollback()
+        if self._closed:
+            connection.close()
+        else:
+            self._idle.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Подключение на время блока with.
+
+        Пример:
+            with pool.connection() as conn:
+                conn.execute("SELECT ...")
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Подключение с транзакцией: commit при успехе, rollback при ошибке"""
+        with self.connection() as connection:
+            with connection:
+                yield connection
+
+    def close(self) -> None:
+        """Закрывает свободные подключения; занятые закроются при возврате"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,75 @@
+"""
+Часть 7: Тестирование подключения к базе данных (пул и миграции схемы)
+"""
+import pytest
+from singleton import DatabaseConnection
+
+
+class TestDatabaseConnectionPool:
+    """Тесты режима пула DatabaseConnection"""
+    
+    def test_singleton_pool_connection_per_thread(self, tmp_path):
+        """Проверка что в режиме пула у каждого потока свое подключение"""
+        import threading
+        
+        db = DatabaseConnection.get_instance()
+        db.enable_pool(str(tmp_path / "pool.db"), size=2)
+        try:
+            seen = []
+            
+            def worker():
+                with db.connection() as conn:
+                    seen.append(conn)
+                    barrier.wait()
+            
+            barrier = threading.Barrier(2)
+            threads = [threading.Thread(target=worker) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            assert seen[0] is not seen[1]
+            with db.connection() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            db.reset_instance()
+
+
+class TestDatabaseMigrations:
+    """Тесты миграций схемы при подключении"""
+    
+    def test_singleton_migrates_schema(self, tmp_path):
+        """Проверка что общее подключение и пул получают индексы через миграции"""
+        from core_OOP.migrations import SCHEMA_VERSION, uses_index
+        
+        db = DatabaseConnection.get_instance()
+        try:
+            conn = db.get_connection(str(tmp_path / "single.db"))
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            db.close_connection()
+            
+            db.enable_pool(str(tmp_path / "pool.db"), size=1)
+            with db.connection() as conn:
+                assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+                assert uses_index(conn, "SELECT * FROM employees WHERE department = ?", ("IT",),
+                                  index_name="idx_employees_department_salary")
+        finally:
+            db.reset_instance()
+    
+    def test_failed_migration_step_rolls_back(self):
+        """Проверка что шаг миграции с ошибкой откатывается целиком"""
+        import sqlite3
+        from core_OOP.exceptions import DatabaseError
+        from core_OOP.migrations import migrate
+        
+        conn = sqlite3.connect(":memory:")
+        # Старая таблица без employee_type: второй индекс шага 2 не создается
+        conn.execute("CREATE TABLE employees (id INTEGER PRIMARY KEY, department TEXT, base_salary REAL)")
+        conn.commit()
+        
+        with pytest.raises(DatabaseError):
+            migrate(conn)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'idx_%'").fetchall() == []
+        assert not conn.in_transaction
@@ -2,7 +2,7 @@
 Часть 1: Тестирование инкапсуляции и базового класса Employee
 """
 import pytest
-from Employee import Employee
+from Employee import Employee, CompactEmployee
 from Abctract_emp import AbstractEmployee
 from exceptions import InvalidDataError, FinancialValidationError, DuplicateIdError
 
@@ -477,3 +477,48 @@ class TestEmployeeIsAbstractEmployee:
         assert callable(emp.calculate_salary)
         assert callable(emp.get_info)
         assert callable(emp.to_dict)
+
+
+class TestCompactEmployee:
+    """Тесты сотрудника со __slots__"""
+    
+    def test_compact_employee_has_no_dict(self):
+        """Компактный сотрудник не создает __dict__"""
+        emp = CompactEmployee(1, "Alice", "IT", 5000)
+        assert not hasattr(emp, '__dict__')
+        with pytest.raises(AttributeError):
+            emp.nickname = "Ali"
+        # Классы параллельны: обычный сотрудник не является компактным
+        assert not isinstance(Employee(2, "Bob", "IT", 5000), CompactEmployee)
+    
+    def test_compact_employee_keeps_contracts(self):
+        """Валидация и to_dict/from_dict работают как у Employee"""
+        with pytest.raises(FinancialValidationError):
+            CompactEmployee(1, "Alice", "IT", -1)
+        emp = CompactEmployee(1, "Alice", "IT", 5000)
+        emp.base_salary = 6000
+        restored = CompactEmployee.from_dict(emp.to_dict())
+        assert restored.to_dict() == emp.to_dict()
+        assert restored.calculate_salary() == 6000
+
+
+class TestTrustedRows:
+    """Тесты доверенной загрузки сотрудников"""
+    
+    def test_from_trusted_rows_roundtrip(self):
+        """Строки get_all() с контрольной суммой восстанавливают сотрудников"""
+        employees = [Employee(1, "Alice", "IT", 5000), Employee(2, "Bob", "HR", 4500.5)]
+        rows = [emp.get_all() for emp in employees]
+        
+        restored = Employee.from_trusted_rows(rows, checksum=Employee.rows_checksum(rows))
+        
+        assert [emp.get_all() for emp in restored] == rows
+        assert all(type(emp) is Employee for emp in restored)
+    
+    def test_from_trusted_rows_rejects_wrong_checksum(self):
+        """Измененные строки не проходят проверку контрольной суммы"""
+        rows = [(1, "Alice", "IT", 5000)]
+        checksum = Employee.rows_checksum(rows)
+        
+        with pytest.raises(InvalidDataError):
+            Employee.from_trusted_rows([(1, "Alice", "IT", -5000)], checksum=checksum)
@@ -0,0 +1,289 @@
+"""
+Часть 6: Тестирование индексов, хранения и загрузки данных
+(используются только классы, которые есть в core_OOP)
+"""
+import pytest
+from datetime import datetime, timedelta
+from Employee import Employee, CompactEmployee
+from Department import Department
+from Project import Project
+from Company import Company
+from exceptions import DuplicateIdError, EmployeeNotFoundError, InvalidDataError
+
+
+class TestDepartmentIndexes:
+    """Тесты индексов отдела"""
+    
+    def test_department_getitem_after_remove(self):
+        """Проверка порядка сотрудников после удаления из середины"""
+        dept = Department("IT")
+        for i in range(1, 5):
+            dept.add_employee(Employee(i, f"Emp{i}", "IT", 5000))
+        
+        dept.remove_employee(2)
+        
+        assert [emp.id for emp in dept] == [1, 3, 4]
+        assert dept[1].id == 3
+        assert dept[-1].id == 4
+        assert [emp.id for emp in dept[0:2]] == [1, 3]
+        
+        dept.add_employee(Employee(5, "Emp5", "IT", 5000))
+        dept.remove_employee(1)
+        dept.remove_employee(5)
+        assert [emp.id for emp in dept] == [3, 4]
+        assert dept[0].id == 3
+    
+    def test_department_add_employees_is_atomic(self):
+        """Проверка что пачка с повтором ID не добавляется целиком"""
+        company = Company("TechCorp")
+        dept = Department("IT")
+        company.add_department(dept)
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        
+        with pytest.raises(DuplicateIdError):
+            dept.add_employees([Employee(2, "Bob", "IT", 6000), Employee(1, "Eve", "IT", 4000)])
+        assert dept.get_employee_ids() == [1]
+        assert company.try_find_employee(2) is None
+        
+        dept.add_employees([Employee(2, "Bob", "IT", 6000), Employee(3, "Eve", "IT", 4000)])
+        assert dept.get_employee_ids() == [1, 2, 3]
+        assert company.find_employee_by_id(3) is dept[2]
+        assert dept.calculate_total_salary() == 15000
+    
+    def test_employee_id_change_rekeys_owners(self):
+        """Проверка что смена ID переносит сотрудника в индексах отдела, компании и проекта"""
+        company = Company("TechCorp")
+        it = Department("IT")
+        hr = Department("HR")
+        company.add_department(it)
+        company.add_department(hr)
+        alice = Employee(1, "Alice", "IT", 5000)
+        it.add_employee(alice)
+        it.add_employee(Employee(2, "Bob", "IT", 5000))
+        hr.add_employee(Employee(3, "Carol", "HR", 5000))
+        project = Project(1, "Site", "Описание", datetime.now() + timedelta(days=30))
+        company.add_project(project)
+        project.add_team_member(alice)
+        
+        alice.id = 10
+        assert it.find_employee_by_id(10) is alice
+        assert it.try_find_employee(1) is None
+        assert company.find_employee_by_id(10) is alice
+        assert company.try_find_employee(1) is None
+        assert project.get_team_member_ids() == [10]
+        assert company.get_employee_projects(10) == [project]
+        assert company.get_employee_projects(1) == []
+        assert [emp.id for emp in it] == [10, 2]
+        
+        # ID занят в этом же отделе или в другом отделе компании - смена отклоняется
+        for taken in (2, 3):
+            with pytest.raises(DuplicateIdError):
+                alice.id = taken
+            assert alice.id == 10
+            assert it.find_employee_by_id(10) is alice
+            assert company.find_employee_by_id(10) is alice
+            assert project.get_team_member_ids() == [10]
+        
+        it.remove_employee(10)
+        project.remove_team_member(10)
+        alice.id = 2  # сотрудник больше никому не принадлежит
+        assert it.find_employee_by_id(2).name == "Bob"
+
+
+class TestCompanyEmployeeIndex:
+    """Тесты глобального индекса сотрудников компании"""
+    
+    def test_company_index_follows_department_changes(self):
+        """Проверка что поиск по компании видит изменения состава отделов"""
+        company = Company("TechCorp")
+        it_dept = Department("IT")
+        hr_dept = Department("HR")
+        company.add_department(it_dept)
+        company.add_department(hr_dept)
+        
+        it_dept.add_employee(Employee(1, "John", "IT", 5000))
+        assert company.find_employee_by_id(1).name == "John"
+        
+        company.transfer_employee(1, "IT", "HR")
+        assert company.find_employee_by_id(1) is hr_dept.find_employee_by_id(1)
+        
+        hr_dept.remove_employee(1)
+        assert company.find_employee_by_id(1) is None
+    
+    def test_company_rejects_duplicate_id_across_departments(self):
+        """Проверка уникальности ID сотрудника в пределах компании"""
+        company = Company("TechCorp")
+        it_dept = Department("IT")
+        hr_dept = Department("HR")
+        company.add_department(it_dept)
+        company.add_department(hr_dept)
+        
+        it_dept.add_employee(Employee(1, "John", "IT", 5000))
+        
+        with pytest.raises(DuplicateIdError):
+            hr_dept.add_employee(Employee(1, "Jane", "HR", 4500))
+        assert len(hr_dept) == 0
+    
+    def test_rejected_employee_rolls_back_other_companies(self):
+        """Проверка отката индексов, если добавление отклонила другая компания"""
+        shared = Department("Shared")
+        first, second = Company("First"), Company("Second")
+        other = Department("Other")
+        other.add_employee(Employee(1, "John", "Other", 5000))
+        second.add_department(other)
+        first.add_department(shared)
+        second.add_department(shared)
+        
+        with pytest.raises(DuplicateIdError):
+            shared.add_employee(Employee(1, "Jane", "Shared", 4500))
+        assert len(shared) == 0
+        assert first.find_employee_by_id(1) is None
+        assert second.find_employee_by_id(1).name == "John"
+    
+    def test_company_total_cost_follows_salary_change(self):
+        """Проверка что изменение зарплаты сразу отражается в затратах"""
+        company = Company("TechCorp")
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000)
+        dept.add_employee(emp)
+        dept.add_employee(Employee(2, "Bob", "IT", 6000))
+        company.add_department(dept)
+        
+        emp.base_salary = 7000
+        assert dept.calculate_total_salary() == 13000
+        assert company.calculate_total_monthly_cost() == 13000
+        
+        dept.remove_employee(1)
+        emp.base_salary = 9000
+        assert company.calculate_total_monthly_cost() == 6000
+    
+    def test_try_find_employee_without_exceptions(self):
+        """Проверка поиска без исключений в отделе и компании"""
+        company = Company("TechCorp")
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000)
+        dept.add_employee(emp)
+        company.add_department(dept)
+        
+        assert dept.try_find_employee(1) is emp
+        assert dept.try_find_employee(2) is None
+        assert company.try_find_employee(1) is emp
+        assert company.try_find_employee(2) is None
+        
+        with pytest.raises(EmployeeNotFoundError) as exc_info:
+            company.find_employee_company_wide(2)
+        assert exc_info.value.employee_id == 2
+        assert str(exc_info.value) == "Сотрудник с ID 2 не найден"
+
+
+class TestCompanyProjectIndexes:
+    """Тесты индексов проектов компании"""
+    
+    def test_employee_projects_follow_team_changes(self):
+        """Проверка что список проектов сотрудника следует за изменениями команд"""
+        company = Company("TechCorp")
+        emp = Employee(1, "John", "IT", 5000)
+        
+        project1 = Project(1, "P1", "Desc", datetime.now(), "active")
+        project1.add_team_member(emp)
+        company.add_project(project1)
+        
+        project2 = Project(2, "P2", "Desc", datetime.now(), "planning")
+        company.add_project(project2)
+        project2.add_team_member(emp)
+        
+        assert company.get_employee_projects(1) == [project1, project2]
+        
+        project1.remove_team_member(1)
+        assert company.get_employee_projects(1) == [project2]
+        
+        company.remove_employee_from_all_projects(1)
+        assert company.get_employee_projects(1) == []
+        assert len(project2) == 0
+    
+    def test_get_projects_by_status_after_change(self):
+        """Проверка что смена статуса проекта отражается в фильтрации"""
+        company = Company("TechCorp")
+        
+        project = Project(1, "P1", "Desc", datetime.now(), "planning")
+        company.add_project(project)
+        company.add_project(Project(2, "P2", "Desc", datetime.now(), "planning"))
+        
+        project.change_status("completed")
+        
+        assert [p.project_id for p in company.get_projects_by_status("planning")] == [2]
+        assert company.get_projects_by_status("completed") == [project]
+        
+        company.remove_project(1)
+        assert company.get_projects_by_status("completed") == []
+
+
+class TestDepartmentStorage:
+    """Тесты сохранения и загрузки отдела"""
+    
+    def test_department_jsonl_roundtrip(self, tmp_path):
+        """Проверка потокового сохранения и загрузки в формате JSON Lines"""
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        dept.add_employee(Employee(2, "Bob", "IT", 6000))
+        filename = tmp_path / "it.jsonl"
+        
+        dept.save_to_jsonl(str(filename))
+        
+        assert len(filename.read_text(encoding="utf-8").splitlines()) == 3
+        loaded = Department.load_from_jsonl(str(filename))
+        assert loaded.name == "IT"
+        assert loaded.get_employee_ids() == [1, 2]
+        assert loaded.calculate_total_salary() == 11000
+
+
+class TestCompanySnapshot:
+    """Тесты бинарного снимка компании"""
+    
+    def test_company_snapshot_roundtrip(self, tmp_path):
+        """Проверка сохранения и загрузки бинарного снимка компании"""
+        company = Company("TechCorp")
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        dept.add_employee(Employee(2, "Bob", "IT", 6000))
+        dept.add_employee(CompactEmployee(3, "Eve", "IT", 4000))
+        company.add_department(dept)
+        
+        project = Project(1, "WebApp", "Desc", datetime(2030, 1, 15), "active")
+        company.add_project(project)
+        project.add_team_member(dept[0])
+        project.change_status("completed")
+        filename = str(tmp_path / "company.snap")
+        
+        company.save_snapshot(filename)
+        loaded = Company.load_snapshot(filename)
+        
+        assert loaded.name == "TechCorp"
+        assert len(loaded) == 3
+        assert loaded.get_departments()[0].get_employee_ids() == [1, 2, 3]
+        assert type(loaded.find_employee_by_id(3)) is CompactEmployee
+        assert loaded.calculate_total_monthly_cost() == 15000
+        loaded_project = loaded.get_projects()[0]
+        assert loaded_project.status == "completed"
+        assert loaded_project.deadline == datetime(2030, 1, 15)
+        assert loaded.get_employee_projects(1) == [loaded_project]
+    
+    def test_company_snapshot_keeps_salary_type_and_rejects_truncation(self, tmp_path):
+        """Проверка типа зарплаты в снимке и ошибки на обрезанном файле"""
+        company = Company("TechCorp")
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        dept.add_employee(Employee(2, "Bob", "IT", 6000.5))
+        company.add_department(dept)
+        filename = tmp_path / "company.snap"
+        company.save_snapshot(str(filename))
+        
+        salaries = [emp.base_salary for emp in Company.load_snapshot(str(filename)).get_all_employees()]
+        assert salaries == [5000, 6000.5]
+        assert type(salaries[0]) is int
+        
+        data = filename.read_bytes()
+        for size in range(len(data)):
+            filename.write_bytes(data[:size])
+            with pytest.raises(InvalidDataError):
+                Company.load_snapshot(str(filename))
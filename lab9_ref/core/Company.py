@@ -1,13 +1,19 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from itertools import chain
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
+from .Department import Department
+from .Project import Project
+from .snapshot import dump_company, load_company
 from .exceptions import (
     EmployeeNotFoundError,
     DepartmentNotFoundError,
     ProjectNotFoundError,
     DuplicateIdError,
-    InvalidDataError
+    InvalidDataError,
+    InvalidStatusError
 )
 
 
@@ -29,7 +35,15 @@ class Company:
             )
         self.__name = name
         self.__departments = []
-        self.__projects = []
+        # Проекты: ID -> проект (порядок добавления) и разбиение по статусам
+        self.__projects: Dict[int, Project] = {}
+        self.__projects_by_status: Dict[str, Dict[int, Project]] = {
+            status: {} for status in Project.VALID_STATUSES
+        }
+        # Глобальный индекс: ID сотрудника -> (отдел, сотрудник)
+        self.__employee_index: Dict[int, Tuple[Department, AbstractEmployee]] = {}
+        # Обратный индекс участия: ID сотрудника -> {ID проекта: проект}
+        self.__employee_projects: Dict[int, Dict[int, Project]] = {}
 
     @property
     def name(self) -> str:
@@ -47,8 +61,62 @@ class Company:
                     entity_type="Отдел",
                     entity_id=department.name
                 )
-        
+
+        # ID сотрудников должны быть уникальны в пределах всей компании
+        entries = {employee.id: (department, employee) for employee in department}
+        duplicates = entries.keys() & self.__employee_index.keys()
+        if duplicates:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=min(duplicates)
+            )
+
         self.__departments.append(department)
+        self.__employee_index.update(entries)
+        department.add_observer(self)
+
+    def __detach_department(self, department) -> None:
+        """Убирает сотрудников отдела из индекса и отписывается от отдела"""
+        department.remove_observer(self)
+        for employee in department:
+            entry = self.__employee_index.get(employee.id)
+            if entry is not None and entry[0] is department:
+                del self.__employee_index[employee.id]
+
+    def on_employee_added(self, department, employee) -> None:
+        """
+        Обновляет индекс при добавлении сотрудника в отдел компании
+
+        DuplicateIdError: Если сотрудник с таким ID уже есть в другом отделе
+        """
+        entry = self.__employee_index.get(employee.id)
+        if entry is not None and entry[0] is not department:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=employee.id
+            )
+        self.__employee_index[employee.id] = (department, employee)
+
+    def on_employee_id_changed(self, department, employee, old_id: int, new_id: int) -> None:
+        """
+        Переносит сотрудника отдела компании на новый ID в глобальном индексе
+
+        DuplicateIdError: Если новый ID уже занят в другом отделе
+        """
+        if new_id in self.__employee_index:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=new_id
+            )
+        entry = self.__employee_index.get(old_id)
+        if entry is not None and entry[0] is department:
+            self.__employee_index[new_id] = self.__employee_index.pop(old_id)
+
+    def on_employee_removed(self, department, employee) -> None:
+        """Обновляет индекс при удалении сотрудника из отдела компании"""
+        entry = self.__employee_index.get(employee.id)
+        if entry is not None and entry[0] is department:
+            del self.__employee_index[employee.id]
 
     def remove_department(self, department_name: str) -> None:
         """
@@ -62,6 +130,7 @@ class Company:
         for i, dept in enumerate(self.__departments):
             if dept.name == department_name:
                 del self.__departments[i]
+                self.__detach_department(dept)
                 return
 
         raise DepartmentNotFoundError(f"Отдел с названием '{department_name}' не найден")
@@ -75,6 +144,14 @@ class Company:
         """
         return self.__departments.copy()
 
+    def iter_departments(self) -> Iterator[Department]:
+        """
+        Итератор по отделам без копирования списка
+
+        Состав отделов нельзя менять во время обхода.
+        """
+        return iter(self.__departments)
+
     # управление проектами
 
     def add_project(self, project: Project) -> None:
@@ -90,11 +167,52 @@ class Company:
             raise InvalidDataError("Можно добавить только объект типа Project")
 
         # Проверка на id
-        for proj in self.__projects:
-            if proj.project_id == project.project_id:
-                raise DuplicateIdError(f"Проект с ID {project.project_id} уже существует")
+        if project.project_id in self.__projects:
+            raise DuplicateIdError(
+                entity_type="Проект",
+                entity_id=project.project_id
+            )
 
-        self.__projects.append(project)
+        self.__projects[project.project_id] = project
+        self.__projects_by_status[project.status][project.project_id] = project
+        for employee in project.iter_team():
+            self.on_team_member_added(project, employee)
+        project.add_observer(self)
+
+    def __detach_project(self, project: Project) -> None:
+        """Убирает проект и его участников из индексов и отписывается от проекта"""
+        del self.__projects[project.project_id]
+        del self.__projects_by_status[project.status][project.project_id]
+        project.remove_observer(self)
+        for employee_id in project.get_team_member_ids():
+            self.__forget_membership(employee_id, project.project_id)
+
+    def __forget_membership(self, employee_id: int, project_id: int) -> None:
+        """Удаляет запись об участии сотрудника в проекте из обратного индекса"""
+        projects = self.__employee_projects.get(employee_id)
+        if projects is None:
+            return
+        projects.pop(project_id, None)
+        if not projects:
+            del self.__employee_projects[employee_id]
+
+    def on_team_member_added(self, project: Project, employee) -> None:
+        """Обновляет обратный индекс при добавлении сотрудника в проект компании"""
+        self.__employee_projects.setdefault(employee.id, {})[project.project_id] = project
+
+    def on_team_member_removed(self, project: Project, employee) -> None:
+        """Обновляет обратный индекс при удалении сотрудника из проекта компании"""
+        self.__forget_membership(employee.id, project.project_id)
+
+    def on_team_member_id_changed(self, project: Project, employee, old_id: int, new_id: int) -> None:
+        """Переносит участие в проекте на новый ID сотрудника в обратном индексе"""
+        self.__forget_membership(old_id, project.project_id)
+        self.__employee_projects.setdefault(new_id, {})[project.project_id] = project
+
+    def on_project_status_changed(self, project: Project, old_status: str) -> None:
+        """Переносит проект в корзину нового статуса"""
+        del self.__projects_by_status[old_status][project.project_id]
+        self.__projects_by_status[project.status][project.project_id] = project
 
     def remove_project(self, project_id: int) -> None:
         """
@@ -105,12 +223,11 @@ class Company:
 
         ValueError: Если проект не найден
         """
-        for i, proj in enumerate(self.__projects):
-            if proj.project_id == project_id:
-                del self.__projects[i]
-                return
+        project = self.__projects.get(project_id)
+        if project is None:
+            raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
 
-        raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
+        self.__detach_project(project)
 
     def get_projects(self) -> List[Project]:
         """
@@ -119,7 +236,15 @@ class Company:
         Returns:
             Копию списка проектов
         """
-        return self.__projects.copy()
+        return list(self.__projects.values())
+
+    def iter_projects(self) -> Iterator[Project]:
+        """
+        Итератор по проектам без копирования
+
+        Состав проектов нельзя менять во время обхода.
+        """
+        return iter(self.__projects.values())
 
     # Общие методы
 
@@ -130,10 +255,18 @@ class Company:
         Returns:
             Список всех сотрудников всех отделов
         """
-        all_employees = []
-        for department in self.__departments:
-            all_employees.extend(department.get_employees())
-        return all_employees
+        return list(self.iter_all_employees())
+
+    def iter_all_employees(self) -> Iterator[AbstractEmployee]:
+        """
+        Итератор по всем сотрудникам компании без промежуточных копий
+
+        Returns:
+            Итератор по сотрудникам всех отделов
+        """
+        return chain.from_iterable(
+            department.iter_employees() for department in self.__departments
+        )
 
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
         """
@@ -148,26 +281,42 @@ class Company:
         if not isinstance(employee_id, int) or employee_id <= 0:
             raise InvalidDataError("ID должен быть положительным целым числом")
 
-        for department in self.__departments:
-            employee = department.find_employee_by_id(employee_id)
-            if employee:
-                return employee
-        return None
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
+            return None
+        return entry[1]
 
     def find_employee_company_wide(self, employee_id: int):
         """Ищет сотрудника во всей компании"""
-        for department in self.__departments:
-            try:
-                return department.find_employee_by_id(employee_id)
-            except EmployeeNotFoundError:
-                continue
-        
-        raise EmployeeNotFoundError(employee_id)
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
+            raise EmployeeNotFoundError(employee_id)
+        return entry[1]
+
+    def try_find_employee(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """
+        Ищет сотрудника во всей компании без исключений
+
+        В отличие от find_employee_by_id не проверяет ID: для любого
+        отсутствующего ключа просто возвращается None.
+
+        Args:
+            employee_id: ID сотрудника
+
+        Returns:
+            Найденный сотрудник или None
+        """
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
+            return None
+        return entry[1]
 
     def calculate_total_monthly_cost(self) -> float:
         """
         Расчет общих месячных зп
 
+        Отделы хранят текущие суммы зарплат, поэтому расчет стоит O(число отделов).
+
         Returns:
             Сумма зарплат всех сотрудников компании
         """
@@ -189,7 +338,7 @@ class Company:
         if status not in Project.VALID_STATUSES:
             raise InvalidStatusError(f"Статус должен быть одним из: {Project.VALID_STATUSES}")
 
-        return [project for project in self.__projects if project.status == status]
+        return list(self.__projects_by_status[status].values())
 
     def get_company_info(self) -> str:
         """
@@ -207,6 +356,45 @@ class Company:
                 f"Проектов: {total_projects}\n"
                 f"Месячные затраты: {self.calculate_total_monthly_cost():.2f}")
 
+    def save_snapshot(self, filename: str) -> None:
+        """
+        Сохраняет компанию целиком (отделы, сотрудники, проекты, команды)
+        в компактный бинарный снимок
+
+        Args:
+            filename: Имя файла для сохранения
+
+        Error: Если не удалось сохранить файл
+        """
+        data = dump_company(self)
+        try:
+            with open(filename, 'wb') as f:
+                f.write(data)
+        except (IOError, OSError) as e:
+            raise IOError(f"Не удалось сохранить снимок {filename}: {e}")
+
+    @classmethod
+    def load_snapshot(cls, filename: str) -> 'Company':
+        """
+        Загружает компанию из бинарного снимка (см. save_snapshot)
+
+        Args:
+            filename: Имя файла снимка
+
+        Returns:
+            Восстановленная компания
+
+        Error: Если не удалось прочитать файл
+        InvalidDataError: Если файл не является снимком или поврежден
+        """
+        try:
+            with open(filename, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError) as e:
+            raise IOError(f"Не удалось загрузить снимок {filename}: {e}")
+
+        return load_company(data, cls)
+
     def __str__(self) -> str:
         """Строковое представление компании"""
         total_employees = sum(len(dept) for dept in self.__departments)
@@ -238,6 +426,7 @@ class Company:
                         f"Используйте force=True для принудительного удаления или перенесите сотрудников."
                     )
                 del self.__departments[i]
+                self.__detach_department(dept)
                 return
 
         raise DepartmentNotFoundError(f"Отдел с названием '{department_name}' не найден")
@@ -269,8 +458,8 @@ class Company:
             raise DepartmentNotFoundError(f"Целевой отдел '{to_dept_name}' не найден")
 
         # Поиск сотрудника в исходном отделе
-        employee = from_dept.find_employee_by_id(employee_id)
-        if employee is None:
+        entry = self.__employee_index.get(employee_id)
+        if entry is None or entry[0] is not from_dept:
             raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в отделе '{from_dept_name}'")
 
         # Проверка, что сотрудник не участвует в проектах
@@ -280,7 +469,8 @@ class Company:
                 f"Сначала удалите его из всех проектов."
             )
 
-        # Удаление из исходного отдела и добавление в целевой
+        # Удаление из исходного отдела и добавление в целевой (индекс обновится через наблюдателя)
+        employee = entry[1]
         from_dept.remove_employee(employee_id)
         to_dept.add_employee(employee)
 
@@ -294,11 +484,7 @@ class Company:
         Returns:
             True если сотрудник участвует в проектах, иначе False
         """
-        for project in self.__projects:
-            for team_member in project.get_team():
-                if team_member.id == employee_id:
-                    return True
-        return False
+        return employee_id in self.__employee_projects
 
     #проверка связей
     def remove_employee(self, employee_id: int, force: bool = False) -> None:
@@ -313,13 +499,8 @@ class Company:
         RuntimeError: Если сотрудник участвует в проектах и не установлен force=True
         """
         # Поиск отдела с сотрудником
-        department_with_employee = None
-        for dept in self.__departments:
-            if dept.find_employee_by_id(employee_id) is not None:
-                department_with_employee = dept
-                break
-
-        if department_with_employee is None:
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
             raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в компании")
 
         # Проверка участия в проектах
@@ -330,6 +511,7 @@ class Company:
             )
 
         # Удаление сотрудника
+        department_with_employee = entry[0]
         department_with_employee.remove_employee(employee_id)
 
     def remove_project(self, project_id: int, force: bool = False) -> None:
@@ -343,18 +525,17 @@ class Company:
         ValueError: Если проект не найден
         RuntimeError: Если в проекте есть команда и не установлен force=True
         """
-        for i, proj in enumerate(self.__projects):
-            if proj.project_id == project_id:
-                # Проверка наличия команды в проекте
-                if proj.get_team_size() > 0 and not force:
-                    raise RuntimeError(
-                        f"Нельзя удалить проект с ID {project_id}, так как в нем есть команда. "
-                        f"Используйте force=True для принудительного удаления или сначала удалите всех сотрудников из проекта."
-                    )
-                del self.__projects[i]
-                return
+        project = self.__projects.get(project_id)
+        if project is None:
+            raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
 
-        raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
+        # Проверка наличия команды в проекте
+        if project.get_team_size() > 0 and not force:
+            raise RuntimeError(
+                f"Нельзя удалить проект с ID {project_id}, так как в нем есть команда. "
+                f"Используйте force=True для принудительного удаления или сначала удалите всех сотрудников из проекта."
+            )
+        self.__detach_project(project)
 
     def get_employee_projects(self, employee_id: int) -> List[Project]:
         """
@@ -366,13 +547,7 @@ class Company:
         Returns:
             Список проектов
         """
-        projects = []
-        for project in self.__projects:
-            for team_member in project.get_team():
-                if team_member.id == employee_id:
-                    projects.append(project)
-                    break
-        return projects
+        return list(self.__employee_projects.get(employee_id, {}).values())
 
     def remove_employee_from_all_projects(self, employee_id: int) -> None:
         """
@@ -383,14 +558,10 @@ class Company:
 
         EmployeeNotFoundError: Если сотрудник не найден в проектах
         """
-        removed_from_projects = []
-
-        for project in self.__projects:
-            try:
-                project.remove_team_member(employee_id)
-                removed_from_projects.append(project.name)
-            except EmployeeNotFoundError:
-                pass
+        # Копия списка: удаление из проекта меняет обратный индекс
+        projects = self.get_employee_projects(employee_id)
+        for project in projects:
+            project.remove_team_member(employee_id)
 
-        if not removed_from_projects:
+        if not projects:
             raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден ни в одном проекте")
@@ -2,13 +2,21 @@ import json
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
+from .checksum import columns_checksum
 from .exceptions import (
     InvalidDataError,
     FinancialValidationError,
     DuplicateIdError
 )
 
-class Employee(AbstractEmployee):
+class BaseEmployee(AbstractEmployee):
+    """
+    Общая основа Employee и CompactEmployee: поля хранятся в слотах,
+    поведение и контракты to_dict/from_dict у обоих классов одни и те же.
+    """
+    __slots__ = ('__id', '__name', '__department', '__base_salary')
+
     def __init__(self, id_empl, name, department, base_salary):
         self.__validate_id(id_empl)
         self.__validate_name(name)
@@ -45,8 +53,17 @@ class Employee(AbstractEmployee):
 
     @id.setter
     def id(self, value):
+        """Меняет ID; отделы и проекты сотрудника перестраивают индексы или отклоняют смену"""
         self.__validate_id(value)
+        old_id = self.__id
+        if value == old_id:
+            return
         self.__id = value
+        try:
+            self._notify_id_changed(old_id, value)
+        except Exception:
+            self.__id = old_id
+            raise
 
     @property
     def name(self):
@@ -73,7 +90,9 @@ class Employee(AbstractEmployee):
     @base_salary.setter
     def base_salary(self, value):
         self.__validate_salary(value)
+        old_salary = self.calculate_salary()
         self.__base_salary = value
+        self._notify_salary_changed(old_salary)
 
     def __str__(self):
         return f"Сотрудник [id: {self.__id}, имя: {self.__name}, отдел: {self.__department}, базовая зарплата: {self.__base_salary}]"
@@ -94,7 +113,7 @@ class Employee(AbstractEmployee):
             'base_salary': self.__base_salary
         }
 
-@classmethod
+    @classmethod
     def from_dict(cls, data: dict) -> 'Employee':
         """Создает сотрудника из словаря с валидацией"""
         required_fields = ['id', 'name', 'department', 'base_salary']
@@ -121,3 +140,76 @@ class Employee(AbstractEmployee):
             department=data['department'],
             base_salary=data['base_salary']
         )
+
+    @staticmethod
+    def __columns_checksum(columns) -> int:
+        try:
+            return columns_checksum(columns)
+        except (TypeError, OverflowError) as e:
+            raise InvalidDataError(
+                field="строки сотрудников",
+                value=str(e),
+                expected="(int, str, str, число)"
+            )
+
+    @staticmethod
+    def __columns(rows) -> list:
+        columns = list(zip(*rows)) if rows else [(), (), (), ()]
+        if len(columns) != 4:
+            raise InvalidDataError(
+                field="строки сотрудников",
+                value=f"{len(columns)} полей",
+                expected="(id, name, department, base_salary)"
+            )
+        return columns
+
+    @staticmethod
+    def rows_checksum(rows) -> int:
+        """
+        Контрольная сумма строк (id, name, department, base_salary) - как get_all().
+        Считается при сохранении проверенных данных и сверяется в from_trusted_rows.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        return BaseEmployee.__columns_checksum(BaseEmployee.__columns(rows))
+
+    @classmethod
+    def from_trusted_rows(cls, rows, checksum: int) -> List['BaseEmployee']:
+        """
+        Создает сотрудников из уже проверенных строк без повторной валидации полей.
+
+        Строки целиком сверяются с контрольной суммой rows_checksum(), поэтому
+        поврежденные или чужие данные не пройдут молча.
+
+        Args:
+            rows: Строки (id, name, department, base_salary)
+            checksum: Контрольная сумма, сохраненная вместе со строками
+
+        Returns:
+            Список сотрудников в порядке строк
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        actual = BaseEmployee.__columns_checksum(BaseEmployee.__columns(rows))
+        if actual != checksum:
+            raise InvalidDataError(
+                field="контрольная сумма строк",
+                value=checksum,
+                expected=str(actual)
+            )
+        employees = []
+        for id_empl, name, department, base_salary in rows:
+            employee = cls.__new__(cls)
+            employee.__id = id_empl
+            employee.__name = name
+            employee.__department = department
+            employee.__base_salary = base_salary
+            employees.append(employee)
+        return employees
+
+
+class CompactEmployee(BaseEmployee):
+    """Сотрудник без __dict__: произвольные атрибуты экземпляру добавить нельзя"""
+    __slots__ = ()
+
+
+class Employee(BaseEmployee):
+    """Сотрудник с __dict__: допускает дополнительные атрибуты экземпляра"""
@@ -0,0 +1,40 @@
+"""
+Контрольная сумма строк сотрудников для доверенной загрузки (from_trusted_rows).
+
+Одна реализация для классов core_OOP и рефакторенных классов lab9_ref:
+строки, посчитанные одним деревом, сверяются другим.
+"""
+
+import zlib
+from array import array
+
+
+def _strings_checksum(values, checksum: int) -> int:
+    """CRC32 строк с длиной каждой: граница между строками не может сдвинуться"""
+    encoded = [str.encode(value, 'utf-8') for value in values]
+    checksum = zlib.crc32(array('Q', map(len, encoded)).tobytes(), checksum)
+    return zlib.crc32(b"".join(encoded), checksum)
+
+
+def columns_checksum(columns) -> int:
+    """
+    Контрольная сумма колонок строк сотрудников
+
+    Args:
+        columns: Колонки (ids, names, departments, salaries, *дополнительные);
+                 дополнительные колонки учитываются через repr()
+
+    Returns:
+        CRC32 всех колонок
+
+    Raises:
+        TypeError, OverflowError: Если значения колонок не того типа
+    """
+    ids, names, departments, salaries, *extra = columns
+    checksum = zlib.crc32(array('q', ids).tobytes())
+    checksum = _strings_checksum(names, checksum)
+    checksum = _strings_checksum(departments, checksum)
+    checksum = zlib.crc32(array('d', salaries).tobytes(), checksum)
+    for column in extra:
+        checksum = _strings_checksum(map(repr, column), checksum)
+    return checksum
@@ -1,69 +1,116 @@
 """исключения для системы учета сотрудников"""
 
+# Значение не передано: InvalidDataError вызван с готовым сообщением
+_NO_VALUE = object()
+
+
 class BaseAppError(Exception):
-    """Базовое исключение приложения."""
-    pass
+    """Базовое исключение приложения.
+
+    Подклассы сохраняют только поля, а текст сообщения собирают
+    в _format() только при str(). Исключение, пойманное как часть
+    управления потоком, строку не форматирует вовсе.
+    """
+
+    def _format(self) -> str:
+        return super().__str__()
+
+    def __str__(self) -> str:
+        return self._format()
+
 
 class EmployeeNotFoundError(BaseAppError):
     """Исключение при отсутствии сотрудника."""
     def __init__(self, employee_id):
-        super().__init__(f"Сотрудник с ID {employee_id} не найден")
+        super().__init__(employee_id)
         self.employee_id = employee_id
 
+    def _format(self) -> str:
+        return f"Сотрудник с ID {self.employee_id} не найден"
+
 
 class DepartmentNotFoundError(BaseAppError):
     """Исключение при отсутствии отдела."""
     def __init__(self, department_name):
-        super().__init__(f"Отдел '{department_name}' не найден")
+        super().__init__(department_name)
         self.department_name = department_name
 
+    def _format(self) -> str:
+        return f"Отдел '{self.department_name}' не найден"
+
 
 class ProjectNotFoundError(BaseAppError):
     """Исключение при отсутствии проекта."""
     def __init__(self, project_id):
-        super().__init__(f"Проект с ID {project_id} не найден")
+        super().__init__(project_id)
         self.project_id = project_id
 
+    def _format(self) -> str:
+        return f"Проект с ID {self.project_id} не найден"
+
 
 class InvalidStatusError(BaseAppError):
     """Исключение при невалидном статусе."""
     def __init__(self, status, valid_statuses=None):
-        msg = f"Невалидный статус: '{status}'"
-        if valid_statuses:
-            msg += f". Допустимые статусы: {', '.join(valid_statuses)}"
-        super().__init__(msg)
+        super().__init__(status, valid_statuses)
         self.status = status
         self.valid_statuses = valid_statuses
 
+    def _format(self) -> str:
+        msg = f"Невалидный статус: '{self.status}'"
+        if self.valid_statuses:
+            msg += f". Допустимые статусы: {', '.join(self.valid_statuses)}"
+        return msg
+
 
 class DuplicateIdError(BaseAppError):
     """Исключение при дублировании ID."""
     def __init__(self, entity_type, entity_id):
-        super().__init__(f"{entity_type} с ID {entity_id} уже существует")
+        super().__init__(entity_type, entity_id)
         self.entity_type = entity_type
         self.entity_id = entity_id
 
+    def _format(self) -> str:
+        return f"{self.entity_type} с ID {self.entity_id} уже существует"
+
 class ValidationError(BaseAppError):
     """Базовое исключение для ошибок валидации."""
     pass
 
 
 class InvalidDataError(ValidationError):
-    """Неверные данные."""
-    def __init__(self, field, value, expected=None):
-        msg = f"Неверное значение для {field}: {value}"
-        if expected:
-            msg += f". Ожидается: {expected}"
-        super().__init__(msg)
+    """Неверные данные.
+
+    InvalidDataError(field, value, expected) или InvalidDataError("готовое сообщение").
+    """
+    def __init__(self, field, value=_NO_VALUE, expected=None):
+        self.__message_only = value is _NO_VALUE
+        if self.__message_only:
+            super().__init__(field)
+            value = None
+        else:
+            super().__init__(field, value, expected)
         self.field = field
         self.value = value
         self.expected = expected
 
+    def _format(self) -> str:
+        if self.__message_only:
+            return str(self.field)
+        msg = f"Неверное значение для {self.field}: {self.value}"
+        if self.expected:
+            msg += f". Ожидается: {self.expected}"
+        return msg
+
 
 class FinancialValidationError(ValidationError):
     """Ошибка валидации финансовых данных."""
     def __init__(self, message):
-        super().__init__(f"Финансовая ошибка: {message}")
+        super().__init__(message)
+        self.message = message
+
+    def _format(self) -> str:
+        return f"Финансовая ошибка: {self.message}"
 
 
 class DatabaseError(BaseAppError):
@@ -0,0 +1,125 @@
+"""
+Миграции схемы employees. Версия схемы хранится в PRAGMA user_version.
+
+Одна реализация для data_base (DatabaseConnection) и для
+DatabaseEmployeeRepository из lab9_ref.
+"""
+
+import re
+import sqlite3
+from typing import List, Sequence, Tuple
+
+from .exceptions import DatabaseError
+
+# Управляемые индексы таблицы employees: имя -> колонки.
+# Составные индексы покрывают отчетные запросы (фильтр + base_salary),
+# поэтому SQLite не обращается к самой таблице.
+EMPLOYEE_INDEXES = {
+    "idx_employees_department_salary": ("department", "base_salary"),
+    "idx_employees_type_salary": ("employee_type", "base_salary"),
+    "idx_employees_salary": ("base_salary",),
+}
+
+
+def _create_indexes() -> List[str]:
+    return [
+        f"CREATE INDEX IF NOT EXISTS {name} ON employees ({', '.join(columns)})"
+        for name, columns in EMPLOYEE_INDEXES.items()
+    ]
+
+
+# Миграции по порядку: версия схемы -> SQL. Текущая версия хранится в PRAGMA user_version
+MIGRATIONS: Sequence[Tuple[int, List[str]]] = (
+    (1, [
+        """
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            department TEXT NOT NULL,
+            base_salary REAL NOT NULL,
+            employee_type TEXT NOT NULL,
+            bonus REAL,
+            tech_stack TEXT,
+            seniority_level TEXT,
+            commission_rate REAL,
+            sales_volume REAL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS departments (
+            name TEXT PRIMARY KEY
+        )
+        """,
+    ]),
+    (2, _create_indexes() + ["ANALYZE employees"]),
+)
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Версия схемы файла БД (0 - новый файл)"""
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(connection: sqlite3.Connection) -> int:
+    """
+    Доводит схему БД до SCHEMA_VERSION.
+    Уже существующий company.db получает недостающие индексы.
+
+    Returns:
+        Версия схемы после миграции
+    """
+    # DDL в sqlite3 не открывает транзакцию неявно, поэтому каждый шаг
+    # явно обернут в BEGIN/COMMIT: при сбое откатываются и созданные
+    # объекты, и user_version. IMMEDIATE сразу берет блокировку записи,
+    # и версия перечитывается под ней: шаг, уже примененный другим
+    # подключением, второй раз не выполняется.
+    connection.commit()  # незавершенная транзакция вызывающего кода
+    version = get_schema_version(connection)
+    try:
+        for target, statements in MIGRATIONS:
+            if target <= version:
+                continue
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                version = get_schema_version(connection)
+                if target > version:
+                    for sql in statements:
+                        connection.execute(sql)
+                    # PRAGMA не принимает параметры; target - константа из MIGRATIONS
+                    connection.execute(f"PRAGMA user_version = {int(target)}")
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.rollback()
+                raise
+            version = max(version, target)
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Ошибка миграции схемы до версии {version + 1}: {e}")
+    return version
+
+
+# Строка плана с поиском по индексу: "SEARCH employees USING COVERING INDEX idx (department=?)"
+_INDEX_SEARCH = re.compile(r"SEARCH \S+(?: AS \S+)? USING (?:COVERING )?INDEX (\S+)")
+
+
+def explain_query_plan(connection: sqlite3.Connection, sql: str, params: Sequence = ()) -> List[str]:
+    """Строки EXPLAIN QUERY PLAN для запроса"""
+    return [row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def uses_index(connection: sqlite3.Connection, sql: str, params: Sequence = (),
+               index_name: str = None) -> bool:
+    """
+    Проверяет по EXPLAIN QUERY PLAN, что запрос идет через индекс, а не полным сканом.
+    Засчитываются только строки плана "SEARCH ... USING [COVERING] INDEX <имя>":
+    SCAN по индексу и USE TEMP B-TREE поиском по индексу не считаются.
+
+    Args:
+        index_name: Конкретный индекс, который должен быть в плане
+    """
+    plan = explain_query_plan(connection, sql, params)
+    indexes = [match.group(1) for match in map(_INDEX_SEARCH.match, plan) if match]
+    if index_name is not None:
+        return index_name in indexes
+    return bool(plan) and len(indexes) == len(plan)
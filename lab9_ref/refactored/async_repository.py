@@ -0,0 +1,121 @@
+# refactored/async_repository.py
+"""
+Асинхронная обертка над SQLite-хранилищем сотрудников
+
+Вся работа с SQLite выполняется в отдельном потоке (одно подключение,
+один поток), поэтому вызовы не блокируют цикл событий asyncio.
+Одновременные get_by_id из разных корутин собираются в один запрос IN (...).
+"""
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .interfaces import IAsyncEmployeeRepository
+from .repository import DatabaseEmployeeRepository
+
+
+class AsyncEmployeeRepository(IAsyncEmployeeRepository):
+    """Асинхронное хранилище сотрудников в SQLite
+
+    Пример:
+        async with AsyncEmployeeRepository("company.db") as repo:
+            employee = await repo.get_by_id(1)
+            async for emp in repo.get_all():
+                ...
+    """
+
+    def __init__(self, db_path: str = "company.db", page_size: int = 500):
+        """
+        Args:
+            db_path: Путь к файлу БД
+            page_size: Сколько строк get_all читает за одно обращение к потоку БД
+        """
+        self.page_size = page_size
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        # Подключение создается в потоке БД и используется только в нем
+        self.__repository = self.__executor.submit(
+            lambda: DatabaseEmployeeRepository(sqlite3.connect(db_path))
+        ).result()
+        self.__pending: Dict[int, List[asyncio.Future]] = {}
+
+    async def __run(self, func, *args):
+        """Выполнить синхронный вызов в потоке БД"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, partial(func, *args))
+
+    async def add(self, employee) -> None:
+        """Добавить сотрудника"""
+        await self.__run(self.__repository.add, employee)
+
+    async def add_many(self, employees: List[Any]) -> None:
+        """Добавить пачку сотрудников одной транзакцией"""
+        await self.__run(self.__repository.add_many, list(employees))
+
+    async def remove(self, employee_id: int) -> None:
+        """Удалить сотрудника по ID"""
+        await self.__run(self.__repository.remove, employee_id)
+
+    async def get_by_id(self, employee_id: int) -> Optional[Any]:
+        """Получить сотрудника по ID
+
+        Запросы, пришедшие в одной итерации цикла событий, выполняются
+        одним SELECT ... WHERE id IN (...).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self.__pending:
+            loop.call_soon(self.__flush_pending, loop)
+        self.__pending.setdefault(employee_id, []).append(future)
+        return await future
+
+    def __flush_pending(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Отправляет накопленные get_by_id одним запросом"""
+        pending, self.__pending = self.__pending, {}
+        batch = loop.run_in_executor(self.__executor, self.__repository.get_many, list(pending))
+
+        def resolve(batch_future: asyncio.Future) -> None:
+            error = batch_future.exception()
+            found = batch_future.result() if error is None else {}
+            for employee_id, futures in pending.items():
+                for future in futures:
+                    if future.done():  # вызывающая корутина отменена
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(found.get(employee_id))
+
+        batch.add_done_callback(resolve)
+
+    async def get_all(self) -> AsyncIterator[Any]:
+        """Асинхронный итератор по сотрудникам (читает таблицу страницами)"""
+        rows = await self.__run(self.__repository.iter_all)
+        while True:
+            page = await self.__run(lambda: list(islice(rows, self.page_size)))
+            if not page:
+                return
+            for employee in page:
+                yield employee
+
+    async def find(self, criteria: dict) -> List[Any]:
+        """Найти сотрудников по критериям (WHERE выполняется в SQLite)"""
+        return await self.__run(self.__repository.find, criteria)
+
+    async def count(self) -> int:
+        """Получить количество сотрудников"""
+        return await self.__run(self.__repository.count)
+
+    async def close(self) -> None:
+        """Закрыть подключение и остановить поток БД"""
+        await self.__run(self.__repository.connection.close)
+        self.__executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncEmployeeRepository":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
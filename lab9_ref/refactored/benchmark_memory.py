@@ -0,0 +1,108 @@
+# refactored/benchmark_memory.py
+"""
+Замер памяти на одного сотрудника: исходные классы (все поля в __dict__)
+против текущих вариантов с __dict__ и Compact* со __slots__
+
+Запуск из каталога lab9_ref:
+    python -m refactored.benchmark_memory [количество]
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from refactored.models.employee_refactored import (
+    Employee, Developer, Manager, Salesperson,
+    CompactEmployee, CompactDeveloper, CompactManager, CompactSalesperson
+)
+from refactored.strategies.bonus_strategy import NoBonusStrategy
+from core.Employee import Employee as CoreEmployee, CompactEmployee as CoreCompactEmployee
+
+
+# Раскладка полей исходных классов (до перехода на __slots__): каждый
+# экземпляр хранит те же поля, что и раньше, в собственном __dict__
+
+class _BaselineEmployee:
+    def __init__(self, id_empl, name, department, base_salary):
+        self.id = id_empl
+        self.name = name
+        self.department = department
+        self.base_salary = base_salary
+
+
+class _BaselineDeveloper(_BaselineEmployee):
+    def __init__(self, id_empl, name, department, base_salary, level="junior"):
+        super().__init__(id_empl, name, department, base_salary)
+        self.level = level
+        self.skills = []
+
+
+class _BaselineManager(_BaselineEmployee):
+    def __init__(self, id_empl, name, department, base_salary, bonus_strategy=None):
+        super().__init__(id_empl, name, department, base_salary)
+        self.bonus_strategy = bonus_strategy or NoBonusStrategy()
+
+
+class _BaselineSalesperson(_BaselineEmployee):
+    def __init__(self, id_empl, name, department, base_salary, commission_rate=0.05):
+        super().__init__(id_empl, name, department, base_salary)
+        self.commission_rate = commission_rate
+        self.sales_amount = 0.0
+
+
+def measure_bytes_per_object(factory: Callable[[int], object], count: int) -> float:
+    """
+    Средний объем памяти (в байтах), выделенной на один объект
+
+    Args:
+        factory: Функция, создающая объект по номеру (начиная с 1)
+        count: Сколько объектов создать
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(1, count + 1)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Сам список объектов в замер не входит
+    return (after - before - sys.getsizeof(objects)) / count
+
+
+def run_benchmark(count: int = 100_000) -> List[Tuple[str, float, float, float]]:
+    """
+    Сравнивает исходные, обычные и компактные классы
+
+    Returns:
+        Список (класс, байт на исходный объект, байт на объект с __dict__,
+        байт на объект со __slots__)
+    """
+    groups = [
+        ("core Employee", _BaselineEmployee, CoreEmployee, CoreCompactEmployee,
+         lambda cls, i: cls(i, f"Сотрудник {i}", "IT", 50000)),
+        ("Employee", _BaselineEmployee, Employee, CompactEmployee,
+         lambda cls, i: cls(i, f"Сотрудник {i}", "IT", 50000)),
+        ("Developer", _BaselineDeveloper, Developer, CompactDeveloper,
+         lambda cls, i: cls(i, f"Сотрудник {i}", "IT", 50000, "middle")),
+        ("Manager", _BaselineManager, Manager, CompactManager,
+         lambda cls, i: cls(i, f"Сотрудник {i}", "IT", 50000)),
+        ("Salesperson", _BaselineSalesperson, Salesperson, CompactSalesperson,
+         lambda cls, i: cls(i, f"Сотрудник {i}", "Sales", 50000, 0.1)),
+    ]
+    results = []
+    for title, baseline, regular, compact, make in groups:
+        sizes = [measure_bytes_per_object(lambda i: make(cls, i), count)
+                 for cls in (baseline, regular, compact)]
+        results.append((title, *sizes))
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Байт на сотрудника ({count} объектов)")
+    print(f"{'Класс':<16}{'исходный':>12}{'__dict__':>12}{'__slots__':>12}{'экономия':>12}")
+    for title, baseline_size, regular_size, compact_size in run_benchmark(count):
+        # Экономия Compact* относительно исходных классов
+        saving = 1 - compact_size / baseline_size
+        print(f"{title:<16}{baseline_size:>12.1f}{regular_size:>12.1f}"
+              f"{compact_size:>12.1f}{saving:>11.0%}")
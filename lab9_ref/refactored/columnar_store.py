@@ -0,0 +1,431 @@
+# refactored/columnar_store.py
+"""
+Колоночное хранилище сотрудников в memory-mapped файле
+
+Числовые поля лежат фиксированными колонками в файле <path>,
+строки (имя, отдел) - в отдельной куче <path>.heap.
+Объекты Employee/Developer/Manager/Salesperson создаются только
+при обращении к конкретной строке, поэтому большой реестр можно
+открыть и фильтровать, не загружая его целиком в память.
+
+Хранятся: id, base_salary, тип, уровень разработчика, commission_rate,
+sales_amount, имя и отдел. Навыки разработчика и стратегия бонуса
+менеджера в колонки не входят: при материализации менеджер получает
+стратегию по умолчанию.
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from itertools import compress, repeat
+from operator import eq
+from typing import Any, Dict, Iterator, List, Optional
+
+from .exceptions import InvalidDataError
+from .models.employee_refactored import (
+    Employee, Developer, Manager, Salesperson,
+    CompactEmployee, CompactDeveloper, CompactManager, CompactSalesperson,
+    BaseDeveloper, BaseSalesperson
+)
+
+MAGIC = b"COLS"
+VERSION = 1
+
+# magic, версия, флаг "id отсортированы", вместимость, количество строк
+_HEADER = struct.Struct("<4sHBxQQ")
+_HEADER_SIZE = 64
+
+# Колонки: имя -> формат struct. Вместимость кратна 8, поэтому все колонки выровнены
+_COLUMNS = (
+    ('id', 'q'),
+    ('base_salary', 'd'),
+    ('commission_rate', 'd'),
+    ('sales_amount', 'd'),
+    ('name_offset', 'Q'),
+    ('department_offset', 'Q'),
+    ('name_length', 'I'),
+    ('department_length', 'I'),
+    ('type', 'B'),
+    ('level', 'B'),
+    ('alive', 'B'),
+)
+_COLUMN_FORMATS = dict(_COLUMNS)
+_COLUMN_SIZES = {name: struct.calcsize(fmt) for name, fmt in _COLUMNS}
+_ROW_SIZE = sum(_COLUMN_SIZES.values())
+
+# У каждого класса свой код: Compact-варианты читаются обратно теми же классами.
+# Коды 0-3 совпадают с файлами, записанными до появления Compact-кодов
+_TYPES = (Employee, Developer, Manager, Salesperson,
+          CompactEmployee, CompactDeveloper, CompactManager, CompactSalesperson)
+_TYPE_CODES = {cls.__name__: code for code, cls in enumerate(_TYPES)}
+# Коды типов с уровнем разработчика и с полями продавца
+_DEVELOPER_CODES = frozenset(code for code, cls in enumerate(_TYPES) if issubclass(cls, BaseDeveloper))
+_SALESPERSON_CODES = frozenset(code for code, cls in enumerate(_TYPES) if issubclass(cls, BaseSalesperson))
+_LEVELS = ("junior", "middle", "senior")
+_LEVEL_CODES = {level: code for code, level in enumerate(_LEVELS)}
+
+# Поля, по которым возможен поиск прямо по колонкам
+COLUMN_FIELDS = frozenset({
+    'id', 'name', 'department', 'base_salary', 'type', 'level',
+    'commission_rate', 'sales_amount'
+})
+
+
+class ColumnarEmployeeStore:
+    """Колоночное хранилище сотрудников поверх mmap"""
+
+    def __init__(self, path: str, capacity: int = 1024):
+        """
+        Args:
+            path: Путь к файлу колонок (куча строк - path + '.heap')
+            capacity: Начальная вместимость нового файла (в строках)
+        """
+        exists = os.path.exists(path)
+        heap_path = path + '.heap'
+        if exists and not os.path.exists(heap_path):
+            raise InvalidDataError(f"Не найдена куча строк {heap_path}")
+        self.__map: Optional[mmap.mmap] = None
+        self.__heap_map: Optional[mmap.mmap] = None
+        self.__heap_file = None
+        self.__file = open(path, 'r+b' if exists else 'w+b')
+        try:
+            self.__heap_file = open(heap_path, 'r+b' if exists else 'w+b', buffering=0)
+            self.__heap_size = os.fstat(self.__heap_file.fileno()).st_size
+            if exists:
+                ids_sorted, capacity, count = self.__read_header(path)
+            else:
+                capacity = max(8, (capacity + 7) // 8 * 8)
+                count, ids_sorted = 0, 1
+                self.__file.truncate(self.__file_size(capacity))
+            self.__map = mmap.mmap(self.__file.fileno(), 0)
+        except BaseException:
+            self.__release()
+            raise
+
+        self.__capacity = capacity
+        self.__count = count
+        self.__ids_sorted = bool(ids_sorted)
+        self.__offsets = self.__column_offsets(capacity)
+        self.__alive = None  # число живых строк считается лениво
+        self.__id_rows: Optional[Dict[int, int]] = None
+        self.__interned: Dict[str, tuple] = {}
+        if not exists:
+            self.__write_header()
+
+    # ===== СЛУЖЕБНОЕ =====
+
+    @staticmethod
+    def __file_size(capacity: int) -> int:
+        return _HEADER_SIZE + capacity * _ROW_SIZE
+
+    @staticmethod
+    def __column_offsets(capacity: int) -> Dict[str, int]:
+        offsets, position = {}, _HEADER_SIZE
+        for name, _ in _COLUMNS:
+            offsets[name] = position
+            position += _COLUMN_SIZES[name] * capacity
+        return offsets
+
+    def __read_header(self, path: str) -> tuple:
+        """Читает и проверяет заголовок существующего файла
+
+        Returns:
+            (флаг "id отсортированы", вместимость, количество строк)
+
+        Raises:
+            InvalidDataError: Если файл не хранилище или обрезан
+        """
+        header = self.__file.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE:
+            raise InvalidDataError(f"Файл {path} обрезан: нет заголовка")
+        magic, version, ids_sorted, capacity, count = _HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION:
+            raise InvalidDataError(f"Файл {path} не является колоночным хранилищем v{VERSION}")
+        if capacity == 0 or capacity % 8 or count > capacity:
+            raise InvalidDataError(f"Файл {path}: неверный заголовок "
+                                   f"(вместимость {capacity}, строк {count})")
+        if os.fstat(self.__file.fileno()).st_size < self.__file_size(capacity):
+            raise InvalidDataError(f"Файл {path} обрезан: колонки короче вместимости {capacity}")
+        return ids_sorted, capacity, count
+
+    def __release(self) -> None:
+        """Закрывает все, что успело открыться"""
+        for resource in (self.__map, self.__heap_map, self.__file, self.__heap_file):
+            if resource is not None:
+                resource.close()
+
+    def __write_header(self) -> None:
+        _HEADER.pack_into(self.__map, 0, MAGIC, VERSION, int(self.__ids_sorted),
+                          self.__capacity, self.__count)
+
+    def __get(self, name: str, row: int):
+        return struct.unpack_from(_COLUMN_FORMATS[name], self.__map,
+                                  self.__offsets[name] + row * _COLUMN_SIZES[name])[0]
+
+    def __set(self, name: str, row: int, value) -> None:
+        struct.pack_into(_COLUMN_FORMATS[name], self.__map,
+                         self.__offsets[name] + row * _COLUMN_SIZES[name], value)
+
+    def __grow(self) -> None:
+        """Удваивает вместимость, сдвигая колонки на новые позиции"""
+        old_offsets = self.__offsets
+        capacity = self.__capacity * 2
+        new_offsets = self.__column_offsets(capacity)
+
+        self.__map.flush()
+        self.__map.close()
+        self.__file.truncate(self.__file_size(capacity))
+        self.__map = mmap.mmap(self.__file.fileno(), 0)
+        # С конца: новые позиции не меньше старых, поэтому данные не затираются
+        for name, _ in reversed(_COLUMNS):
+            self.__map.move(new_offsets[name], old_offsets[name], self.__count * _COLUMN_SIZES[name])
+
+        self.__capacity = capacity
+        self.__offsets = new_offsets
+        self.__write_header()
+
+    def __heap_bytes(self, offset: int, length: int) -> bytes:
+        if length == 0:
+            return b""
+        if offset + length > self.__heap_size:
+            raise InvalidDataError("Строка выходит за пределы кучи: файл кучи обрезан")
+        if self.__heap_map is None or offset + length > len(self.__heap_map):
+            if self.__heap_map is not None:
+                self.__heap_map.close()
+            self.__heap_map = mmap.mmap(self.__heap_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.__heap_map[offset:offset + length]
+
+    def __store_string(self, value: str, intern: bool = False) -> tuple:
+        """Дописывает строку в кучу и возвращает (смещение, длина)"""
+        if intern and value in self.__interned:
+            return self.__interned[value]
+        encoded = value.encode('utf-8')
+        self.__heap_file.seek(self.__heap_size)
+        self.__heap_file.write(encoded)
+        ref = (self.__heap_size, len(encoded))
+        self.__heap_size += len(encoded)
+        if intern:
+            self.__interned[value] = ref
+        return ref
+
+    def __replace_string(self, row: int, field: str, value: str, intern: bool = False) -> tuple:
+        """Строка для перезаписываемой строки таблицы: неизмененное значение
+        остается на месте, собственный слот строки переиспользуется, если
+        новое значение в него помещается; иначе строка дописывается в кучу
+        """
+        offset = self.__get(f'{field}_offset', row)
+        length = self.__get(f'{field}_length', row)
+        encoded = value.encode('utf-8')
+        if self.__heap_bytes(offset, length) == encoded:
+            return offset, length
+        if intern:
+            # Интернированный слот делят несколько строк, писать в него нельзя
+            return self.__store_string(value, intern=True)
+        if len(encoded) <= length:
+            self.__heap_file.seek(offset)
+            self.__heap_file.write(encoded)
+            return offset, len(encoded)
+        return self.__store_string(value)
+
+    def __column(self, name: str) -> memoryview:
+        """Представление колонки без копирования (освобождать через with)"""
+        start = self.__offsets[name]
+        size = _COLUMN_SIZES[name]
+        return memoryview(self.__map)[start:start + self.__count * size].cast(_COLUMN_FORMATS[name])
+
+    # ===== ЗАПИСЬ =====
+
+    def __write_row(self, row: int, employee, overwrite: bool = False) -> None:
+        type_name = employee.__class__.__name__
+        if type_name not in _TYPE_CODES:
+            raise InvalidDataError(f"Тип сотрудника {type_name} не поддерживается хранилищем")
+        level = getattr(employee, 'level', 'junior')
+        if level not in _LEVEL_CODES:
+            raise InvalidDataError(f"Уровень {level} не поддерживается хранилищем")
+
+        if overwrite:
+            name_offset, name_length = self.__replace_string(row, 'name', employee.name)
+            dept_offset, dept_length = self.__replace_string(row, 'department', employee.department,
+                                                             intern=True)
+        else:
+            name_offset, name_length = self.__store_string(employee.name)
+            dept_offset, dept_length = self.__store_string(employee.department, intern=True)
+
+        self.__set('id', row, employee.id)
+        self.__set('base_salary', row, float(employee.base_salary))
+        self.__set('commission_rate', row, float(getattr(employee, 'commission_rate', 0.0)))
+        self.__set('sales_amount', row, float(getattr(employee, 'sales_amount', 0.0)))
+        self.__set('name_offset', row, name_offset)
+        self.__set('name_length', row, name_length)
+        self.__set('department_offset', row, dept_offset)
+        self.__set('department_length', row, dept_length)
+        self.__set('type', row, _TYPE_CODES[type_name])
+        self.__set('level', row, _LEVEL_CODES[level])
+        self.__set('alive', row, 1)
+
+    def append(self, employee) -> int:
+        """Добавляет сотрудника в конец и возвращает номер строки"""
+        if self.__count == self.__capacity:
+            self.__grow()
+        row = self.__count
+        if self.__ids_sorted and row > 0 and employee.id <= self.__get('id', row - 1):
+            self.__ids_sorted = False
+        self.__write_row(row, employee)
+        self.__count += 1
+        self.__write_header()
+        if self.__id_rows is not None:
+            self.__id_rows[employee.id] = row
+        if self.__alive is not None:
+            self.__alive += 1
+        return row
+
+    def overwrite(self, row: int, employee) -> None:
+        """Перезаписывает строку (ID должен совпадать)"""
+        if self.__get('id', row) != employee.id:
+            raise InvalidDataError("ID сотрудника не совпадает с ID строки")
+        self.__write_row(row, employee, overwrite=True)
+
+    def delete(self, row: int) -> None:
+        """Помечает строку удаленной"""
+        if self.__get('alive', row):
+            self.__set('alive', row, 0)
+            if self.__id_rows is not None:
+                self.__id_rows.pop(self.__get('id', row), None)
+            if self.__alive is not None:
+                self.__alive -= 1
+
+    # ===== ЧТЕНИЕ =====
+
+    def __len__(self) -> int:
+        """Количество живых строк"""
+        if self.__alive is None:
+            with self.__column('alive') as alive:
+                self.__alive = sum(alive)
+        return self.__alive
+
+    @property
+    def row_count(self) -> int:
+        """Количество строк вместе с удаленными (граница номеров строк)"""
+        return self.__count
+
+    def find_row(self, employee_id: int) -> Optional[int]:
+        """Номер живой строки с данным ID или None
+
+        Пока ID добавлялись по возрастанию, используется двоичный поиск
+        прямо по колонке; иначе строится словарь ID -> строка.
+        """
+        if self.__ids_sorted:
+            with self.__column('id') as ids:
+                row = bisect_left(ids, employee_id)
+                found = row < len(ids) and ids[row] == employee_id
+            if found and self.__get('alive', row):
+                return row
+            return None
+
+        if self.__id_rows is None:
+            with self.__column('id') as ids, self.__column('alive') as alive:
+                self.__id_rows = {ids[row]: row for row in range(self.__count) if alive[row]}
+        return self.__id_rows.get(employee_id)
+
+    def read_string(self, row: int, field: str) -> str:
+        """Читает строковое поле (name или department) из кучи"""
+        offset = self.__get(f'{field}_offset', row)
+        length = self.__get(f'{field}_length', row)
+        return self.__heap_bytes(offset, length).decode('utf-8')
+
+    def read_row(self, row: int):
+        """Материализует сотрудника из строки"""
+        cls = _TYPES[self.__get('type', row)]
+        emp_id = self.__get('id', row)
+        name = self.read_string(row, 'name')
+        department = self.read_string(row, 'department')
+        base_salary = self.__get('base_salary', row)
+
+        if issubclass(cls, BaseDeveloper):
+            return cls(emp_id, name, department, base_salary, _LEVELS[self.__get('level', row)])
+        if issubclass(cls, BaseSalesperson):
+            employee = cls(emp_id, name, department, base_salary,
+                           self.__get('commission_rate', row))
+            employee.set_sales_amount(self.__get('sales_amount', row))
+            return employee
+        return cls(emp_id, name, department, base_salary)
+
+    def iter_rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[int]:
+        """Номера живых строк по порядку (в диапазоне [start, stop))"""
+        stop = self.__count if stop is None else min(stop, self.__count)
+        for row in range(start, stop):
+            if self.__get('alive', row):
+                yield row
+
+    def select_rows(self, criteria: Dict[str, Any]) -> List[int]:
+        """Номера живых строк, удовлетворяющих критериям на равенство
+
+        Колонки сканируются через memoryview: отбор идет циклами
+        compress/map без распаковки struct на каждую строку.
+
+        Args:
+            criteria: Словарь {поле: значение}, поля из COLUMN_FIELDS
+        """
+        with self.__column('alive') as alive:
+            rows = list(compress(range(self.__count), alive))
+        for field, value in criteria.items():
+            if not rows:
+                break
+            if field == 'type':
+                rows = self.__select(rows, 'type', _TYPE_CODES.get(value))
+            elif field == 'level':
+                # Уровень есть только у разработчиков
+                rows = self.__select_codes(rows, _DEVELOPER_CODES)
+                rows = self.__select(rows, 'level', _LEVEL_CODES.get(value))
+            elif field in ('name', 'department'):
+                if not isinstance(value, str):
+                    return []
+                rows = self.__select_string(rows, field, value.encode('utf-8'))
+            elif field in ('commission_rate', 'sales_amount'):
+                # Эти атрибуты есть только у продавцов
+                rows = self.__select_codes(rows, _SALESPERSON_CODES)
+                rows = self.__select(rows, field, value)
+            else:
+                rows = self.__select(rows, field, value)
+        return rows
+
+    def __select(self, rows: List[int], name: str, value) -> List[int]:
+        """Строки из rows, в которых колонка name равна value"""
+        with self.__column(name) as column:
+            return list(compress(rows, map(eq, map(column.__getitem__, rows), repeat(value))))
+
+    def __select_codes(self, rows: List[int], codes: frozenset) -> List[int]:
+        """Строки из rows, тип которых входит в codes"""
+        with self.__column('type') as types:
+            return list(compress(rows, map(codes.__contains__, map(types.__getitem__, rows))))
+
+    def __select_string(self, rows: List[int], field: str, encoded: bytes) -> List[int]:
+        """Строки из rows, строковое поле которых равно encoded
+
+        Сначала отбор по длине, затем байты из кучи сравниваются один раз
+        на смещение: интернированный отдел делят многие строки.
+        """
+        rows = self.__select(rows, f'{field}_length', len(encoded))
+        with self.__column(f'{field}_offset') as column:
+            offsets = list(map(column.__getitem__, rows))
+        matching = {offset for offset in set(offsets)
+                    if self.__heap_bytes(offset, len(encoded)) == encoded}
+        return list(compress(rows, map(matching.__contains__, offsets)))
+
+    # ===== ЖИЗНЕННЫЙ ЦИКЛ =====
+
+    def flush(self) -> None:
+        """Сбрасывает изменения на диск"""
+        self.__map.flush()
+
+    def close(self) -> None:
+        """Закрывает файлы хранилища"""
+        self.__map.flush()
+        self.__release()
+
+    def __enter__(self) -> 'ColumnarEmployeeStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
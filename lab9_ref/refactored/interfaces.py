@@ -6,11 +6,12 @@ ISP - Interface Segregation Principle
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Iterator
 
 
 class ISalaryCalculable(ABC):
     """Интерфейс для объектов, у которых можно рассчитать зарплату"""
+    __slots__ = ()
     
     @abstractmethod
     def calculate_salary(self) -> float:
@@ -24,6 +25,7 @@ class ISalaryCalculable(ABC):
 
 class IInfoProvidable(ABC):
     """Интерфейс для объектов, которые могут предоставить информацию о себе"""
+    __slots__ = ()
     
     @abstractmethod
     def get_info(self) -> str:
@@ -37,6 +39,7 @@ class IInfoProvidable(ABC):
 
 class ISkillManageable(ABC):
     """Интерфейс для управления навыками (для разработчиков)"""
+    __slots__ = ()
     
     @abstractmethod
     def add_skill(self, skill: str) -> None:
@@ -56,6 +59,7 @@ class ISkillManageable(ABC):
 
 class IBonusCalculable(ABC):
     """Интерфейс для расчета бонусов (для менеджеров)"""
+    __slots__ = ()
     
     @abstractmethod
     def calculate_bonus(self) -> float:
@@ -69,6 +73,7 @@ class IBonusCalculable(ABC):
 
 class ICommissionCalculable(ABC):
     """Интерфейс для расчета комиссий (для менеджеров по продажам)"""
+    __slots__ = ()
     
     @abstractmethod
     def calculate_commission(self) -> float:
@@ -126,6 +131,52 @@ class IEmployeeRepository(ABC):
     def find(self, criteria: dict) -> List:
         """Найти сотрудников по критериям"""
         pass
+    
+    @abstractmethod
+    def update(self, employee_id: int, employee) -> None:
+        """Обновить данные сотрудника"""
+        pass
+    
+    def iter_all(self) -> Iterator:
+        """Итератор по всем сотрудникам без копирования хранилища
+        
+        По умолчанию обходит get_all(); хранилища переопределяют
+        метод, чтобы не создавать копию списка.
+        """
+        return iter(self.get_all())
+    
+    def count(self) -> int:
+        """Получить количество сотрудников"""
+        return len(self.get_all())
+
+
+class IAsyncEmployeeRepository(ABC):
+    """Асинхронный интерфейс хранилища сотрудников (для asyncio-кода)"""
+    
+    @abstractmethod
+    async def add(self, employee) -> None:
+        """Добавить сотрудника"""
+        pass
+    
+    @abstractmethod
+    async def remove(self, employee_id: int) -> None:
+        """Удалить сотрудника по ID"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, employee_id: int):
+        """Получить сотрудника по ID"""
+        pass
+    
+    @abstractmethod
+    def get_all(self) -> AsyncIterator:
+        """Асинхронный итератор по всем сотрудникам"""
+        pass
+    
+    @abstractmethod
+    async def find(self, criteria: dict) -> List:
+        """Найти сотрудников по критериям"""
+        pass
 
 
 class IDepartmentRepository(ABC):
@@ -150,6 +201,10 @@ class IDepartmentRepository(ABC):
     def get_all(self) -> List:
         """Получить все отделы"""
         pass
+    
+    def iter_all(self) -> Iterator:
+        """Итератор по всем отделам без копирования хранилища"""
+        return iter(self.get_all())
 
 
 class IProjectRepository(ABC):
@@ -174,6 +229,10 @@ class IProjectRepository(ABC):
     def get_all(self) -> List:
         """Получить все проекты"""
         pass
+    
+    def iter_all(self) -> Iterator:
+        """Итератор по всем проектам без копирования хранилища"""
+        return iter(self.get_all())
 
 
 class IFinancialCalculator(ABC):
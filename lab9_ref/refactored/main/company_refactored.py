@@ -6,11 +6,12 @@ DIP - использует репозитории для хранилищ
 OCP - система расширяется БЕЗ изменения Company
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Iterator
 from ..validators import CompanyValidator
 from ..interfaces import IDepartmentRepository, IProjectRepository
 from ..repository import InMemoryDepartmentRepository, InMemoryProjectRepository
 from ..services import SalaryCalculator
+from ..services.report_engine import ReportEngine
 from ..exceptions import EmployeeNotFoundError, DepartmentNotFoundError
 from .department_refactored import Department
 
@@ -33,9 +34,13 @@ class DepartmentManager:
         """Получить все отделы"""
         return self.__repository.get_all()
     
+    def iter_departments(self) -> Iterator[Department]:
+        """Итератор по отделам без копирования"""
+        return self.__repository.iter_all()
+    
     def get_department_count(self) -> int:
         """Получить количество отделов"""
-        return len(self.get_all_departments())
+        return sum(1 for _ in self.iter_departments())
 
 
 class ProjectManager:
@@ -78,22 +83,31 @@ class ProjectManager:
 class FinancialCalculator:
     """SRP - финансовые расчеты отделены"""
     
-    def __init__(self):
-        pass
+    def __init__(self, payroll_engine=None):
+        """
+        Args:
+            payroll_engine: PayrollEngine для расчета по отделам
+                            (по умолчанию - calculate_total_salary отделов)
+        """
+        self.__payroll_engine = payroll_engine
     
-    def calculate_total_salary(self, employees: List) -> float:
+    def calculate_total_salary(self, employees: Iterable) -> float:
         """Рассчитать общую зарплату"""
         return sum(e.calculate_salary() for e in employees)
     
-    def calculate_total_expenses(self, departments: List[Department]) -> float:
+    def calculate_total_expenses(self, departments: Iterable[Department]) -> float:
         """Рассчитать общие расходы на зарплаты"""
+        if self.__payroll_engine is not None:
+            return self.__payroll_engine.run(departments)['total']
         total = 0
         for dept in departments:
             total += dept.calculate_total_salary()
         return total
     
-    def calculate_budget_per_department(self, departments: List[Department]) -> Dict:
+    def calculate_budget_per_department(self, departments: Iterable[Department]) -> Dict:
         """Рассчитать бюджет по отделам"""
+        if self.__payroll_engine is not None:
+            return self.__payroll_engine.run(departments)['by_department']
         return {
             dept.name: dept.calculate_total_salary()
             for dept in departments
@@ -105,18 +119,23 @@ class FinancialCalculator:
             return 0
         return (salary / total) * 100
     
-    def get_financial_report(self, departments: List[Department]) -> Dict:
-        """Получить финансовый отчет"""
-        total_expenses = self.calculate_total_expenses(departments)
-        budget_by_dept = self.calculate_budget_per_department(departments)
+    def get_financial_report(self, departments: Iterable[Department]) -> Dict:
+        """Получить финансовый отчет (зарплаты каждого отдела считаются один раз)"""
+        departments = list(departments)
+        if self.__payroll_engine is not None:
+            payroll = self.__payroll_engine.run(departments)
+            total_expenses, budget_by_dept = payroll['total'], payroll['by_department']
+        else:
+            budget_by_dept = self.calculate_budget_per_department(departments)
+            total_expenses = sum(budget_by_dept.values())
+        counts = {dept.name: dept.get_employee_count() for dept in departments}
         
         return {
             'total_salary_expenses': total_expenses,
             'budget_by_department': budget_by_dept,
             'average_salary_per_department': {
-                name: total / len(dept.get_employees()) if dept.get_employees() else 0
+                name: total / counts[name] if counts[name] else 0
                 for name, total in budget_by_dept.items()
-                for dept in departments if dept.name == name
             }
         }
 
@@ -128,17 +147,20 @@ class Company:
     DIP - использует менеджеры через интерфейсы
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, payroll_engine=None):
         """
         Args:
             name: Название компании
+            payroll_engine: PayrollEngine для расчета зарплат по отделам
         """
-        CompanyValidator.validate_company_name(name)
+        CompanyValidator.validate_name(name)
         
         self.__name = name
         self.__department_manager = DepartmentManager()
         self.__project_manager = ProjectManager()
-        self.__financial_calculator = FinancialCalculator()
+        self.__financial_calculator = FinancialCalculator(payroll_engine)
+        # Отчеты пересчитывают только отделы, изменившиеся с прошлого отчета
+        self.__report_engine = ReportEngine(payroll_engine)
     
     @property
     def name(self) -> str:
@@ -159,6 +181,10 @@ class Company:
         """Получить все отделы"""
         return self.__department_manager.get_all_departments()
     
+    def iter_departments(self) -> Iterator[Department]:
+        """Итератор по отделам без копирования"""
+        return self.__department_manager.iter_departments()
+    
     def get_department_count(self) -> int:
         """Получить количество отделов"""
         return self.__department_manager.get_department_count()
@@ -185,55 +211,51 @@ class Company:
     
     def get_total_salary_expenses(self) -> float:
         """Получить общие расходы на зарплаты"""
-        return self.__financial_calculator.calculate_total_expenses(
-            self.get_all_departments()
-        )
+        return self.__report_engine.report(self.iter_departments())['total_salary_expenses']
     
     def get_financial_report(self) -> Dict:
         """Получить финансовый отчет"""
-        return self.__financial_calculator.get_financial_report(
-            self.get_all_departments()
-        )
+        return self.__report_engine.financial_report(self.iter_departments())
     
     def get_budget_by_department(self) -> Dict:
         """Получить бюджет по отделам"""
         return self.__financial_calculator.calculate_budget_per_department(
-            self.get_all_departments()
+            self.iter_departments()
         )
     
     # ===== ИНФОРМАЦИЯ =====
     
     def get_total_employee_count(self) -> int:
         """Получить общее количество сотрудников"""
-        return sum(dept.get_employee_count() for dept in self.get_all_departments())
+        return sum(dept.get_employee_count() for dept in self.iter_departments())
     
     def get_average_salary_per_employee(self) -> float:
         """Получить среднюю зарплату на сотрудника"""
-        total_salary = self.get_total_salary_expenses()
-        total_employees = self.get_total_employee_count()
-        
-        if total_employees == 0:
-            return 0
-        return total_salary / total_employees
+        return self.__report_engine.report(self.iter_departments())['average_salary']
     
     def get_info(self) -> str:
         """Получить информацию о компании"""
-        depts = self.get_all_departments()
+        report = self.__report_engine.report(self.iter_departments())
         return (f"Компания: {self.__name}\n"
-                f"Отделов: {self.get_department_count()}\n"
-                f"Сотрудников: {self.get_total_employee_count()}\n"
-                f"Расходы на зарплату: {self.get_total_salary_expenses():.2f}\n"
-                f"Средняя зарплата: {self.get_average_salary_per_employee():.2f}")
+                f"Отделов: {report['departments']}\n"
+                f"Сотрудников: {report['total_employees']}\n"
+                f"Расходы на зарплату: {report['total_salary_expenses']:.2f}\n"
+                f"Средняя зарплата: {report['average_salary']:.2f}")
     
     def get_full_report(self) -> Dict[str, Any]:
-        """Получить полный отчет о компании"""
+        """Получить полный отчет о компании (один проход по отделам, кэш по версиям)"""
+        report = self.__report_engine.report(self.iter_departments())
         return {
             'company': self.__name,
-            'departments': len(self.get_all_departments()),
-            'total_employees': self.get_total_employee_count(),
-            'financial_report': self.get_financial_report(),
+            'departments': report['departments'],
+            'total_employees': report['total_employees'],
+            'financial_report': {
+                'total_salary_expenses': report['total_salary_expenses'],
+                'budget_by_department': report['budget_by_department'],
+                'average_salary_per_department': report['average_salary_per_department']
+            },
             'projects': self.get_projects(),
-            'average_salary': self.get_average_salary_per_employee()
+            'average_salary': report['average_salary']
         }
     
     # ===== ОПЕРАТОРЫ =====
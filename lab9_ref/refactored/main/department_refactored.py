@@ -6,7 +6,7 @@ ISP - реализует только нужные интерфейсы
 DIP - использует IEmployeeRepository вместо прямого списка
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from ..validators import DepartmentValidator
 from ..interfaces import IEmployeeRepository
 from ..repository import InMemoryEmployeeRepository
@@ -29,6 +29,9 @@ class Department:
         self.__name = name
         # DIP - используем интерфейс, а не конкретный класс
         self.__repository = repository or InMemoryEmployeeRepository()
+        self.__version = 0
+        # Наблюдатели за переименованием (хранилища отделов по названию)
+        self.__observers: List[Any] = []
     
     @property
     def name(self) -> str:
@@ -37,9 +40,53 @@ class Department:
     
     @name.setter
     def name(self, value: str) -> None:
-        """Устанавливает название отдела"""
+        """Устанавливает название отдела
+        
+        Наблюдатели могут отклонить новое название исключением (например,
+        оно уже занято в хранилище) - тогда название остается прежним.
+        """
         DepartmentValidator.validate_name(value)
+        old_name = self.__name
+        if value == old_name:
+            return
         self.__name = value
+        notified = []
+        try:
+            for observer in list(self.__observers):
+                observer.on_department_renamed(self, old_name)
+                notified.append(observer)
+        except Exception:
+            self.__name = old_name
+            for observer in reversed(notified):
+                observer.on_department_renamed(self, value)
+            raise
+        self.__version += 1
+    
+    def add_observer(self, observer) -> None:
+        """Подписать наблюдателя с методом on_department_renamed(department, old_name)"""
+        self.__observers.append(observer)
+    
+    def remove_observer(self, observer) -> None:
+        """Отписать наблюдателя от переименований"""
+        self.__observers.remove(observer)
+    
+    @property
+    def version(self) -> int:
+        """Номер версии: растет при любом изменении состава, названия или зарплат
+        
+        Зарплаты отслеживаются у сотрудников, добавленных через add_employee.
+        Если отдел изменили в обход (напрямую через репозиторий или объект
+        стратегии бонуса), вызовите mark_changed().
+        """
+        return self.__version
+    
+    def mark_changed(self) -> None:
+        """Отметить отдел измененным (сбросить кэши отчетов по нему)"""
+        self.__version += 1
+    
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Уведомление от сотрудника отдела об изменении зарплаты"""
+        self.__version += 1
     
     # ===== УПРАВЛЕНИЕ СОТРУДНИКАМИ =====
     
@@ -52,13 +99,23 @@ class Department:
                 entity_type="Сотрудник",
                 entity_id=employee.id
             )
+        if hasattr(employee, 'add_salary_observer'):
+            employee.add_salary_observer(self)
+        self.__version += 1
     
     def remove_employee(self, employee_id: int) -> None:
         """Удалить сотрудника по ID"""
+        employee = self.__repository.get_by_id(employee_id)
         try:
             self.__repository.remove(employee_id)
         except EmployeeNotFoundError:
             raise EmployeeNotFoundError(employee_id)
+        try:
+            employee.remove_salary_observer(self)
+        except (AttributeError, ValueError):
+            # Сотрудник без наблюдателей или копия из внешнего хранилища
+            pass
+        self.__version += 1
     
     def get_employee(self, employee_id: int):
         """Получить сотрудника по ID"""
@@ -68,6 +125,10 @@ class Department:
         """Получить всех сотрудников отдела"""
         return self.__repository.get_all()
     
+    def iter_employees(self) -> Iterator:
+        """Итератор по сотрудникам отдела без копирования"""
+        return self.__repository.iter_all()
+    
     def find_employees(self, criteria: Dict) -> List:
         """Найти сотрудников по критериям"""
         return self.__repository.find(criteria)
@@ -76,7 +137,7 @@ class Department:
     
     def get_employee_count(self) -> int:
         """Получить количество сотрудников"""
-        return len(self.get_employees())
+        return self.__repository.count()
     
     def has_employees(self) -> bool:
         """Проверить, есть ли сотрудники в отделе"""
@@ -84,12 +145,12 @@ class Department:
     
     def get_employee_ids(self) -> List[int]:
         """Получить список ID сотрудников"""
-        return [emp.id for emp in self.get_employees()]
+        return [emp.id for emp in self.iter_employees()]
     
     def get_employee_count_by_type(self) -> Dict[str, int]:
         """Получить статистику по типам сотрудников"""
         counts = {}
-        for emp in self.get_employees():
+        for emp in self.iter_employees():
             emp_type = emp.__class__.__name__
             counts[emp_type] = counts.get(emp_type, 0) + 1
         return counts
@@ -98,7 +159,7 @@ class Department:
     
     def calculate_total_salary(self) -> float:
         """Рассчитать общую зарплату всех сотрудников"""
-        return SalaryCalculator.calculate_total_salary(self.get_employees())
+        return SalaryCalculator.calculate_total_salary(self.iter_employees())
     
     def calculate_average_salary(self) -> float:
         """Рассчитать среднюю зарплату"""
@@ -125,7 +186,7 @@ class Department:
         """Конвертировать в словарь"""
         return {
             'name': self.__name,
-            'employees': [emp.to_dict() for emp in self.get_employees()],
+            'employees': [emp.to_dict() for emp in self.iter_employees()],
             'count': self.get_employee_count(),
             'total_salary': self.calculate_total_salary()
         }
@@ -146,7 +207,7 @@ class Department:
     
     def __iter__(self):
         """Итератор по сотрудникам"""
-        return iter(self.get_employees())
+        return self.iter_employees()
     
     def __getitem__(self, index: int):
         """Доступ по индексу"""
@@ -164,4 +225,4 @@ class Department:
     
     def __contains__(self, employee) -> bool:
         """Проверка наличия сотрудника"""
-        return any(e.id == employee.id for e in self.get_employees())
+        return any(e.id == employee.id for e in self.iter_employees())
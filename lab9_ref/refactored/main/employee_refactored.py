@@ -4,16 +4,29 @@
 SRP - валидация отделена в отдельный класс
 LSP - правильная иерархия наследования
 ISP - реализует только нужные интерфейсы
+
+Base* классы хранят поля в __slots__ и содержат все поведение.
+От них параллельно наследуют Compact* (без __dict__) и
+Employee/Developer/Manager/Salesperson (с __dict__).
+
+calculate_salary() кэширует результат _compute_salary() в экземпляре;
+кэш сбрасывается при изменении любого поля, от которого зависит зарплата.
+Все такие поля объявлены свойствами (в том числе показатели менеджера,
+которые читают стратегии бонуса); прочие атрибуты на зарплату не влияют.
 """
 
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
+from core.checksum import columns_checksum
 from ..validators import EmployeeValidator
+from ..exceptions import InvalidDataError
 from ..interfaces import ISalaryCalculable, IInfoProvidable, ISkillManageable, IBonusCalculable, ICommissionCalculable
 
 
 class AbstractEmployee(ISalaryCalculable, IInfoProvidable, ABC):
     """Абстрактный класс для всех сотрудников"""
+    __slots__ = ('__id', '__name', '__department', '__base_salary', '__salary_observers',
+                 '__salary')
     
     def __init__(self, id_empl: int, name: str, department: str, base_salary: float):
         """
@@ -34,6 +47,64 @@ class AbstractEmployee(ISalaryCalculable, IInfoProvidable, ABC):
         self.__department = department
         self.__base_salary = base_salary
     
+    def _init_fields(self) -> None:
+        """Поля подкласса сверх базовых (вызывается из __init__ и from_trusted_rows)"""
+    
+    # ===== ДОВЕРЕННАЯ ЗАГРУЗКА =====
+    
+    @staticmethod
+    def __columns(rows: list) -> list:
+        columns = list(zip(*rows)) if rows else [(), (), (), ()]
+        if len(columns) < 4:
+            raise InvalidDataError("Строка сотрудника: (id, name, department, base_salary, ...)")
+        return columns
+    
+    @staticmethod
+    def __columns_checksum(columns: list) -> int:
+        try:
+            return columns_checksum(columns)
+        except (TypeError, OverflowError) as e:
+            raise InvalidDataError(f"Строка сотрудника: {e}")
+    
+    @staticmethod
+    def rows_checksum(rows) -> int:
+        """Контрольная сумма строк (id, name, department, base_salary, *аргументы подкласса)
+        
+        Дополнительные аргументы учитываются через repr(), поэтому это должны
+        быть строки и числа (уровень, ставка комиссии).
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        return AbstractEmployee.__columns_checksum(AbstractEmployee.__columns(rows))
+    
+    @classmethod
+    def from_trusted_rows(cls, rows, checksum: int) -> List['AbstractEmployee']:
+        """Создать сотрудников из проверенных строк без EmployeeValidator
+        
+        Строка повторяет аргументы конструктора: (id, name, department,
+        base_salary, *дополнительные). Строки целиком сверяются с
+        rows_checksum(), поэтому поврежденные данные не пройдут молча.
+        
+        Args:
+            rows: Строки сотрудников одного класса
+            checksum: Контрольная сумма, сохраненная вместе со строками
+        
+        Returns:
+            Список сотрудников в порядке строк
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if AbstractEmployee.__columns_checksum(AbstractEmployee.__columns(rows)) != checksum:
+            raise InvalidDataError("Строки сотрудников не совпадают с контрольной суммой")
+        employees = []
+        for id_empl, name, department, base_salary, *extra in rows:
+            employee = cls.__new__(cls)
+            employee.__id = id_empl
+            employee.__name = name
+            employee.__department = department
+            employee.__base_salary = base_salary
+            employee._init_fields(*extra)
+            employees.append(employee)
+        return employees
+    
     @property
     def id(self) -> int:
         return self.__id
@@ -50,11 +121,66 @@ class AbstractEmployee(ISalaryCalculable, IInfoProvidable, ABC):
     def base_salary(self) -> float:
         return self.__base_salary
     
-    @abstractmethod
     def calculate_salary(self) -> float:
-        """Рассчитать зарплату"""
+        """Рассчитать зарплату (повторные вызовы берут значение из кэша)"""
+        try:
+            return self.__salary
+        except AttributeError:
+            salary = self.__salary = self._compute_salary()
+            return salary
+    
+    @abstractmethod
+    def _compute_salary(self) -> float:
+        """Рассчитать зарплату без кэша"""
         pass
     
+    def invalidate_salary(self) -> None:
+        """Сбросить кэш зарплаты
+        
+        Нужен, если зарплата зависит от того, что экземпляр не видит,
+        например, если поменяли параметры объекта стратегии бонуса.
+        """
+        try:
+            del self.__salary
+        except AttributeError:
+            pass
+    
+    # ===== НАБЛЮДЕНИЕ ЗА ЗАРПЛАТОЙ =====
+    
+    def add_salary_observer(self, observer) -> None:
+        """Подписать наблюдателя с методом on_salary_changed(employee, old_salary, new_salary)
+        
+        Наблюдатель с методом on_employee_changed(employee) получает его после
+        каждого изменения поля, даже если зарплата не изменилась (например,
+        индексы по полям); on_salary_changed у такого наблюдателя необязателен.
+        """
+        try:
+            observers = self.__salary_observers
+        except AttributeError:  # список создается при первой подписке
+            observers = self.__salary_observers = []
+        observers.append(observer)
+    
+    def remove_salary_observer(self, observer) -> None:
+        """Отписать наблюдателя"""
+        self.__salary_observers.remove(observer)
+    
+    def _notify_salary_changed(self, old_salary: float) -> None:
+        """Сбросить кэш и сообщить наблюдателям о новой зарплате (вызывается после изменения полей)"""
+        self.invalidate_salary()
+        try:
+            observers = self.__salary_observers
+        except AttributeError:
+            return
+        if not observers:
+            return
+        new_salary = self.calculate_salary()
+        for observer in list(observers):
+            on_changed = getattr(observer, 'on_employee_changed', None)
+            if on_changed is not None:
+                on_changed(self)
+            if new_salary != old_salary and hasattr(observer, 'on_salary_changed'):
+                observer.on_salary_changed(self, old_salary, new_salary)
+    
     @abstractmethod
     def get_info(self) -> str:
         """Получить информацию о сотруднике"""
@@ -77,10 +203,11 @@ class AbstractEmployee(ISalaryCalculable, IInfoProvidable, ABC):
         return self.__str__()
 
 
-class Employee(AbstractEmployee):
-    """Обычный сотрудник (базовый класс)"""
+class BaseEmployee(AbstractEmployee):
+    """Обычный сотрудник: поля в слотах, общая основа Employee и CompactEmployee"""
+    __slots__ = ()
     
-    def calculate_salary(self) -> float:
+    def _compute_salary(self) -> float:
         """Зарплата = базовая зарплата"""
         return self.base_salary
     
@@ -92,8 +219,12 @@ class Employee(AbstractEmployee):
                 f"Зарплата: {self.calculate_salary():.2f}")
 
 
-class Developer(AbstractEmployee, ISkillManageable):
-    """Разработчик (Developer + Skills)"""
+class BaseDeveloper(AbstractEmployee, ISkillManageable):
+    """Разработчик (Developer + Skills): общая основа Developer и CompactDeveloper"""
+    __slots__ = ('__level', '__skills')
+    
+    # Множитель зарплаты по уровню (неизвестный уровень - 1.0)
+    LEVEL_MULTIPLIERS = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
     
     def __init__(self, id_empl: int, name: str, department: str, 
                  base_salary: float, level: str = "junior"):
@@ -102,13 +233,25 @@ class Developer(AbstractEmployee, ISkillManageable):
             level: Уровень (junior/middle/senior)
         """
         super().__init__(id_empl, name, department, base_salary)
-        self.level = level
+        self._init_fields(level)
+    
+    def _init_fields(self, level: str = "junior") -> None:
+        self.__level = level
         self.__skills: List[str] = []
     
-    def calculate_salary(self) -> float:
+    @property
+    def level(self) -> str:
+        return self.__level
+    
+    @level.setter
+    def level(self, value: str) -> None:
+        old_salary = self.calculate_salary()
+        self.__level = value
+        self._notify_salary_changed(old_salary)
+    
+    def _compute_salary(self) -> float:
         """Зарплата зависит от уровня"""
-        multipliers = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
-        return self.base_salary * multipliers.get(self.level, 1.0)
+        return self.base_salary * self.LEVEL_MULTIPLIERS.get(self.level, 1.0)
     
     def add_skill(self, skill: str) -> None:
         """Добавить навык"""
@@ -141,8 +284,9 @@ class Developer(AbstractEmployee, ISkillManageable):
         return data
 
 
-class Manager(AbstractEmployee, IBonusCalculable):
-    """Менеджер (Manager + Bonus)"""
+class BaseManager(AbstractEmployee, IBonusCalculable):
+    """Менеджер (Manager + Bonus): общая основа Manager и CompactManager"""
+    __slots__ = ('__bonus_strategy', '__projects_count', '__achievement')
     
     def __init__(self, id_empl: int, name: str, department: str, 
                  base_salary: float, bonus_strategy=None):
@@ -151,10 +295,48 @@ class Manager(AbstractEmployee, IBonusCalculable):
             bonus_strategy: Стратегия расчета бонуса (Strategy Pattern)
         """
         super().__init__(id_empl, name, department, base_salary)
+        self._init_fields(bonus_strategy)
+    
+    def _init_fields(self, bonus_strategy=None) -> None:
         from ..strategies.bonus_strategy import NoBonusStrategy
-        self.bonus_strategy = bonus_strategy or NoBonusStrategy()
+        self.__bonus_strategy = bonus_strategy or NoBonusStrategy()
+        # Показатели, которые читают стратегии бонуса (по проектам и по производительности)
+        self.__projects_count = 0
+        self.__achievement = 0.8
     
-    def calculate_salary(self) -> float:
+    @property
+    def bonus_strategy(self):
+        return self.__bonus_strategy
+    
+    @bonus_strategy.setter
+    def bonus_strategy(self, strategy) -> None:
+        old_salary = self.calculate_salary()
+        self.__bonus_strategy = strategy
+        self._notify_salary_changed(old_salary)
+    
+    @property
+    def projects_count(self) -> int:
+        """Количество завершенных проектов (ProjectBonusStrategy)"""
+        return self.__projects_count
+    
+    @projects_count.setter
+    def projects_count(self, value: int) -> None:
+        old_salary = self.calculate_salary()
+        self.__projects_count = value
+        self._notify_salary_changed(old_salary)
+    
+    @property
+    def achievement(self) -> float:
+        """Доля выполнения целей, 0-1 и выше (PerformanceBonusStrategy)"""
+        return self.__achievement
+    
+    @achievement.setter
+    def achievement(self, value: float) -> None:
+        old_salary = self.calculate_salary()
+        self.__achievement = value
+        self._notify_salary_changed(old_salary)
+    
+    def _compute_salary(self) -> float:
         """Зарплата = базовая + бонус"""
         return self.base_salary + self.calculate_bonus()
     
@@ -183,8 +365,9 @@ class Manager(AbstractEmployee, IBonusCalculable):
         return data
 
 
-class Salesperson(AbstractEmployee, ICommissionCalculable):
-    """Менеджер по продажам (Salesperson + Commission)"""
+class BaseSalesperson(AbstractEmployee, ICommissionCalculable):
+    """Менеджер по продажам (Salesperson + Commission): общая основа Salesperson и CompactSalesperson"""
+    __slots__ = ('__commission_rate', '__sales_amount')
     
     def __init__(self, id_empl: int, name: str, department: str, 
                  base_salary: float, commission_rate: float = 0.05):
@@ -193,10 +376,33 @@ class Salesperson(AbstractEmployee, ICommissionCalculable):
             commission_rate: Процент комиссии (0.05 = 5%)
         """
         super().__init__(id_empl, name, department, base_salary)
-        self.commission_rate = commission_rate
-        self.sales_amount = 0.0
+        self._init_fields(commission_rate)
     
-    def calculate_salary(self) -> float:
+    def _init_fields(self, commission_rate: float = 0.05) -> None:
+        self.__commission_rate = commission_rate
+        self.__sales_amount = 0.0
+    
+    @property
+    def commission_rate(self) -> float:
+        return self.__commission_rate
+    
+    @commission_rate.setter
+    def commission_rate(self, value: float) -> None:
+        old_salary = self.calculate_salary()
+        self.__commission_rate = value
+        self._notify_salary_changed(old_salary)
+    
+    @property
+    def sales_amount(self) -> float:
+        return self.__sales_amount
+    
+    @sales_amount.setter
+    def sales_amount(self, value: float) -> None:
+        old_salary = self.calculate_salary()
+        self.__sales_amount = value
+        self._notify_salary_changed(old_salary)
+    
+    def _compute_salary(self) -> float:
         """Зарплата = базовая + комиссия"""
         return self.base_salary + self.calculate_commission()
     
@@ -226,3 +432,43 @@ class Salesperson(AbstractEmployee, ICommissionCalculable):
         data['commission_rate'] = self.commission_rate
         data['sales_amount'] = self.sales_amount
         return data
+
+
+# Варианты без __dict__: произвольные атрибуты экземпляру добавить нельзя
+
+class CompactEmployee(BaseEmployee):
+    """Обычный сотрудник (базовый класс) без __dict__"""
+    __slots__ = ()
+
+
+class CompactDeveloper(BaseDeveloper):
+    """Разработчик (Developer + Skills) без __dict__"""
+    __slots__ = ()
+
+
+class CompactManager(BaseManager):
+    """Менеджер (Manager + Bonus) без __dict__"""
+    __slots__ = ()
+
+
+class CompactSalesperson(BaseSalesperson):
+    """Менеджер по продажам (Salesperson + Commission) без __dict__"""
+    __slots__ = ()
+
+
+# Варианты с __dict__: допускают дополнительные атрибуты экземпляра
+
+class Employee(BaseEmployee):
+    """Обычный сотрудник (базовый класс)"""
+
+
+class Developer(BaseDeveloper):
+    """Разработчик (Developer + Skills)"""
+
+
+class Manager(BaseManager):
+    """Менеджер (Manager + Bonus)"""
+
+
+class Salesperson(BaseSalesperson):
+    """Менеджер по продажам (Salesperson + Commission)"""
@@ -0,0 +1,189 @@
+# refactored/query.py
+"""
+Компиляция критериев поиска в предикат
+
+Критерии - словарь {поле[__оператор]: значение}:
+    {'department': 'IT'}                 равенство
+    {'base_salary__gte': 50000}          диапазон (gt, gte, lt, lte)
+    {'level__in': ['middle', 'senior']}  принадлежность множеству
+    {'name__startswith': 'Al'}           префикс строки
+    {'department__ne': 'HR'}             неравенство
+    {'type': 'Developer'}                имя класса (псевдополе)
+
+Критерии разбираются один раз и превращаются в замыкание;
+скомпилированные запросы кэшируются, поэтому повторяющиеся фильтры
+не платят за разбор ключей и getattr по имени.
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .exceptions import InvalidDataError
+
+# Оператор -> функция сравнения (значение атрибута, значение критерия)
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'in': lambda actual, expected: actual in expected,
+    'startswith': lambda actual, expected: isinstance(actual, str) and actual.startswith(expected),
+}
+
+OPERATORS = frozenset(_COMPARATORS)
+
+# Сколько скомпилированных запросов хранить
+_CACHE_SIZE = 256
+
+# Псевдополе: имя класса объекта
+TYPE_FIELD = 'type'
+
+
+def _type_name(obj) -> str:
+    return obj.__class__.__name__
+
+
+def field_getter(field: str) -> Callable[[Any], Any]:
+    """Функция чтения поля (AttributeError, если поля нет)"""
+    if field == TYPE_FIELD:
+        return _type_name
+    return operator.attrgetter(field)
+
+
+class Condition(NamedTuple):
+    """Одно условие: поле, оператор, значение"""
+    field: str
+    op: str
+    value: Any
+
+
+def parse_key(key: str) -> Tuple[str, str]:
+    """'base_salary__gte' -> ('base_salary', 'gte'); без суффикса - равенство"""
+    field, sep, op = key.rpartition('__')
+    if sep and field and op in OPERATORS:
+        return field, op
+    return key, 'eq'
+
+
+def parse_criteria(criteria: Dict[str, Any]) -> Tuple[Condition, ...]:
+    """Разбирает словарь критериев в условия"""
+    conditions = []
+    for key, value in criteria.items():
+        field, op = parse_key(key)
+        if op == 'in':
+            if isinstance(value, (str, bytes)) or not hasattr(value, '__iter__'):
+                raise InvalidDataError(f"Критерий {key} ожидает коллекцию значений")
+            try:
+                value = frozenset(value)
+            except TypeError:
+                value = tuple(value)
+        elif op == 'startswith' and not isinstance(value, str):
+            raise InvalidDataError(f"Критерий {key} ожидает строку")
+        conditions.append(Condition(field, op, value))
+    return tuple(conditions)
+
+
+class CompiledQuery:
+    """Скомпилированный запрос: условия и готовый предикат"""
+
+    def __init__(self, conditions: Tuple[Condition, ...]):
+        self.conditions = conditions
+        self.predicate = self.__compile(conditions)
+
+    @staticmethod
+    def __compile(conditions: Tuple[Condition, ...]) -> Callable[[Any], bool]:
+        if not conditions:
+            return lambda obj: True
+
+        equalities = [c for c in conditions if c.op == 'eq']
+        others = [c for c in conditions if c.op != 'eq']
+
+        # Все равенства проверяются одним attrgetter и сравнением кортежей
+        if equalities:
+            eq_fields = [c.field for c in equalities]
+            eq_expected = tuple(c.value for c in equalities)
+            if len(equalities) == 1:
+                eq_getter = field_getter(eq_fields[0])
+                eq_expected = eq_expected[0]
+            elif TYPE_FIELD in eq_fields:
+                getters = [field_getter(field) for field in eq_fields]
+                eq_getter = lambda obj: tuple(getter(obj) for getter in getters)
+            else:
+                eq_getter = operator.attrgetter(*eq_fields)
+        checks = [(field_getter(c.field), _COMPARATORS[c.op], c.value) for c in others]
+
+        if not checks:
+            def predicate(obj) -> bool:
+                try:
+                    return eq_getter(obj) == eq_expected
+                except AttributeError:
+                    return False
+            return predicate
+
+        def predicate(obj) -> bool:
+            try:
+                if equalities and eq_getter(obj) != eq_expected:
+                    return False
+                for getter, compare, expected in checks:
+                    if not compare(getter(obj), expected):
+                        return False
+                return True
+            except (AttributeError, TypeError):
+                # нет атрибута или несравнимые типы (например, None >= 100)
+                return False
+        return predicate
+
+    def __call__(self, obj) -> bool:
+        return self.predicate(obj)
+
+    def filter(self, items) -> List[Any]:
+        """Отобрать подходящие объекты"""
+        return list(filter(self.predicate, items))
+
+    def index_lookups(self, indexed_fields) -> List[Condition]:
+        """Условия eq/in по полям, для которых у хранилища есть индекс"""
+        return [c for c in self.conditions
+                if c.field in indexed_fields and c.op in ('eq', 'in')]
+
+
+_cache: Dict[Any, CompiledQuery] = {}
+
+
+def _cache_key(criteria: Dict[str, Any]) -> Optional[tuple]:
+    items = []
+    for key, value in criteria.items():
+        if isinstance(value, (list, set, frozenset, tuple)):
+            value = (type(value).__name__, tuple(value))
+        items.append((key, type(value).__name__, value))
+    key = tuple(items)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def compile_criteria(criteria: Dict[str, Any]) -> CompiledQuery:
+    """
+    Компилирует критерии в запрос (с кэшированием)
+
+    Args:
+        criteria: Словарь критериев (см. описание модуля)
+
+    Returns:
+        CompiledQuery с предикатом query.predicate(obj) -> bool
+    """
+    key = _cache_key(criteria)
+    if key is not None:
+        query = _cache.get(key)
+        if query is not None:
+            return query
+
+    query = CompiledQuery(parse_criteria(criteria))
+    if key is not None:
+        if len(_cache) >= _CACHE_SIZE:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = query
+    return query
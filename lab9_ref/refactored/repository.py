@@ -5,44 +5,200 @@ Repository Pattern для управления хранилищем сотруд
 Система зависит от интерфейса, а не от конкретной реализации
 """
 
-from typing import List, Optional, Dict, Any
+import json
+import sqlite3
+import sys
+from operator import itemgetter
+from typing import List, Optional, Dict, Any, Iterable, Iterator
+from core.exceptions import DatabaseError as CoreDatabaseError
+from core.migrations import explain_query_plan, migrate
 from .interfaces import IEmployeeRepository, IDepartmentRepository, IProjectRepository
-from .exceptions import DuplicateIdError, EmployeeNotFoundError, DepartmentNotFoundError
+from .exceptions import (
+    DuplicateIdError, EmployeeNotFoundError, DepartmentNotFoundError, ProjectNotFoundError, DatabaseError
+)
+from .query import compile_criteria, field_getter, parse_criteria, parse_key
+
+
+class _SecondaryIndexes:
+    """Вторичные индексы: поле -> значение -> {первичный ключ: объект}
+    
+    Поле 'type' индексирует имя класса объекта. Объекты без поля
+    или с нехэшируемым значением в индекс поля не попадают.
+    Для каждого ключа запоминаются значения, под которыми объект
+    проиндексирован, поэтому удаление и перенос не читают объект заново.
+    """
+    
+    def __init__(self, fields: Iterable[str] = ()):
+        self.__indexes: Dict[str, Dict[Any, Dict[Any, Any]]] = {field: {} for field in fields}
+        # ключ -> {поле: значение, под которым объект лежит в индексе}
+        self.__values: Dict[Any, Dict[str, Any]] = {}
+    
+    @property
+    def fields(self) -> frozenset:
+        return frozenset(self.__indexes)
+    
+    def add_field(self, field: str, items: Iterable[tuple]) -> None:
+        """Создать индекс по полю для уже хранимых пар (ключ, объект)"""
+        if field in self.__indexes:
+            return
+        self.__indexes[field] = {}
+        for key, obj in items:
+            self.__insert_into(field, key, obj)
+    
+    def __insert_into(self, field: str, key, obj) -> None:
+        try:
+            value = field_getter(field)(obj)
+            self.__indexes[field].setdefault(value, {})[key] = obj
+        except (AttributeError, TypeError):
+            return
+        self.__values.setdefault(key, {})[field] = value
+    
+    def __remove_from(self, field: str, key) -> None:
+        values = self.__values.get(key)
+        if values is None or field not in values:
+            return
+        value = values.pop(field)
+        if not values:
+            del self.__values[key]
+        index = self.__indexes[field]
+        bucket = index[value]
+        del bucket[key]
+        if not bucket:
+            del index[value]
+    
+    def insert(self, key, obj) -> None:
+        for field in self.__indexes:
+            self.__insert_into(field, key, obj)
+    
+    def discard(self, key) -> None:
+        """Убрать ключ из всех индексов (по запомненным значениям)"""
+        for field in self.__indexes:
+            self.__remove_from(field, key)
+    
+    def move(self, field: str, key, obj) -> None:
+        """Перенести объект в индексе поля по его текущему значению"""
+        if field not in self.__indexes:
+            return
+        self.__remove_from(field, key)
+        self.__insert_into(field, key, obj)
+    
+    def refresh(self, key, obj) -> None:
+        """Перенести объект во всех индексах по текущим значениям полей"""
+        self.discard(key)
+        self.insert(key, obj)
+    
+    def lookup(self, field: str, value) -> Dict[Any, Any]:
+        """Объекты с полем, равным value ({} если таких нет)"""
+        try:
+            return self.__indexes[field].get(value, {})
+        except TypeError:
+            return {}
+    
+    def candidates(self, query) -> Optional[List[Dict[Any, Any]]]:
+        """Наименьший набор корзин индекса, покрывающий условия eq/in запроса
+        
+        Returns:
+            Список корзин {ключ: объект} или None, если индексы не помогают
+        """
+        best = None
+        best_size = None
+        for condition in query.index_lookups(self.__indexes):
+            values = [condition.value] if condition.op == 'eq' else condition.value
+            try:
+                buckets = [self.__indexes[condition.field][value]
+                           for value in values if value in self.__indexes[condition.field]]
+            except TypeError:
+                continue
+            size = sum(len(bucket) for bucket in buckets)
+            if best is None or size < best_size:
+                best, best_size = buckets, size
+        return best
 
 
 class InMemoryEmployeeRepository(IEmployeeRepository):
-    """Хранилище сотрудников в памяти"""
+    """Хранилище сотрудников в памяти
     
-    def __init__(self):
-        self.__employees: List[Any] = []
+    Сотрудники хранятся в словаре по ID (в порядке добавления).
+    По желанию - вторичные индексы по полям (например, department, type, level),
+    которые find() использует автоматически. Сотрудники с add_salary_observer()
+    сами сообщают об изменении полей (on_employee_changed), и индексы
+    переносят их сразу; для остальных объектов после изменения поля
+    вызовите reindex().
+    """
+    
+    def __init__(self, indexed_fields: Iterable[str] = ()):
+        """
+        Args:
+            indexed_fields: Поля для вторичных индексов
+        """
+        self.__employees: Dict[int, Any] = {}
+        self.__positions: Dict[int, int] = {}
+        self.__next_position = 0
+        self.__indexes = _SecondaryIndexes(indexed_fields)
+    
+    @property
+    def indexed_fields(self) -> frozenset:
+        """Поля со вторичными индексами"""
+        return self.__indexes.fields
+    
+    def add_index(self, field: str) -> None:
+        """Создать вторичный индекс по полю"""
+        watching = bool(self.__indexes.fields)
+        self.__indexes.add_field(field, self.__employees.items())
+        if not watching:
+            for employee in self.__employees.values():
+                self.__watch(employee)
+    
+    def __watch(self, employee) -> None:
+        # Без индексов подписка не нужна: find() читает поля при каждом вызове
+        if self.__indexes.fields and hasattr(employee, 'add_salary_observer'):
+            employee.add_salary_observer(self)
+    
+    def __unwatch(self, employee) -> None:
+        if self.__indexes.fields and hasattr(employee, 'remove_salary_observer'):
+            try:
+                employee.remove_salary_observer(self)
+            except ValueError:
+                pass
+    
+    def on_employee_changed(self, employee) -> None:
+        """Уведомление от сотрудника: перенести его в индексах по новым значениям полей"""
+        if self.__employees.get(employee.id) is employee:
+            self.__indexes.refresh(employee.id, employee)
     
     def add(self, employee) -> None:
         """Добавить сотрудника"""
-        if any(e.id == employee.id for e in self.__employees):
+        if employee.id in self.__employees:
             raise DuplicateIdError(
                 entity_type="Сотрудник",
                 entity_id=employee.id
             )
-        self.__employees.append(employee)
+        self.__employees[employee.id] = employee
+        self.__positions[employee.id] = self.__next_position
+        self.__next_position += 1
+        self.__indexes.insert(employee.id, employee)
+        self.__watch(employee)
     
     def remove(self, employee_id: int) -> None:
         """Удалить сотрудника по ID"""
-        for i, emp in enumerate(self.__employees):
-            if emp.id == employee_id:
-                del self.__employees[i]
-                return
-        raise EmployeeNotFoundError(employee_id)
+        employee = self.__employees.pop(employee_id, None)
+        if employee is None:
+            raise EmployeeNotFoundError(employee_id)
+        del self.__positions[employee_id]
+        self.__indexes.discard(employee_id)
+        self.__unwatch(employee)
     
     def get_by_id(self, employee_id: int) -> Optional[Any]:
         """Получить сотрудника по ID"""
-        for emp in self.__employees:
-            if emp.id == employee_id:
-                return emp
-        return None
+        return self.__employees.get(employee_id)
     
     def get_all(self) -> List[Any]:
         """Получить всех сотрудников"""
-        return self.__employees.copy()
+        return list(self.__employees.values())
+    
+    def iter_all(self) -> Iterator[Any]:
+        """Итератор по сотрудникам без копирования (хранилище нельзя менять во время обхода)"""
+        return iter(self.__employees.values())
     
     def find(self, criteria: Dict[str, Any]) -> List[Any]:
         """Найти сотрудников по критериям
@@ -50,146 +206,542 @@ class InMemoryEmployeeRepository(IEmployeeRepository):
         Args:
             criteria: Словарь с критериями поиска
                       {'department': 'IT', 'level': 'senior'}
+                      {'base_salary__gte': 50000, 'level__in': ['middle', 'senior']}
+                      (операторы - см. refactored/query.py)
         
         Returns:
-            Список найденных сотрудников
-        """
-        results = []
-        for emp in self.__employees:
-            match = True
-            for key, value in criteria.items():
-                if not hasattr(emp, key) or getattr(emp, key) != value:
-                    match = False
-                    break
-            if match:
-                results.append(emp)
-        return results
+            Список найденных сотрудников (в порядке добавления)
+        """
+        query = compile_criteria(criteria)
+        buckets = self.__indexes.candidates(query)
+        if buckets is None:
+            return query.filter(self.__employees.values())
+        
+        found = [emp for bucket in buckets for emp in bucket.values() if query.predicate(emp)]
+        found.sort(key=lambda emp: self.__positions[emp.id])
+        return found
     
     def update(self, employee_id: int, employee) -> None:
         """Обновить данные сотрудника"""
-        for i, emp in enumerate(self.__employees):
-            if emp.id == employee_id:
-                self.__employees[i] = employee
-                return
-        raise EmployeeNotFoundError(employee_id)
+        old = self.__employees.get(employee_id)
+        if old is None:
+            raise EmployeeNotFoundError(employee_id)
+        self.__indexes.discard(employee_id)
+        self.__unwatch(old)
+        self.__employees[employee_id] = employee
+        self.__indexes.insert(employee_id, employee)
+        self.__watch(employee)
+    
+    def reindex(self, employee_id: int, field: str) -> None:
+        """Обновить индекс после изменения поля сотрудника
+        
+        Прежнее значение передавать не нужно - индекс помнит его сам.
+        
+        Args:
+            employee_id: ID сотрудника
+            field: Измененное поле
+        """
+        employee = self.__employees.get(employee_id)
+        if employee is None:
+            raise EmployeeNotFoundError(employee_id)
+        self.__indexes.move(field, employee_id, employee)
     
     def clear(self) -> None:
         """Очистить хранилище (полезно для тестов)"""
+        for employee in self.__employees.values():
+            self.__unwatch(employee)
         self.__employees.clear()
+        self.__positions.clear()
+        self.__indexes = _SecondaryIndexes(self.__indexes.fields)
     
     def count(self) -> int:
         """Получить количество сотрудников"""
         return len(self.__employees)
 
 
+class MappedEmployeeRepository(IEmployeeRepository):
+    """Хранилище сотрудников в колоночном memory-mapped файле
+    
+    Альтернатива InMemoryEmployeeRepository для очень больших реестров:
+    данные лежат в файле, объекты сотрудников создаются лениво при чтении.
+    Каждое чтение возвращает новый объект - изменения сохраняются через update().
+    """
+    
+    def __init__(self, path: str, capacity: int = 1024):
+        """
+        Args:
+            path: Путь к файлу хранилища
+            capacity: Начальная вместимость нового файла
+        """
+        from .columnar_store import ColumnarEmployeeStore
+        self.__store = ColumnarEmployeeStore(path, capacity)
+    
+    def add(self, employee) -> None:
+        """Добавить сотрудника"""
+        if self.__store.find_row(employee.id) is not None:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=employee.id
+            )
+        self.__store.append(employee)
+    
+    def remove(self, employee_id: int) -> None:
+        """Удалить сотрудника по ID"""
+        row = self.__store.find_row(employee_id)
+        if row is None:
+            raise EmployeeNotFoundError(employee_id)
+        self.__store.delete(row)
+    
+    def get_by_id(self, employee_id: int) -> Optional[Any]:
+        """Получить сотрудника по ID"""
+        row = self.__store.find_row(employee_id)
+        if row is None:
+            return None
+        return self.__store.read_row(row)
+    
+    def get_all(self) -> List[Any]:
+        """Получить всех сотрудников (материализует весь реестр)"""
+        return list(self.iter_all())
+    
+    def iter_all(self) -> Iterator[Any]:
+        """Ленивый итератор: сотрудник создается при обращении к нему"""
+        for row in self.__store.iter_rows():
+            yield self.__store.read_row(row)
+    
+    def find(self, criteria: Dict[str, Any]) -> List[Any]:
+        """Найти сотрудников по критериям
+        
+        Критерии по хранимым колонкам проверяются без создания объектов,
+        материализуются только найденные строки.
+        """
+        from .columnar_store import COLUMN_FIELDS
+        column_criteria = {k: v for k, v in criteria.items() if k in COLUMN_FIELDS}
+        query = compile_criteria({k: v for k, v in criteria.items() if k not in COLUMN_FIELDS})
+        return query.filter(self.__store.read_row(row)
+                            for row in self.__store.select_rows(column_criteria))
+    
+    def update(self, employee_id: int, employee) -> None:
+        """Сохранить изменения сотрудника"""
+        row = self.__store.find_row(employee_id)
+        if row is None:
+            raise EmployeeNotFoundError(employee_id)
+        self.__store.overwrite(row, employee)
+    
+    def count(self) -> int:
+        """Получить количество сотрудников"""
+        return len(self.__store)
+    
+    def flush(self) -> None:
+        """Сбросить изменения на диск"""
+        self.__store.flush()
+    
+    def close(self) -> None:
+        """Закрыть файлы хранилища"""
+        self.__store.close()
+
+
+_EMPLOYEE_COLUMNS = ("id, name, department, base_salary, employee_type, bonus, "
+                     "tech_stack, seniority_level, commission_rate, sales_volume")
+
+# Постоянные строки запросов: sqlite3 кэширует подготовленные выражения по тексту SQL
+_INSERT_EMPLOYEE = f"INSERT INTO employees ({_EMPLOYEE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_UPDATE_EMPLOYEE = ("UPDATE employees SET name = ?, department = ?, base_salary = ?, employee_type = ?, "
+                    "bonus = ?, tech_stack = ?, seniority_level = ?, commission_rate = ?, sales_volume = ? "
+                    "WHERE id = ?")
+_DELETE_EMPLOYEE = "DELETE FROM employees WHERE id = ?"
+_SELECT_EMPLOYEES = f"SELECT {_EMPLOYEE_COLUMNS} FROM employees"
+_SELECT_EMPLOYEE_BY_ID = _SELECT_EMPLOYEES + " WHERE id = ?"
+_COUNT_EMPLOYEES = "SELECT COUNT(*) FROM employees"
+# Оператор критерия -> оператор SQL (in и startswith собираются отдельно)
+_SQL_OPERATORS = {'eq': '=', 'ne': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+# Не больше параметров в одном запросе (лимит старых сборок SQLite - 999)
+_MAX_SQL_PARAMS = 900
+
+# Атрибут сотрудника -> колонка таблицы (для перевода критериев поиска в WHERE)
+_CRITERIA_COLUMNS = {
+    'id': 'id',
+    'name': 'name',
+    'department': 'department',
+    'base_salary': 'base_salary',
+    'type': 'employee_type',
+    'level': 'seniority_level',
+    'commission_rate': 'commission_rate',
+    'sales_amount': 'sales_volume',
+}
+
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Наименьшая строка больше всех строк с данным префиксом
+
+    Последние символы U+10FFFF увеличить нельзя - они отбрасываются,
+    суррогаты пропускаются (их нельзя передать в SQLite).
+    None - верхней границы нет (префикс пустой или только из U+10FFFF).
+    """
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    code = ord(prefix[-1]) + 1
+    if 0xD800 <= code <= 0xDFFF:
+        code = 0xE000
+    return prefix[:-1] + chr(code)
+
+
 class DatabaseEmployeeRepository(IEmployeeRepository):
-    """Хранилище сотрудников в базе данных"""
+    """Хранилище сотрудников в базе данных SQLite
+    
+    Стратегия бонуса менеджера не хранится: сохраняется рассчитанный бонус,
+    при чтении менеджер получает FixedBonusStrategy с этой суммой.
+    """
     
     def __init__(self, connection=None):
         """
         Args:
-            connection: Объект подключения к БД
+            connection: Объект подключения к БД (sqlite3.Connection)
         """
+        from .models.employee_refactored import (
+            Employee, Developer, Manager, Salesperson,
+            CompactEmployee, CompactDeveloper, CompactManager, CompactSalesperson
+        )
+        self.__classes = {cls.__name__: cls for cls in (
+            Employee, Developer, Manager, Salesperson,
+            CompactEmployee, CompactDeveloper, CompactManager, CompactSalesperson
+        )}
+        
         self.connection = connection
+        if connection is not None:
+            # Существующая БД получает недостающие таблицы и индексы
+            try:
+                migrate(connection)
+            except CoreDatabaseError as e:
+                raise DatabaseError(str(e)) from e
     
-    def add(self, employee) -> None:
-        """Добавить сотрудника в БД"""
-        # Реализация сохранения в БД
+    def __get_connection(self):
         if self.connection is None:
             raise RuntimeError("Подключение к БД не установлено")
-        # TODO: SQL INSERT запрос
-        pass
+        return self.connection
+    
+    @staticmethod
+    def __to_row(employee) -> tuple:
+        """Сотрудник -> значения колонок в порядке _EMPLOYEE_COLUMNS"""
+        bonus = employee.calculate_bonus() if hasattr(employee, 'calculate_bonus') else None
+        skills = employee.get_skills() if hasattr(employee, 'get_skills') else None
+        return (
+            employee.id,
+            employee.name,
+            employee.department,
+            employee.base_salary,
+            employee.__class__.__name__,
+            bonus,
+            json.dumps(skills, ensure_ascii=False) if skills is not None else None,
+            getattr(employee, 'level', None),
+            getattr(employee, 'commission_rate', None),
+            getattr(employee, 'sales_amount', None),
+        )
+    
+    def __from_row(self, row):
+        """Строка таблицы -> объект сотрудника"""
+        from .models.employee_refactored import BaseDeveloper, BaseManager, BaseSalesperson
+        from .strategies.bonus_strategy import FixedBonusStrategy
+        
+        (emp_id, name, department, base_salary, employee_type,
+         bonus, tech_stack, level, commission_rate, sales_volume) = row
+        
+        cls = self.__classes.get(employee_type)
+        if cls is None:
+            raise DatabaseError(f"Неизвестный тип сотрудника в БД: {employee_type}")
+        
+        if issubclass(cls, BaseDeveloper):
+            employee = cls(emp_id, name, department, base_salary, level or "junior")
+            for skill in json.loads(tech_stack) if tech_stack else []:
+                employee.add_skill(skill)
+        elif issubclass(cls, BaseManager):
+            employee = cls(emp_id, name, department, base_salary,
+                           FixedBonusStrategy(bonus) if bonus else None)
+        elif issubclass(cls, BaseSalesperson):
+            employee = cls(emp_id, name, department, base_salary, commission_rate)
+            employee.set_sales_amount(sales_volume or 0.0)
+        else:
+            employee = cls(emp_id, name, department, base_salary)
+        return employee
+    
+    def add(self, employee) -> None:
+        """Добавить сотрудника в БД"""
+        self.add_many([employee])
+    
+    def add_many(self, employees: Iterable[Any]) -> None:
+        """Добавить пачку сотрудников одной транзакцией
+        
+        Если хотя бы один ID уже занят, не добавляется никто.
+        """
+        connection = self.__get_connection()
+        rows = [self.__to_row(emp) for emp in employees]
+        try:
+            with connection:
+                connection.executemany(_INSERT_EMPLOYEE, rows)
+        except sqlite3.IntegrityError:
+            raise DuplicateIdError(
+                entity_type="Сотрудник",
+                entity_id=self.__find_duplicate_id(row[0] for row in rows)
+            )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Ошибка БД при сохранении сотрудников: {e}")
+    
+    def __find_duplicate_id(self, ids: Iterable[int]) -> Optional[int]:
+        """Находит ID, из-за которого не прошла вставка пачки"""
+        seen = set()
+        for emp_id in ids:
+            if emp_id in seen or self.__get_connection().execute(
+                    "SELECT 1 FROM employees WHERE id = ?", (emp_id,)).fetchone():
+                return emp_id
+            seen.add(emp_id)
+        return None
     
     def remove(self, employee_id: int) -> None:
         """Удалить сотрудника из БД"""
-        # TODO: SQL DELETE запрос
-        pass
+        connection = self.__get_connection()
+        with connection:
+            cursor = connection.execute(_DELETE_EMPLOYEE, (employee_id,))
+        if cursor.rowcount == 0:
+            raise EmployeeNotFoundError(employee_id)
+    
+    def update(self, employee_id: int, employee) -> None:
+        """Сохранить изменения сотрудника"""
+        connection = self.__get_connection()
+        row = self.__to_row(employee)
+        with connection:
+            cursor = connection.execute(_UPDATE_EMPLOYEE, row[1:] + (employee_id,))
+        if cursor.rowcount == 0:
+            raise EmployeeNotFoundError(employee_id)
     
     def get_by_id(self, employee_id: int) -> Optional[Any]:
         """Получить сотрудника из БД"""
-        # TODO: SQL SELECT запрос
-        pass
+        row = self.__get_connection().execute(_SELECT_EMPLOYEE_BY_ID, (employee_id,)).fetchone()
+        return self.__from_row(row) if row is not None else None
+    
+    def get_many(self, employee_ids: Iterable[int]) -> Dict[int, Any]:
+        """Получить сотрудников по списку ID запросами WHERE id IN (...)
+        
+        Returns:
+            Словарь ID -> сотрудник (отсутствующих ID в словаре нет)
+        """
+        connection = self.__get_connection()
+        ids = list(dict.fromkeys(employee_ids))
+        found = {}
+        for start in range(0, len(ids), _MAX_SQL_PARAMS):
+            chunk = ids[start:start + _MAX_SQL_PARAMS]
+            sql = f"{_SELECT_EMPLOYEES} WHERE id IN ({', '.join('?' * len(chunk))})"
+            for row in connection.execute(sql, chunk):
+                employee = self.__from_row(row)
+                found[employee.id] = employee
+        return found
     
     def get_all(self) -> List[Any]:
         """Получить всех сотрудников из БД"""
-        # TODO: SQL SELECT запрос
-        pass
+        return list(self.iter_all())
+    
+    def iter_all(self) -> Iterator[Any]:
+        """Построчное чтение сотрудников без загрузки всей таблицы"""
+        for row in self.__get_connection().execute(_SELECT_EMPLOYEES):
+            yield self.__from_row(row)
+    
+    @staticmethod
+    def __build_query(criteria: Dict[str, Any]):
+        """Критерии -> (SQL, параметры, критерии для проверки в Python)"""
+        conditions, params, other_criteria = [], [], {}
+        for key, value in criteria.items():
+            field, op = parse_key(key)
+            column = _CRITERIA_COLUMNS.get(field)
+            if column is None:
+                other_criteria[key] = value
+            elif op == 'in':
+                values = list(parse_criteria({key: value})[0].value)
+                if not values:
+                    conditions.append("0")
+                    continue
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+            elif op == 'startswith':
+                # Диапазон [prefix, следующий префикс) может идти по индексу, в отличие от LIKE
+                conditions.append(f"{column} >= ?")
+                params.append(value)
+                upper_bound = _prefix_upper_bound(value)
+                if upper_bound is not None:
+                    conditions.append(f"{column} < ?")
+                    params.append(upper_bound)
+            else:
+                # Имена колонок берутся только из _CRITERIA_COLUMNS, значения - параметрами
+                conditions.append(f"{column} {_SQL_OPERATORS[op]} ?")
+                params.append(value)
+        
+        sql = _SELECT_EMPLOYEES
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        # Без ORDER BY: сортировка по id помешала бы SQLite выбрать индекс
+        # (SCAN по первичному ключу или USE TEMP B-TREE), find сортирует сам
+        return sql, params, other_criteria
     
     def find(self, criteria: Dict[str, Any]) -> List[Any]:
-        """Найти сотрудников в БД по критериям"""
-        # TODO: SQL SELECT с WHERE
-        pass
+        """Найти сотрудников в БД по критериям
+        
+        Критерии по колонкам таблицы превращаются в параметризованный WHERE,
+        остальные проверяются у найденных объектов.
+        Результат упорядочен по ID, как у остальных хранилищ.
+        """
+        sql, params, other_criteria = self.__build_query(criteria)
+        query = compile_criteria(other_criteria)
+        rows = self.__get_connection().execute(sql, params).fetchall()
+        rows.sort(key=itemgetter(0))
+        return query.filter(self.__from_row(row) for row in rows)
+    
+    def count(self) -> int:
+        """Получить количество сотрудников"""
+        return self.__get_connection().execute(_COUNT_EMPLOYEES).fetchone()[0]
+    
+    def explain_find(self, criteria: Dict[str, Any]) -> List[str]:
+        """План выполнения find(criteria) по EXPLAIN QUERY PLAN
+        
+        Пример: ['SEARCH employees USING INDEX idx_employees_department_salary (department=?)']
+        """
+        sql, params, _ = self.__build_query(criteria)
+        return explain_query_plan(self.__get_connection(), sql, params)
 
 
 class InMemoryDepartmentRepository(IDepartmentRepository):
-    """Хранилище отделов в памяти"""
+    """Хранилище отделов в памяти (словарь по названию)
+    
+    Отделы с add_observer() сообщают о переименовании, и хранилище
+    переносит их под новое название (или отклоняет занятое).
+    """
     
     def __init__(self):
-        self.__departments: List[Any] = []
+        self.__departments: Dict[str, Any] = {}
     
     def add(self, department) -> None:
         """Добавить отдел"""
-        if any(d.name == department.name for d in self.__departments):
+        if department.name in self.__departments:
             raise DuplicateIdError(
                 entity_type="Отдел",
                 entity_id=department.name
             )
-        self.__departments.append(department)
+        self.__departments[department.name] = department
+        if hasattr(department, 'add_observer'):
+            department.add_observer(self)
     
     def remove(self, department_name: str) -> None:
         """Удалить отдел"""
-        for i, dept in enumerate(self.__departments):
-            if dept.name == department_name:
-                del self.__departments[i]
-                return
-        raise DepartmentNotFoundError(f"Отдел '{department_name}' не найден")
+        department = self.__departments.pop(department_name, None)
+        if department is None:
+            raise DepartmentNotFoundError(f"Отдел '{department_name}' не найден")
+        if hasattr(department, 'remove_observer'):
+            department.remove_observer(self)
     
     def get_by_name(self, name: str) -> Optional[Any]:
         """Получить отдел по названию"""
-        for dept in self.__departments:
-            if dept.name == name:
-                return dept
-        return None
+        return self.__departments.get(name)
     
     def get_all(self) -> List[Any]:
         """Получить все отделы"""
-        return self.__departments.copy()
+        return list(self.__departments.values())
+    
+    def iter_all(self) -> Iterator[Any]:
+        """Итератор по отделам без копирования (хранилище нельзя менять во время обхода)"""
+        return iter(self.__departments.values())
+    
+    # ===== НАБЛЮДАТЕЛЬ ОТДЕЛА =====
+    
+    def on_department_renamed(self, department, old_name: str) -> None:
+        """Перенос отдела под новое название; занятое название отклоняется"""
+        if department.name in self.__departments:
+            raise DuplicateIdError(
+                entity_type="Отдел",
+                entity_id=department.name
+            )
+        # Пересобираем словарь, чтобы сохранить порядок отделов
+        self.__departments = {
+            (department.name if name == old_name else name): dept
+            for name, dept in self.__departments.items()
+        }
+    
+    def on_employee_added(self, department, employee) -> None:
+        pass
+    
+    def on_employee_removed(self, department, employee) -> None:
+        pass
+    
+    def on_employee_id_changed(self, department, employee, old_id: int, new_id: int) -> None:
+        pass
 
 
 class InMemoryProjectRepository(IProjectRepository):
-    """Хранилище проектов в памяти"""
+    """Хранилище проектов в памяти (словарь по ID)
     
-    def __init__(self):
-        self.__projects: List[Any] = []
+    С индексом по status find_by_status не перебирает все проекты.
+    Проекты с add_observer() (core_OOP.Project) сами сообщают о смене статуса.
+    """
+    
+    def __init__(self, indexed_fields: Iterable[str] = ()):
+        """
+        Args:
+            indexed_fields: Поля для вторичных индексов (например, 'status')
+        """
+        self.__projects: Dict[int, Any] = {}
+        self.__indexes = _SecondaryIndexes(indexed_fields)
     
     def add(self, project) -> None:
         """Добавить проект"""
-        if any(p.project_id == project.project_id for p in self.__projects):
+        if project.project_id in self.__projects:
             raise DuplicateIdError(
                 entity_type="Проект",
                 entity_id=project.project_id
             )
-        self.__projects.append(project)
+        self.__projects[project.project_id] = project
+        self.__indexes.insert(project.project_id, project)
+        if hasattr(project, 'add_observer'):
+            project.add_observer(self)
     
     def remove(self, project_id: int) -> None:
         """Удалить проект"""
-        for i, proj in enumerate(self.__projects):
-            if proj.project_id == project_id:
-                del self.__projects[i]
-                return
-        raise EmployeeNotFoundError(f"Проект с ID {project_id} не найден")
+        project = self.__projects.pop(project_id, None)
+        if project is None:
+            raise ProjectNotFoundError(project_id)
+        self.__indexes.discard(project_id)
+        if hasattr(project, 'remove_observer'):
+            project.remove_observer(self)
     
     def get_by_id(self, project_id: int) -> Optional[Any]:
         """Получить проект по ID"""
-        for proj in self.__projects:
-            if proj.project_id == project_id:
-                return proj
-        return None
+        return self.__projects.get(project_id)
     
     def get_all(self) -> List[Any]:
         """Получить все проекты"""
-        return self.__projects.copy()
+        return list(self.__projects.values())
+    
+    def iter_all(self) -> Iterator[Any]:
+        """Итератор по проектам без копирования (хранилище нельзя менять во время обхода)"""
+        return iter(self.__projects.values())
     
     def find_by_status(self, status: str) -> List[Any]:
         """Найти проекты по статусу"""
-        return [p for p in self.__projects if p.status == status]
+        if 'status' in self.__indexes.fields:
+            return list(self.__indexes.lookup('status', status).values())
+        return [p for p in self.__projects.values() if p.status == status]
+    
+    def reindex(self, project_id: int, field: str) -> None:
+        """Обновить индекс после изменения поля проекта"""
+        project = self.__projects.get(project_id)
+        if project is not None:
+            self.__indexes.move(field, project_id, project)
+    
+    # ===== НАБЛЮДАТЕЛЬ ПРОЕКТА =====
+    
+    def on_project_status_changed(self, project, old_status: str) -> None:
+        """Перенос проекта в индексе статусов"""
+        self.reindex(project.project_id, 'status')
+    
+    def on_team_member_added(self, project, employee) -> None:
+        pass
+    
+    def on_team_member_removed(self, project, employee) -> None:
+        pass
@@ -0,0 +1,169 @@
+# refactored/services/payroll.py
+"""
+Расчет фонда оплаты труда по отделам
+
+Отделы в памяти считаются в текущем процессе: объекты сотрудников живут
+только здесь, и любая передача их в другой процесс (pickle или сборка
+колонок) стоит столько же, сколько сам расчет по кэшированным зарплатам.
+
+Колоночное хранилище (ColumnarEmployeeStore) считается в пуле процессов:
+в процесс уходит только (путь, первая строка, последняя строка), каждый
+процесс сам открывает memory-mapped файл и читает свои строки. Родитель
+не трогает сотрудников, поэтому расчет масштабируется по ядрам.
+
+Шарды возвращают точные суммы (несколько float без потери точности),
+итог округляется один раз math.fsum, поэтому результат совпадает
+с последовательным расчетом и не зависит ни от числа процессов,
+ни от размера шардов, ни от того, какой процесс закончил первым.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..columnar_store import ColumnarEmployeeStore
+
+# Шард хранилища: (путь, первая строка, строка после последней)
+StoreShard = Tuple[str, int, int]
+# Итог шарда по отделу: точная сумма зарплат компонентами и количество сотрудников
+Partial = Tuple[Tuple[float, ...], int]
+
+
+def _exact_sum(values: List[float]) -> Tuple[float, ...]:
+    """Точная сумма как набор float: их точная сумма равна сумме values
+
+    Каждая следующая компонента - округленный остаток, поэтому fsum
+    по компонентам всех шардов совпадает с fsum по всем зарплатам сразу,
+    как бы сотрудники ни были разбиты на шарды.
+    """
+    components = []
+    total = math.fsum(values)
+    if not math.isfinite(total):
+        return (total,)
+    while total:
+        components.append(total)
+        total = math.fsum(values + [-c for c in components])
+    return tuple(components)
+
+
+def _salary(employee) -> float:
+    return employee.calculate_salary()
+
+
+def _store_shard_payroll(shard: StoreShard) -> Dict[str, Partial]:
+    """Суммы зарплат строк шарда по отделам (выполняется в процессе пула)
+
+    Returns:
+        {отдел: (точная сумма зарплат компонентами, количество сотрудников)}
+        в порядке первого появления отдела в строках шарда
+    """
+    path, start, stop = shard
+    salaries: Dict[str, List[float]] = {}
+    with ColumnarEmployeeStore(path) as store:
+        for row in store.iter_rows(start, stop):
+            employee = store.read_row(row)
+            salaries.setdefault(employee.department, []).append(employee.calculate_salary())
+    return {name: (_exact_sum(values), len(values)) for name, values in salaries.items()}
+
+
+class PayrollEngine:
+    """Расчет фонда оплаты труда по отделам
+
+    Пример:
+        with PayrollEngine(max_workers=8) as engine:
+            result = engine.run(company.iter_departments())
+            result['by_department']['IT']
+            engine.run_store("employees.col")['total']
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, shard_size: int = 50_000,
+                 parallel_threshold: int = 100_000):
+        """
+        Args:
+            max_workers: Количество процессов для run_store (по умолчанию - число ядер)
+            shard_size: Максимум строк хранилища в одном шарде
+            parallel_threshold: Меньше стольких строк хранилище считается
+                                в текущем процессе (запуск пула дороже расчета)
+        """
+        if shard_size < 1:
+            raise ValueError("Размер шарда должен быть положительным")
+        self.max_workers = max_workers
+        self.shard_size = shard_size
+        self.parallel_threshold = parallel_threshold
+        self.__executor: Optional[ProcessPoolExecutor] = None
+
+    def run(self, departments: Iterable[Any]) -> Dict[str, Any]:
+        """Рассчитать фонд оплаты труда отделов в памяти
+
+        Args:
+            departments: Отделы (нужны name и iter_employees())
+
+        Returns:
+            dict: {
+                      'total': 1500000.0,                # Общая сумма
+                      'count': 30,                       # Количество сотрудников
+                      'by_department': {'IT': 900000.0}  # Сумма по отделам
+                  }
+        """
+        departments = list(departments)
+        salaries = [list(map(_salary, department.iter_employees())) for department in departments]
+        return {
+            'total': math.fsum(chain.from_iterable(salaries)),
+            'count': sum(map(len, salaries)),
+            'by_department': {
+                department.name: math.fsum(values)
+                for department, values in zip(departments, salaries)
+            },
+        }
+
+    def __map(self, shards: List[StoreShard], rows: int) -> Iterable[Dict[str, Partial]]:
+        if self.max_workers == 1 or len(shards) < 2 or rows < self.parallel_threshold:
+            return map(_store_shard_payroll, shards)
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        # map возвращает результаты в порядке шардов
+        return self.__executor.map(_store_shard_payroll, shards)
+
+    def run_store(self, path: str) -> Dict[str, Any]:
+        """Рассчитать фонд оплаты труда по колоночному хранилищу в пуле процессов
+
+        Хранилище может быть открыто для записи в этом же процессе: файлы
+        отображаются в память общими страницами, процессы пула видят
+        все добавленные строки. Менеджеры, как и при чтении из хранилища,
+        получают стратегию бонуса по умолчанию.
+
+        Args:
+            path: Путь к файлу колонок
+
+        Returns:
+            dict: в формате run(), отделы - в порядке первого появления
+        """
+        with ColumnarEmployeeStore(path) as store:
+            rows = store.row_count
+        shards = [(path, start, min(start + self.shard_size, rows))
+                  for start in range(0, rows, self.shard_size)]
+
+        partials: Dict[str, List[float]] = {}
+        count = 0
+        for shard_result in self.__map(shards, rows):
+            for name, (components, size) in shard_result.items():
+                partials.setdefault(name, []).extend(components)
+                count += size
+        return {
+            'total': math.fsum(chain.from_iterable(partials.values())),
+            'count': count,
+            'by_department': {name: math.fsum(parts) for name, parts in partials.items()},
+        }
+
+    def close(self) -> None:
+        """Остановить пул процессов"""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def __enter__(self) -> "PayrollEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
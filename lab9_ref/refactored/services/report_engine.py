@@ -0,0 +1,137 @@
+# refactored/services/report_engine.py
+"""
+Инкрементальный отчет по отделам компании
+
+Для каждого отдела хранится сводка (количество сотрудников, сумма зарплат)
+вместе с версией отдела, на которой она посчитана. При следующем отчете
+пересчитываются только отделы, версия которых изменилась; все поля отчета
+(расходы, бюджеты, средние) собираются из сводок за один проход по отделам.
+Если не изменился ни один отдел, возвращается копия готового отчета.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Сводка отдела: (отдел, версия, количество сотрудников, сумма зарплат).
+# Ссылка на отдел держит его живым, чтобы id() не достался другому объекту
+_Summary = Tuple[Any, Optional[int], int, float]
+
+# Поля отчета, которые возвращает FinancialCalculator.get_financial_report
+_FINANCIAL_FIELDS = ('total_salary_expenses', 'budget_by_department',
+                     'average_salary_per_department')
+
+
+def _copy_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Копия отчета: вложенные словари не разделяются с кэшем"""
+    copy = dict(report)
+    copy['budget_by_department'] = dict(report['budget_by_department'])
+    copy['average_salary_per_department'] = dict(report['average_salary_per_department'])
+    return copy
+
+
+class ReportEngine:
+    """Кэш отчетов по отделам с пересчетом только измененных отделов
+
+    Изменения отслеживаются по Department.version. Отделы без version
+    пересчитываются при каждом отчете.
+
+    Пример:
+        engine = ReportEngine()
+        report = engine.report(company.iter_departments())
+        report['budget_by_department']['IT']
+    """
+
+    def __init__(self, payroll_engine=None):
+        """
+        Args:
+            payroll_engine: PayrollEngine для пересчета измененных отделов
+                            (по умолчанию - calculate_total_salary отделов)
+        """
+        self.__payroll_engine = payroll_engine
+        self.__summaries: Dict[int, _Summary] = {}
+        self.__report: Optional[Dict[str, Any]] = None
+        # (id отдела, версия) по отделам последнего отчета
+        self.__state: Optional[List[Tuple[int, Optional[int]]]] = None
+
+    def invalidate(self, department=None) -> None:
+        """Сбросить кэш отдела (или весь кэш, если отдел не указан)"""
+        self.__report = None
+        if department is None:
+            self.__summaries.clear()
+        else:
+            self.__summaries.pop(id(department), None)
+
+    def __recompute(self, departments: List[Any], versions: List[Optional[int]]) -> None:
+        if self.__payroll_engine is not None:
+            by_department = self.__payroll_engine.run(departments)['by_department']
+            totals = [by_department[dept.name] for dept in departments]
+        else:
+            totals = [dept.calculate_total_salary() for dept in departments]
+        for dept, version, total in zip(departments, versions, totals):
+            self.__summaries[id(dept)] = (dept, version, dept.get_employee_count(), total)
+
+    def report(self, departments: Iterable[Any]) -> Dict[str, Any]:
+        """Отчет по отделам
+
+        Args:
+            departments: Отделы (нужны name, get_employee_count(),
+                         calculate_total_salary() и, для кэша, version)
+
+        Returns:
+            dict: {
+                      'departments': 2,
+                      'total_employees': 30,
+                      'total_salary_expenses': 1500000.0,
+                      'budget_by_department': {'IT': 900000.0, ...},
+                      'average_salary_per_department': {'IT': 50000.0, ...},
+                      'average_salary': 50000.0
+                  }
+        """
+        departments = list(departments)
+        # Версию читаем до пересчета: изменение во время расчета попадет в следующий отчет
+        state = [(id(dept), getattr(dept, 'version', None)) for dept in departments]
+        if self.__report is not None and state == self.__state:
+            return _copy_report(self.__report)
+
+        summaries = self.__summaries
+        stale, stale_versions = [], []
+        for dept, (key, version) in zip(departments, state):
+            summary = summaries.get(key)
+            if version is None or summary is None or summary[1] != version:
+                stale.append(dept)
+                stale_versions.append(version)
+        if stale:
+            self.__recompute(stale, stale_versions)
+
+        budget: Dict[str, float] = {}
+        averages: Dict[str, float] = {}
+        total_salary = 0
+        total_employees = 0
+        current: Dict[int, _Summary] = {}
+        for dept, (key, _) in zip(departments, state):
+            summary = current[key] = summaries[key]
+            count, salary = summary[2], summary[3]
+            name = dept.name
+            budget[name] = salary
+            averages[name] = salary / count if count else 0
+            total_salary += salary
+            total_employees += count
+        # Сводки удаленных из компании отделов не храним
+        self.__summaries = current
+
+        report = {
+            'departments': len(departments),
+            'total_employees': total_employees,
+            'total_salary_expenses': total_salary,
+            'budget_by_department': budget,
+            'average_salary_per_department': averages,
+            'average_salary': total_salary / total_employees if total_employees else 0,
+        }
+        cacheable = all(version is not None for _, version in state)
+        self.__report = report if cacheable else None
+        self.__state = state
+        return _copy_report(report)
+
+    def financial_report(self, departments: Iterable[Any]) -> Dict[str, Any]:
+        """Финансовый отчет в формате FinancialCalculator.get_financial_report"""
+        report = self.report(departments)
+        return {field: report[field] for field in _FINANCIAL_FIELDS}
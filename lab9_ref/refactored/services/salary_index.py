@@ -0,0 +1,137 @@
+# refactored/services/salary_index.py
+"""
+Отсортированный индекс сотрудников по рассчитанной зарплате
+
+Зарплата каждого сотрудника считается один раз при добавлении
+и пересчитывается по уведомлению on_salary_changed. Запросы
+"зарплата в диапазоне", "топ-N" и перцентили - бинарный поиск
+по отсортированному списку: O(log n + k) без полного перебора и сортировки.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class SalaryIndex:
+    """Индекс сотрудников, упорядоченный по calculate_salary()
+
+    Сотрудники с add_salary_observer() сами сообщают об изменении зарплаты.
+    Если зарплата изменилась без уведомления (например, изменили объект
+    стратегии бонуса), вызовите refresh(employee): он же сбрасывает кэш зарплаты.
+    """
+
+    def __init__(self, employees: Iterable[Any] = ()):
+        # Параллельные списки: ключи (зарплата, ID) по возрастанию и сотрудники
+        self.__keys: List[Tuple[float, int]] = []
+        self.__employees: List[Any] = []
+        self.__salaries: Dict[int, float] = {}
+
+        items = [(emp.calculate_salary(), emp.id, emp) for emp in employees]
+        items.sort(key=lambda item: (item[0], item[1]))
+        for salary, emp_id, emp in items:
+            if emp_id in self.__salaries:
+                raise ValueError(f"Сотрудник с ID {emp_id} уже в индексе")
+            self.__salaries[emp_id] = salary
+            if hasattr(emp, 'add_salary_observer'):
+                emp.add_salary_observer(self)
+        self.__keys = [(salary, emp_id) for salary, emp_id, _ in items]
+        self.__employees = [emp for _, _, emp in items]
+
+    # ===== ИЗМЕНЕНИЕ =====
+
+    def __insert(self, employee, salary: float) -> None:
+        key = (salary, employee.id)
+        position = bisect_left(self.__keys, key)
+        self.__keys.insert(position, key)
+        self.__employees.insert(position, employee)
+        self.__salaries[employee.id] = salary
+
+    def __delete(self, employee_id: int) -> None:
+        key = (self.__salaries.pop(employee_id), employee_id)
+        position = bisect_left(self.__keys, key)
+        del self.__keys[position]
+        del self.__employees[position]
+
+    def add(self, employee) -> None:
+        """Добавить сотрудника в индекс"""
+        if employee.id in self.__salaries:
+            raise ValueError(f"Сотрудник с ID {employee.id} уже в индексе")
+        self.__insert(employee, employee.calculate_salary())
+        if hasattr(employee, 'add_salary_observer'):
+            employee.add_salary_observer(self)
+
+    def remove(self, employee) -> None:
+        """Удалить сотрудника из индекса"""
+        self.__delete(employee.id)
+        if hasattr(employee, 'remove_salary_observer'):
+            employee.remove_salary_observer(self)
+
+    def refresh(self, employee) -> None:
+        """Пересчитать позицию сотрудника по текущей зарплате"""
+        if hasattr(employee, 'invalidate_salary'):
+            employee.invalidate_salary()
+        self.__delete(employee.id)
+        self.__insert(employee, employee.calculate_salary())
+
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Уведомление от сотрудника: переставить его в индексе"""
+        if employee.id not in self.__salaries:
+            return
+        self.__delete(employee.id)
+        self.__insert(employee, new_salary)
+
+    # ===== ЗАПРОСЫ =====
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, employee) -> bool:
+        return getattr(employee, 'id', None) in self.__salaries
+
+    def salary_of(self, employee_id: int) -> Optional[float]:
+        """Зарплата сотрудника по данным индекса"""
+        return self.__salaries.get(employee_id)
+
+    def between(self, min_salary: float, max_salary: float) -> List[Any]:
+        """Сотрудники с min_salary <= зарплата < max_salary (по возрастанию зарплаты)"""
+        start = bisect_left(self.__keys, (min_salary, -math.inf))
+        end = bisect_left(self.__keys, (max_salary, -math.inf))
+        return self.__employees[start:end]
+
+    def count_between(self, min_salary: float, max_salary: float) -> int:
+        """Количество сотрудников с min_salary <= зарплата < max_salary"""
+        return (bisect_left(self.__keys, (max_salary, -math.inf))
+                - bisect_left(self.__keys, (min_salary, -math.inf)))
+
+    def top(self, n: int) -> List[Any]:
+        """N сотрудников с наибольшей зарплатой (по убыванию)"""
+        if n <= 0:
+            return []
+        return self.__employees[:-n - 1:-1]
+
+    def bottom(self, n: int) -> List[Any]:
+        """N сотрудников с наименьшей зарплатой (по возрастанию)"""
+        return self.__employees[:max(n, 0)]
+
+    def percentile(self, p: float) -> float:
+        """Перцентиль зарплаты (метод ближайшего ранга), p от 0 до 100"""
+        if not 0 <= p <= 100:
+            raise ValueError("Перцентиль должен быть от 0 до 100")
+        if not self.__keys:
+            return 0.0
+        rank = max(math.ceil(p / 100 * len(self.__keys)), 1)
+        return self.__keys[rank - 1][0]
+
+    def group_by_range(self, ranges: List[tuple]) -> Dict[str, List]:
+        """Сотрудники по непересекающимся диапазонам [min, max), только непустые группы"""
+        groups = {}
+        for min_val, max_val in ranges:
+            employees = self.between(min_val, max_val)
+            if employees:
+                groups[f"{min_val:,} - {max_val:,}"] = employees
+        return groups
+
+    def __iter__(self):
+        """Сотрудники по возрастанию зарплаты"""
+        return iter(self.__employees)
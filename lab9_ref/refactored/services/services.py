@@ -5,12 +5,35 @@ SRP - Single Responsibility Principle
 Отвечает ТОЛЬКО за расчеты, ничего больше
 """
 
-from typing import List, Dict
+import math
+from bisect import bisect_right
+from typing import List, Dict, Iterable, Sequence
 from ..interfaces import ISalaryCalculable
 
 
+def _percentile(ordered: List[float], p: float) -> float:
+    """Перцентиль с линейной интерполяцией (как numpy.percentile по умолчанию)"""
+    position = (len(ordered) - 1) * p / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _histogram(salaries: List[float], bins: int, low: float, high: float) -> List[int]:
+    """Счетчики по равным интервалам [low, high], последний включает high (как numpy.histogram)"""
+    counts = [0] * bins
+    width = (high - low) / bins
+    for salary in salaries:
+        counts[min(int((salary - low) / width), bins - 1)] += 1
+    return counts
+
+
 class SalaryCalculator:
-    """Калькулятор зарплаты"""
+    """Калькулятор зарплаты
+    
+    Зарплаты списка сотрудников один раз собираются в колонку (list),
+    дальше статистика считается по колонке.
+    """
     
     @staticmethod
     def calculate_salary(employee: ISalaryCalculable) -> float:
@@ -25,7 +48,15 @@ class SalaryCalculator:
         return employee.calculate_salary()
     
     @staticmethod
-    def calculate_total_salary(employees: List[ISalaryCalculable]) -> float:
+    def salary_column(employees: Iterable[ISalaryCalculable]) -> List[float]:
+        """Зарплаты сотрудников одной колонкой
+        
+        calculate_salary() вызывается ровно один раз на сотрудника.
+        """
+        return [employee.calculate_salary() for employee in employees]
+    
+    @staticmethod
+    def calculate_total_salary(employees: Iterable[ISalaryCalculable]) -> float:
         """Рассчитать общую зарплату для списка сотрудников
         
         Args:
@@ -34,13 +65,10 @@ class SalaryCalculator:
         Returns:
             float: Общая сумма зарплат
         """
-        total = 0.0
-        for employee in employees:
-            total += employee.calculate_salary()
-        return total
+        return math.fsum(SalaryCalculator.salary_column(employees))
     
     @staticmethod
-    def calculate_average_salary(employees: List[ISalaryCalculable]) -> float:
+    def calculate_average_salary(employees: Iterable[ISalaryCalculable]) -> float:
         """Рассчитать среднюю зарплату
         
         Args:
@@ -49,13 +77,13 @@ class SalaryCalculator:
         Returns:
             float: Средняя зарплата
         """
-        if not employees:
+        salaries = SalaryCalculator.salary_column(employees)
+        if not salaries:
             return 0.0
-        total = SalaryCalculator.calculate_total_salary(employees)
-        return total / len(employees)
+        return math.fsum(salaries) / len(salaries)
     
     @staticmethod
-    def get_salary_statistics(employees: List[ISalaryCalculable]) -> Dict[str, float]:
+    def get_salary_statistics(employees: Iterable[ISalaryCalculable]) -> Dict[str, float]:
         """Получить статистику по зарплатам
         
         Args:
@@ -71,7 +99,9 @@ class SalaryCalculator:
                       'count': 10           # Количество сотрудников
                   }
         """
-        if not employees:
+        salaries = SalaryCalculator.salary_column(employees)
+        count = len(salaries)
+        if not count:
             return {
                 'total': 0.0,
                 'average': 0.0,
@@ -80,14 +110,58 @@ class SalaryCalculator:
                 'count': 0
             }
         
-        salaries = [emp.calculate_salary() for emp in employees]
+        total = math.fsum(salaries)  # сумма считается один раз
+        low, high = min(salaries), max(salaries)
+        
+        return {
+            'total': total,
+            'average': total / count,
+            'min': low,
+            'max': high,
+            'count': count
+        }
+    
+    @staticmethod
+    def get_salary_distribution(employees: Iterable[ISalaryCalculable],
+                                percentiles: Sequence[float] = (25, 50, 75, 90),
+                                bins: int = 10) -> Dict[str, object]:
+        """Распределение зарплат: медиана, перцентили и гистограмма
+        
+        Args:
+            employees: Список сотрудников
+            percentiles: Какие перцентили посчитать (0-100)
+            bins: Количество интервалов гистограммы
+        
+        Returns:
+            dict: {
+                      'median': 50000,
+                      'percentiles': {25: 40000, 50: 50000, ...},
+                      'histogram': {'counts': [...], 'edges': [...]}  # edges на 1 длиннее counts
+                  }
+        """
+        if bins < 1:
+            raise ValueError("Количество интервалов должно быть положительным")
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError("Перцентиль должен быть от 0 до 100")
         
+        salaries = SalaryCalculator.salary_column(employees)
+        if not salaries:
+            return {
+                'median': 0.0,
+                'percentiles': {p: 0.0 for p in percentiles},
+                'histogram': {'counts': [], 'edges': []}
+            }
+        
+        ordered = sorted(salaries)
+        low, high = ordered[0], ordered[-1]
+        if high == low:  # все зарплаты равны - интервал шириной 1, как в NumPy
+            low, high = low - 0.5, high + 0.5
+        counts = _histogram(ordered, bins, low, high)
+        edges = [low + (high - low) * i / bins for i in range(bins + 1)]
         return {
-            'total': sum(salaries),
-            'average': sum(salaries) / len(salaries),
-            'min': min(salaries),
-            'max': max(salaries),
-            'count': len(salaries)
+            'median': float(_percentile(ordered, 50)),
+            'percentiles': {p: float(_percentile(ordered, p)) for p in percentiles},
+            'histogram': {'counts': counts, 'edges': edges}
         }
     
     @staticmethod
@@ -106,20 +180,37 @@ class SalaryCalculator:
         if ranges is None:
             ranges = [(0, 50000), (50000, 100000), (100000, float('inf'))]
         
-        groups = {}
-        for min_val, max_val in ranges:
-            key = f"{min_val:,} - {max_val:,}"
-            groups[key] = []
+        keys = [f"{min_val:,} - {max_val:,}" for min_val, max_val in ranges]
+        groups = {key: [] for key in keys}
+        
+        # Непересекающиеся диапазоны: нужный ищется бинарным поиском по границам
+        order = sorted(range(len(ranges)), key=lambda i: ranges[i][0])
+        bounds = [ranges[i][0] for i in order]
+        disjoint = all(ranges[a][1] <= ranges[b][0] for a, b in zip(order, order[1:]))
         
         for employee in employees:
             salary = employee.calculate_salary()
-            for min_val, max_val in ranges:
+            if disjoint:
+                position = bisect_right(bounds, salary) - 1
+                if position >= 0:
+                    i = order[position]
+                    if salary < ranges[i][1]:
+                        groups[keys[i]].append(employee)
+                continue
+            for i, (min_val, max_val) in enumerate(ranges):
                 if min_val <= salary < max_val:
-                    key = f"{min_val:,} - {max_val:,}"
-                    groups[key].append(employee)
+                    groups[keys[i]].append(employee)
                     break
         
         return {k: v for k, v in groups.items() if v}  # Только непустые группы
+    
+    @staticmethod
+    def sort_by_salary(employees: Iterable[ISalaryCalculable], reverse: bool = False) -> List:
+        """Сортировка по зарплате, calculate_salary() вызывается один раз на сотрудника
+        
+        (сортировка через сравнение сотрудников пересчитывает зарплату при каждом сравнении)
+        """
+        return sorted(employees, key=lambda employee: employee.calculate_salary(), reverse=reverse)
 
 
 # refactored/services/department_manager.py
@@ -3,9 +3,35 @@ OCP - Open/Closed Principle
 Strategy Pattern для различных стратегий расчета бонусов
 Открыто для расширения (добавления новых стратегий)
 Закрыто для изменения (не нужно менять Manager)
+
+calculate_batch(employees) считает бонусы сразу для списка сотрудников
+и всегда возвращает list float - по стратегии за проход, а не по сотруднику.
 """
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
+from typing import Any, List, Sequence
+
+
+def _as_sequence(employees) -> Sequence[Any]:
+    return employees if isinstance(employees, (list, tuple)) else list(employees)
+
+
+def _column(values) -> List[float]:
+    """Колонка float из итерируемого"""
+    return [float(value) for value in values]
+
+
+def _attr_column(employees: Sequence[Any], name: str, default=None) -> List[float]:
+    """Колонка атрибута сотрудников (default - если атрибута нет)"""
+    if default is None:
+        return _column(map(attrgetter(name), employees))
+    return _column(getattr(employee, name, default) for employee in employees)
+
+
+def _filled(size: int, value: float) -> List[float]:
+    """Колонка из одинаковых значений"""
+    return [float(value)] * size
 
 
 class BonusStrategy(ABC):
@@ -27,6 +53,20 @@ class BonusStrategy(ABC):
     def get_name(self) -> str:
         """Получить название стратегии"""
         pass
+    
+    def calculate_batch(self, employees) -> List[float]:
+        """Рассчитать бонусы для списка сотрудников
+        
+        Базовая реализация вызывает calculate() для каждого сотрудника;
+        встроенные стратегии переопределяют ее расчетом по колонкам.
+        
+        Args:
+            employees: Список сотрудников
+        
+        Returns:
+            Список бонусов (float) в порядке employees
+        """
+        return _column(map(self.calculate, _as_sequence(employees)))
 
 
 class FixedBonusStrategy(BonusStrategy):
@@ -43,6 +83,10 @@ class FixedBonusStrategy(BonusStrategy):
         """Возвращает фиксированный бонус"""
         return self.bonus_amount
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Одинаковый бонус для всех"""
+        return _filled(len(_as_sequence(employees)), self.bonus_amount)
+    
     def get_name(self) -> str:
         return f"Фиксированный бонус ({self.bonus_amount})"
 
@@ -63,6 +107,11 @@ class PercentageBonusStrategy(BonusStrategy):
         """Возвращает процент от базовой зарплаты"""
         return employee.base_salary * self.percentage
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Колонка базовых зарплат, умноженная на процент"""
+        percentage = self.percentage
+        return [salary * percentage for salary in _attr_column(_as_sequence(employees), 'base_salary')]
+    
     def get_name(self) -> str:
         return f"Процентный бонус ({self.percentage * 100}%)"
 
@@ -83,6 +132,14 @@ class SeniorityBonusStrategy(BonusStrategy):
         multiplier = self.multipliers.get(level, 0.05)
         return employee.base_salary * multiplier
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Множители по уровням собираются одной колонкой и умножаются на зарплаты"""
+        employees = _as_sequence(employees)
+        multipliers = self.multipliers
+        rates = [multipliers.get(getattr(employee, 'level', 'junior'), 0.05) for employee in employees]
+        salaries = _attr_column(employees, 'base_salary')
+        return [salary * rate for salary, rate in zip(salaries, rates)]
+    
     def get_name(self) -> str:
         return "Бонус по уровню (junior/middle/senior)"
 
@@ -103,6 +160,11 @@ class ProjectBonusStrategy(BonusStrategy):
         projects_count = getattr(employee, 'projects_count', 0)
         return projects_count * self.bonus_per_project
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Колонка количества проектов, умноженная на бонус за проект"""
+        bonus = self.bonus_per_project
+        return [count * bonus for count in _attr_column(_as_sequence(employees), 'projects_count', 0)]
+    
     def get_name(self) -> str:
         return f"Бонус за проекты ({self.bonus_per_project} за проект)"
 
@@ -130,6 +192,13 @@ class PerformanceBonusStrategy(BonusStrategy):
         else:
             return 0  # Нет бонуса если выполнено менее 50%
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Те же три ветки, что в calculate(), по колонке achievement"""
+        achievement = _attr_column(_as_sequence(employees), 'achievement', 0.8)
+        base = self.base_bonus
+        return [base * (1 + (a - 1.0) * 0.5) if a >= 1.0 else base * a if a >= 0.5 else 0.0
+                for a in achievement]
+    
     def get_name(self) -> str:
         return f"Бонус по производительности (базовый {self.base_bonus})"
 
@@ -151,6 +220,14 @@ class CompositeBonusStrategy(BonusStrategy):
             total += strategy.calculate(employee)
         return total
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Суммирует колонки дочерних стратегий (по стратегии за проход, а не по сотруднику)"""
+        employees = _as_sequence(employees)
+        total = _filled(len(employees), 0.0)
+        for strategy in self.strategies:
+            total = [acc + bonus for acc, bonus in zip(total, strategy.calculate_batch(employees))]
+        return total
+    
     def get_name(self) -> str:
         names = [s.get_name() for s in self.strategies]
         return f"Комбинированный бонус: {' + '.join(names)}"
@@ -163,5 +240,9 @@ class NoBonusStrategy(BonusStrategy):
         """Возвращает 0"""
         return 0.0
     
+    def calculate_batch(self, employees) -> List[float]:
+        """Нулевая колонка"""
+        return _filled(len(_as_sequence(employees)), 0.0)
+    
     def get_name(self) -> str:
         return "Без бонусов"
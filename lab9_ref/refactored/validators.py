@@ -2,30 +2,55 @@
 """
 SRP - Single Responsibility Principle
 Все валидаторы отделены в отдельные классы
+
+Для массового импорта правила тех же валидаторов собраны в схемы
+(EMPLOYEE_SCHEMA, DEPARTMENT_SCHEMA, PROJECT_SCHEMA, COMPANY_SCHEMA):
+схема проверяет пачку записей или колонок целиком и возвращает
+отчет об ошибках по строкам вместо исключения на первом значении.
 """
 
+import math
+from itertools import compress, repeat
+from operator import not_
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from core.Project import Project
 from .exceptions import InvalidDataError, FinancialValidationError
 
 
+# Проверки значений - общие для валидаторов и схем
+
+def _is_not_empty_string(value) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _is_positive_integer(value) -> bool:
+    return isinstance(value, int) and value > 0
+
+
+def _is_positive_number(value) -> bool:
+    return isinstance(value, (int, float)) and value > 0
+
+
 class BaseValidator:
     """Базовые методы валидации для всех классов"""
     
     @staticmethod
     def validate_not_empty_string(value: str, field_name: str) -> None:
         """Проверяет, что строка не пустая"""
-        if not isinstance(value, str) or not value.strip():
+        if not _is_not_empty_string(value):
             raise InvalidDataError(f"{field_name} не должно быть пустой строкой")
     
     @staticmethod
     def validate_positive_integer(value: int, field_name: str) -> None:
         """Проверяет, что число положительное целое"""
-        if not isinstance(value, int) or value <= 0:
+        if not _is_positive_integer(value):
             raise InvalidDataError(f"{field_name} должно быть положительным целым числом")
     
     @staticmethod
     def validate_positive_number(value: float, field_name: str) -> None:
         """Проверяет, что число положительное (int или float)"""
-        if not isinstance(value, (int, float)) or value <= 0:
+        if not _is_positive_number(value):
             raise InvalidDataError(f"{field_name} должно быть положительным числом")
     
     @staticmethod
@@ -59,7 +84,7 @@ class EmployeeValidator(BaseValidator):
     @staticmethod
     def validate_salary(value: float) -> None:
         """Валидация базовой зарплаты"""
-        if not isinstance(value, (int, float)) or value <= 0:
+        if not _is_positive_number(value):
             raise FinancialValidationError(
                 "Базовая зарплата должна быть положительным числом"
             )
@@ -108,3 +133,241 @@ class ProjectValidator(BaseValidator):
             raise InvalidDataError(
                 f"Статус должен быть одним из: {valid_statuses}"
             )
+
+
+# ===== ПАКЕТНАЯ ПРОВЕРКА ПО СХЕМЕ =====
+
+# Статусы проекта - те же, что принимает Project
+PROJECT_STATUSES = frozenset(Project.VALID_STATUSES)
+
+
+class FieldRule(NamedTuple):
+    """Правило поля: проверка значения, сообщение и класс ошибки
+    
+    column_check - необязательная проверка всей колонки сразу (циклы в C):
+    True, если все значения проходят check. Если она вернула False,
+    плохие строки ищутся поэлементно через check.
+    """
+    field: str
+    check: Callable[[Any], bool]
+    message: str
+    error: type = InvalidDataError
+    column_check: Optional[Callable[[Sequence[Any]], bool]] = None
+
+
+def _all_of_type(column: Sequence[Any], expected_type) -> bool:
+    return all(map(isinstance, column, repeat(expected_type)))
+
+
+def _all_not_empty_strings(column: Sequence[Any]) -> bool:
+    return _all_of_type(column, str) and all(map(str.strip, column))
+
+
+def _all_positive_integers(column: Sequence[Any]) -> bool:
+    return _all_of_type(column, int) and (not column or min(column) > 0)
+
+
+def _all_positive_numbers(column: Sequence[Any]) -> bool:
+    # NaN не больше нуля, но min() его пропускает - проверяется отдельно
+    return (_all_of_type(column, (int, float))
+            and (not column or min(column) > 0)
+            and not any(map(math.isnan, column)))
+
+
+def not_empty_string(field: str, label: str) -> FieldRule:
+    """Правило validate_not_empty_string"""
+    return FieldRule(field, _is_not_empty_string, f"{label} не должно быть пустой строкой",
+                     column_check=_all_not_empty_strings)
+
+
+def positive_integer(field: str, label: str) -> FieldRule:
+    """Правило validate_positive_integer"""
+    return FieldRule(field, _is_positive_integer, f"{label} должно быть положительным целым числом",
+                     column_check=_all_positive_integers)
+
+
+def positive_number(field: str, label: str, error: type = InvalidDataError) -> FieldRule:
+    """Правило validate_positive_number"""
+    return FieldRule(field, _is_positive_number, f"{label} должно быть положительным числом",
+                     error, _all_positive_numbers)
+
+
+def of_type(field: str, expected_type: type, label: str) -> FieldRule:
+    """Правило validate_type"""
+    return FieldRule(field, lambda value: isinstance(value, expected_type),
+                     f"{label} должно быть типа {expected_type.__name__}",
+                     column_check=lambda column: _all_of_type(column, expected_type))
+
+
+def one_of(field: str, values: frozenset, label: str) -> FieldRule:
+    """Значение из допустимого набора"""
+    def check(value) -> bool:
+        try:
+            return value in values
+        except TypeError:  # нехешируемое значение не входит в набор
+            return False
+    
+    return FieldRule(field, check,
+                     f"{label} должен быть одним из: {', '.join(sorted(map(repr, values)))}",
+                     column_check=lambda column: values.issuperset(column))
+
+
+class ValidationReport:
+    """Результат пакетной проверки: нарушенные правила по номерам строк"""
+    
+    def __init__(self, schema_name: str, total: int):
+        self.schema_name = schema_name
+        self.total = total
+        self.__errors: Dict[int, List[FieldRule]] = {}
+    
+    def add(self, row: int, rule: FieldRule) -> None:
+        """Записать нарушение правила в строке"""
+        self.__errors.setdefault(row, []).append(rule)
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.__errors
+    
+    @property
+    def error_count(self) -> int:
+        """Количество строк с ошибками"""
+        return len(self.__errors)
+    
+    def invalid_rows(self) -> List[int]:
+        """Номера строк с ошибками по возрастанию"""
+        return sorted(self.__errors)
+    
+    def valid_rows(self) -> List[int]:
+        """Номера корректных строк по возрастанию"""
+        errors = self.__errors
+        if not errors:
+            return list(range(self.total))
+        return [row for row in range(self.total) if row not in errors]
+    
+    def errors(self, row: int) -> List[str]:
+        """Сообщения об ошибках строки"""
+        return [rule.message for rule in self.__errors.get(row, ())]
+    
+    def as_dict(self) -> Dict[int, List[str]]:
+        """Отчет {номер строки: [сообщения]}"""
+        return {row: self.errors(row) for row in self.invalid_rows()}
+    
+    def raise_first(self) -> None:
+        """Поднять исключение первой ошибки, как одиночные валидаторы"""
+        if self.__errors:
+            row = min(self.__errors)
+            rule = self.__errors[row][0]
+            raise rule.error(f"{self.schema_name}, строка {row}: {rule.message}")
+    
+    def __repr__(self) -> str:
+        return f"ValidationReport({self.schema_name}, total={self.total}, invalid={self.error_count})"
+
+
+class RecordSchema:
+    """Схема записи: правила полей, собранные в одну функцию проверки
+    
+    Пример:
+        report = EMPLOYEE_SCHEMA.validate_columns({
+            'id': ids, 'name': names, 'department': departments, 'base_salary': salaries
+        })
+        for row, messages in report.as_dict().items():
+            ...
+    """
+    
+    def __init__(self, name: str, rules: Sequence[FieldRule]):
+        """
+        Args:
+            name: Название типа записи (для сообщений)
+            rules: Правила полей в порядке проверки
+        """
+        self.name = name
+        self.rules = tuple(rules)
+        self.fields = tuple(dict.fromkeys(rule.field for rule in self.rules))
+        self.check_record = self.__compile(self.rules)
+    
+    @staticmethod
+    def __compile(rules: Sequence[FieldRule]) -> Callable[[dict], List[FieldRule]]:
+        checks = tuple((rule.field, rule.check, rule) for rule in rules)
+        
+        def check_record(record: dict) -> List[FieldRule]:
+            """Нарушенные правила записи (отсутствующее поле - None)"""
+            get = record.get
+            return [rule for field, check, rule in checks if not check(get(field))]
+        
+        return check_record
+    
+    def validate(self, record: dict) -> None:
+        """Проверить одну запись; исключение на первом нарушенном правиле"""
+        failed = self.check_record(record)
+        if failed:
+            raise failed[0].error(failed[0].message)
+    
+    def validate_rows(self, records: Iterable[dict]) -> ValidationReport:
+        """Проверить записи-словари, собирая все ошибки"""
+        records = records if isinstance(records, list) else list(records)
+        report = ValidationReport(self.name, len(records))
+        check_record = self.check_record
+        for row, record in enumerate(records):
+            for rule in check_record(record):
+                report.add(row, rule)
+        return report
+    
+    def validate_columns(self, columns: Dict[str, Sequence[Any]]) -> ValidationReport:
+        """Проверить пачку в колоночном виде {поле: значения}
+        
+        Каждое правило проверяет свою колонку целиком (column_check);
+        номера плохих строк ищутся только в колонках, где проверка не прошла.
+        
+        Raises:
+            InvalidDataError: Колонки разной длины
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise InvalidDataError(f"{self.name}: колонки разной длины {sorted(lengths)}")
+        total = lengths.pop() if lengths else 0
+        report = ValidationReport(self.name, total)
+        
+        for rule in self.rules:
+            column = columns.get(rule.field)
+            if column is None:
+                column = [None] * total
+            if self.__column_passes(rule, column):
+                continue
+            for row in compress(range(total), map(not_, map(rule.check, column))):
+                report.add(row, rule)
+        return report
+    
+    @staticmethod
+    def __column_passes(rule: FieldRule, column: Sequence[Any]) -> bool:
+        if rule.column_check is None:
+            return all(map(rule.check, column))
+        try:
+            return rule.column_check(column)
+        except (TypeError, ValueError, OverflowError):
+            # несравнимые или нехешируемые значения - ищем плохие строки поэлементно
+            return False
+
+
+EMPLOYEE_SCHEMA = RecordSchema("Сотрудник", [
+    positive_integer('id', "ID сотрудника"),
+    not_empty_string('name', "Имя сотрудника"),
+    not_empty_string('department', "Название отдела"),
+    FieldRule('base_salary', _is_positive_number,
+              "Базовая зарплата должна быть положительным числом", FinancialValidationError,
+              _all_positive_numbers),
+])
+
+DEPARTMENT_SCHEMA = RecordSchema("Отдел", [
+    not_empty_string('name', "Название отдела"),
+])
+
+PROJECT_SCHEMA = RecordSchema("Проект", [
+    positive_integer('project_id', "ID проекта"),
+    not_empty_string('name', "Название проекта"),
+    of_type('description', str, "Описание проекта"),
+    one_of('status', PROJECT_STATUSES, "Статус"),
+])
+
+COMPANY_SCHEMA = RecordSchema("Компания", [
+    not_empty_string('name', "Название компании"),
+])
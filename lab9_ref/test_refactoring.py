@@ -3,25 +3,42 @@
 Проверяют все принципы SOLID и улучшения
 """
 
+import asyncio
+import math
+import os
+import sqlite3
+
 import pytest
 from refactored.validators import (
-    EmployeeValidator, DepartmentValidator, CompanyValidator, ProjectValidator
+    EmployeeValidator, DepartmentValidator, CompanyValidator, ProjectValidator,
+    EMPLOYEE_SCHEMA, PROJECT_SCHEMA
 )
 from refactored.interfaces import (
     ISalaryCalculable, ISkillManageable, IBonusCalculable, ICommissionCalculable
 )
 from refactored.repository import (
-    InMemoryEmployeeRepository, InMemoryDepartmentRepository
+    InMemoryEmployeeRepository, InMemoryDepartmentRepository, InMemoryProjectRepository,
+    MappedEmployeeRepository, DatabaseEmployeeRepository
 )
+from refactored.async_repository import AsyncEmployeeRepository
+from core.migrations import SCHEMA_VERSION, uses_index
 from refactored.strategies.bonus_strategy import (
     FixedBonusStrategy, PercentageBonusStrategy, SeniorityBonusStrategy,
-    NoBonusStrategy, CompositeBonusStrategy
+    NoBonusStrategy, CompositeBonusStrategy, ProjectBonusStrategy
 )
 from refactored.services import SalaryCalculator, DepartmentManager
+from refactored.services.salary_index import SalaryIndex
+from refactored.services.payroll import PayrollEngine
+from refactored.models.department_refactored import Department
+from refactored.models.company_refactored import Company, FinancialCalculator
 from refactored.models.employee_refactored import (
-    Employee, Developer, Manager, Salesperson
+    Employee, Developer, Manager, Salesperson,
+    CompactEmployee, CompactDeveloper, CompactManager, CompactSalesperson
+)
+from refactored.exceptions import (
+    InvalidDataError, DuplicateIdError, EmployeeNotFoundError, ProjectNotFoundError,
+    FinancialValidationError
 )
-from refactored.exceptions import InvalidDataError, DuplicateIdError, FinancialValidationError
 
 
 class TestValidators:
@@ -67,6 +84,35 @@ class TestValidators:
     def test_company_validator_valid_name(self):
         """Валидное название компании"""
         CompanyValidator.validate_name("Google")
+    
+    def test_schema_validate_columns_report(self):
+        """Пакетная проверка колонок совпадает с построчной"""
+        columns = {
+            'id': [1, 0, 3, 4],
+            'name': ["Alice", "Bob", " ", "Dan"],
+            'department': ["IT", "IT", "HR", "HR"],
+            'base_salary': [5000, 6000, 7000, float('nan')],
+        }
+        report = EMPLOYEE_SCHEMA.validate_columns(columns)
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        
+        assert report.as_dict() == EMPLOYEE_SCHEMA.validate_rows(rows).as_dict()
+        assert report.invalid_rows() == [1, 2, 3]
+        assert report.valid_rows() == [0]
+        assert report.errors(2) == ["Имя сотрудника не должно быть пустой строкой"]
+        with pytest.raises(InvalidDataError):
+            report.raise_first()
+        with pytest.raises(FinancialValidationError):
+            EMPLOYEE_SCHEMA.validate(rows[3])
+    
+    def test_schema_status_message_is_stable(self):
+        """Допустимые статусы перечислены в сообщении по алфавиту"""
+        report = PROJECT_SCHEMA.validate_rows([
+            {'project_id': 1, 'name': "Site", 'description': "", 'status': "done"}
+        ])
+        assert report.errors(0) == [
+            "Статус должен быть одним из: 'active', 'cancelled', 'completed', 'planning'"
+        ]
 
 
 class TestRepository:
@@ -105,6 +151,16 @@ class TestRepository:
         repo.add(emp2)
         assert len(repo.get_all()) == 2
     
+    def test_iter_all_employees(self):
+        """Итерация по хранилищу в порядке добавления"""
+        repo = InMemoryEmployeeRepository()
+        emp1 = Employee(1, "Alice", "IT", 50000)
+        emp2 = Employee(2, "Bob", "HR", 45000)
+        repo.add(emp1)
+        repo.add(emp2)
+        assert list(repo.iter_all()) == [emp1, emp2]
+        assert repo.count() == 2
+    
     def test_find_employees(self):
         """Поиск сотрудников по критериям"""
         repo = InMemoryEmployeeRepository()
@@ -114,6 +170,242 @@ class TestRepository:
         repo.add(emp2)
         results = repo.find({'department': 'IT'})
         assert len(results) == 2
+    
+    def test_find_with_operators(self):
+        """Поиск по диапазону, множеству и префиксу"""
+        employees = [
+            Employee(1, "Alice", "IT", 50000),
+            Developer(2, "Bob", "IT", 60000, "middle"),
+            Developer(3, "Alex", "IT", 70000, "senior"),
+            Developer(4, "Carl", "HR", 40000, "junior")
+        ]
+        memory_repo = InMemoryEmployeeRepository()
+        for emp in employees:
+            memory_repo.add(emp)
+        db_repo = DatabaseEmployeeRepository(sqlite3.connect(":memory:"))
+        db_repo.add_many(employees)
+        
+        for repo in (memory_repo, db_repo):
+            assert [e.id for e in repo.find({'base_salary__gte': 50000, 'base_salary__lt': 70000})] == [1, 2]
+            assert [e.id for e in repo.find({'level__in': ['middle', 'senior']})] == [2, 3]
+            assert [e.id for e in repo.find({'name__startswith': 'Al', 'department': 'IT'})] == [1, 3]
+            assert [e.id for e in repo.find({'level__ne': 'junior'})] == [2, 3]
+    
+    def test_find_uses_secondary_indexes(self):
+        """Индексированный поиск совпадает с полным перебором"""
+        plain = InMemoryEmployeeRepository()
+        indexed = InMemoryEmployeeRepository(indexed_fields=('department', 'type', 'level'))
+        for i in range(1, 31):
+            emp = Developer(i, f"Dev{i}", f"D{i % 3}", 50000 + i, ["junior", "senior"][i % 2]) \
+                if i % 2 else Employee(i, f"Emp{i}", f"D{i % 3}", 50000)
+            plain.add(emp)
+            indexed.add(emp)
+        
+        for criteria in ({'department': 'D1'}, {'type': 'Developer', 'department__in': ['D0', 'D2']},
+                         {'level': 'senior', 'base_salary__gt': 50010}):
+            assert indexed.find(criteria) == plain.find(criteria)
+        
+        dev = indexed.get_by_id(1)
+        dev.level = "junior"
+        indexed.reindex(1, 'level')
+        assert dev in indexed.find({'level': 'junior'})
+        assert dev not in indexed.find({'level': 'senior'})
+    
+    def test_indexes_follow_field_changes_and_removal(self):
+        """Индекс переносит сотрудника при изменении поля без reindex() и удаляет по старому значению"""
+        repo = InMemoryEmployeeRepository(indexed_fields=['level'])
+        dev = Developer(1, "Alice", "IT", 50000, "junior")
+        other = Developer(2, "Bob", "IT", 50000, "junior")
+        repo.add(dev)
+        repo.add(other)
+        
+        dev.level = "senior"
+        assert repo.find({'level': 'senior'}) == [dev]
+        other.level = "intern"  # зарплата не меняется (множитель 1.0)
+        assert repo.find({'level': 'intern'}) == [other]
+        
+        repo.remove(1)
+        repo.remove(2)
+        assert repo.find({'level__in': ['junior', 'senior', 'intern']}) == []
+        dev.level = "middle"  # после удаления индекс не подписан
+        assert repo.find({'level': 'middle'}) == []
+
+    def test_mapped_repository_reopen(self, tmp_path):
+        """Колоночное хранилище переживает переоткрытие файла"""
+        path = str(tmp_path / "employees.col")
+        repo = MappedEmployeeRepository(path, capacity=8)
+        for i in range(1, 21):
+            repo.add(Developer(i, f"Dev{i}", "IT" if i % 2 else "HR", 50000, "senior"))
+        repo.remove(3)
+        with pytest.raises(DuplicateIdError):
+            repo.add(Employee(1, "Alice", "IT", 50000))
+        repo.close()
+
+        repo = MappedEmployeeRepository(path)
+        assert repo.count() == 19
+        assert repo.get_by_id(3) is None
+        assert repo.get_by_id(4).calculate_salary() == 100000
+        assert len(repo.find({'department': 'IT', 'level': 'senior'})) == 9
+        repo.close()
+
+    def test_mapped_repository_keeps_compact_types_and_reuses_heap(self, tmp_path):
+        """Compact-классы читаются обратно как есть, перезапись не раздувает кучу"""
+        path = str(tmp_path / "employees.col")
+        repo = MappedEmployeeRepository(path)
+        repo.add(CompactDeveloper(1, "Alice", "IT", 50000, "senior"))
+        repo.add(Developer(2, "Bob", "IT", 50000, "senior"))
+        repo.add(CompactSalesperson(3, "Carol", "Sales", 40000, 0.1))
+        assert type(repo.get_by_id(1)) is CompactDeveloper
+        assert type(repo.get_by_id(2)) is Developer
+        assert type(repo.get_by_id(3)) is CompactSalesperson
+        assert [e.id for e in repo.find({'type': 'CompactDeveloper'})] == [1]
+        assert [e.id for e in repo.find({'level': 'senior'})] == [1, 2]
+        assert [e.id for e in repo.find({'commission_rate': 0.1})] == [3]
+
+        heap_size = os.path.getsize(path + '.heap')
+        for salary in range(51000, 61000, 1000):
+            repo.update(1, CompactDeveloper(1, "Alice", "IT", salary, "senior"))
+        repo.update(2, Developer(2, "Bo", "IT", 50000, "senior"))
+        assert os.path.getsize(path + '.heap') == heap_size
+        repo.close()
+
+        repo = MappedEmployeeRepository(path)
+        assert repo.get_by_id(1).base_salary == 60000
+        assert repo.get_by_id(2).name == "Bo"
+        repo.close()
+
+    def test_mapped_repository_rejects_damaged_files(self, tmp_path):
+        """Обрезанный файл колонок или кучи - InvalidDataError, а не struct.error"""
+        path = str(tmp_path / "employees.col")
+        repo = MappedEmployeeRepository(path)
+        repo.add(Employee(1, "Alice", "IT", 50000))
+        repo.close()
+        columns = open(path, 'rb').read()
+
+        for size in (0, 10, len(columns) - 1):
+            with open(path, 'wb') as file:
+                file.write(columns[:size])
+            with pytest.raises(InvalidDataError):
+                MappedEmployeeRepository(path)
+
+        with open(path, 'wb') as file:
+            file.write(columns)
+        open(path + '.heap', 'wb').close()
+        repo = MappedEmployeeRepository(path)
+        with pytest.raises(InvalidDataError):
+            repo.get_by_id(1)
+        repo.close()
+
+        os.remove(path + '.heap')
+        with pytest.raises(InvalidDataError):
+            MappedEmployeeRepository(path)
+
+    def test_database_repository_batch_and_find(self):
+        """SQLite-хранилище: пакетная вставка и поиск через WHERE"""
+        repo = DatabaseEmployeeRepository(sqlite3.connect(":memory:"))
+        dev = Developer(2, "Bob", "IT", 60000, "senior")
+        dev.add_skill("Python")
+        repo.add_many([
+            Employee(1, "Alice", "IT", 50000),
+            dev,
+            Manager(3, "Charlie", "HR", 50000, FixedBonusStrategy(10000))
+        ])
+        assert repo.count() == 3
+        assert repo.get_by_id(2).get_skills() == ["Python"]
+        assert repo.get_by_id(3).calculate_salary() == 60000
+        assert [e.id for e in repo.find({'department': 'IT', 'level': 'senior'})] == [2]
+        
+        # Пачка с занятым ID не добавляется целиком
+        with pytest.raises(DuplicateIdError):
+            repo.add_many([Employee(4, "Diana", "IT", 40000), Employee(1, "Eve", "IT", 40000)])
+        assert repo.count() == 3
+
+    def test_repositories_share_update_signature(self, tmp_path):
+        """update(employee_id, employee) одинаково работает во всех хранилищах"""
+        repos = [InMemoryEmployeeRepository(),
+                 MappedEmployeeRepository(str(tmp_path / "employees.col")),
+                 DatabaseEmployeeRepository(sqlite3.connect(":memory:"))]
+        for repo in repos:
+            repo.add(Employee(1, "Alice", "IT", 50000))
+            repo.update(1, Employee(1, "Alice", "HR", 55000))
+            assert [e.base_salary for e in repo.find({'department': 'HR'})] == [55000]
+            with pytest.raises(EmployeeNotFoundError):
+                repo.update(2, Employee(2, "Bob", "IT", 50000))
+        repos[1].close()
+
+    def test_database_startswith_at_max_code_point(self):
+        """Префикс с U+10FFFF или перед суррогатами не ломает диапазон поиска"""
+        repo = DatabaseEmployeeRepository(sqlite3.connect(":memory:"))
+        names = ["A\U0010ffff", "A\U0010ffffB", "B", "\ud7ffX", "\ue000"]
+        repo.add_many([Employee(i, name, "IT", 50000) for i, name in enumerate(names, 1)])
+        assert [e.id for e in repo.find({'name__startswith': "A\U0010ffff"})] == [1, 2]
+        assert [e.id for e in repo.find({'name__startswith': "\U0010ffff"})] == []
+        assert [e.id for e in repo.find({'name__startswith': "\ud7ff"})] == [4]
+
+    def test_database_repository_uses_indexes(self):
+        """Поиск по отделу и типу идет через вторичные индексы"""
+        connection = sqlite3.connect(":memory:")
+        repo = DatabaseEmployeeRepository(connection)
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert "USING INDEX" in repo.explain_find({'department': 'IT'})[0]
+        assert "USING INDEX" in repo.explain_find({'type': 'Developer'})[0]
+        # Полный скан и скан индекса с сортировкой не считаются поиском по индексу
+        assert uses_index(connection, "SELECT * FROM employees WHERE department = ?", ("IT",))
+        assert not uses_index(connection, "SELECT * FROM employees WHERE name = ?", ("Alice",))
+        assert not uses_index(connection, "SELECT base_salary FROM employees ORDER BY base_salary",
+                              index_name="idx_employees_salary")
+
+    def test_database_salary_range_uses_index_without_sort(self):
+        """Диапазон по зарплате идет по idx_employees_salary без временной сортировки"""
+        repo = DatabaseEmployeeRepository(sqlite3.connect(":memory:"))
+        repo.add_many([Employee(3, "Carol", "IT", 90000), Employee(1, "Alice", "IT", 70000),
+                       Employee(2, "Bob", "HR", 40000)])
+        plan = repo.explain_find({'base_salary__gte': 60000})
+        assert len(plan) == 1
+        assert plan[0].startswith("SEARCH") and "idx_employees_salary" in plan[0]
+        # Порядок по ID сохраняется, хотя индекс отдает строки по зарплате
+        assert [e.id for e in repo.find({'base_salary__gte': 60000})] == [1, 3]
+
+    def test_async_repository(self, tmp_path):
+        """Асинхронное хранилище: пакетный get_by_id и потоковый get_all"""
+        async def scenario():
+            async with AsyncEmployeeRepository(str(tmp_path / "company.db"), page_size=2) as repo:
+                await repo.add_many([Employee(i, f"Emp{i}", "IT", 50000) for i in range(1, 6)])
+                found = await asyncio.gather(repo.get_by_id(1), repo.get_by_id(5), repo.get_by_id(99))
+                ids = [emp.id async for emp in repo.get_all()]
+                return [emp and emp.id for emp in found], ids
+        
+        found, ids = asyncio.run(scenario())
+        assert found == [1, 5, None]
+        assert ids == [1, 2, 3, 4, 5]
+
+    def test_department_repository_follows_rename(self):
+        """Переименованный отдел находится и удаляется по новому названию"""
+        repo = InMemoryDepartmentRepository()
+        it, hr = Department("IT"), Department("HR")
+        repo.add(it)
+        repo.add(hr)
+
+        it.name = "Engineering"
+        assert repo.get_by_name("Engineering") is it
+        assert repo.get_by_name("IT") is None
+        assert repo.get_all() == [it, hr]
+
+        with pytest.raises(DuplicateIdError):
+            hr.name = "Engineering"
+        assert hr.name == "HR"
+        assert repo.get_by_name("HR") is hr
+
+        repo.remove("Engineering")
+        assert repo.get_all() == [hr]
+        it.name = "HR Ops"  # отдел больше не в хранилище
+        assert repo.get_by_name("HR Ops") is None
+
+    def test_project_repository_remove_missing(self):
+        """Удаление отсутствующего проекта - ProjectNotFoundError"""
+        repo = InMemoryProjectRepository()
+        with pytest.raises(ProjectNotFoundError):
+            repo.remove(1)
 
 
 class TestBonusStrategies:
@@ -158,6 +450,26 @@ class TestBonusStrategies:
         # 5000 + 2500 = 7500
         assert composite.calculate(emp) == 7500
     
+    def test_calculate_batch_matches_calculate(self):
+        """Пакетный расчет бонусов совпадает с поштучным"""
+        employees = [
+            Developer(1, "Alice", "IT", 50000, "senior"),
+            Developer(2, "Bob", "IT", 40000, "middle"),
+            Manager(3, "Charlie", "IT", 70000),
+        ]
+        composite = CompositeBonusStrategy([
+            FixedBonusStrategy(5000),
+            PercentageBonusStrategy(0.05),
+            SeniorityBonusStrategy(),
+            ProjectBonusStrategy(1000),
+        ])
+        employees[2].projects_count = 2
+        
+        expected = [composite.calculate(emp) for emp in employees]
+        batch = composite.calculate_batch(employees)
+        assert type(batch) is list and batch == expected
+        assert NoBonusStrategy().calculate_batch(employees) == [0.0, 0.0, 0.0]
+    
     def test_change_bonus_strategy_at_runtime(self):
         """Изменение стратегии во время выполнения (OCP)"""
         emp = Manager(1, "Alice", "IT", 50000, FixedBonusStrategy(10000))
@@ -224,6 +536,79 @@ class TestEmployeeTypes:
             assert isinstance(emp, ISalaryCalculable)
             salary = emp.calculate_salary()
             assert salary > 0
+    
+    def test_salary_cache_invalidation(self):
+        """Кэш зарплаты сбрасывается при изменении входных полей"""
+        dev = Developer(1, "Alice", "IT", 50000, "junior")
+        assert dev.calculate_salary() == 50000
+        dev.level = "senior"
+        assert dev.calculate_salary() == 100000
+        
+        manager = Manager(2, "Bob", "IT", 60000, ProjectBonusStrategy(1000))
+        assert manager.calculate_salary() == 60000
+        manager.projects_count = 3  # атрибут читает стратегия
+        assert manager.calculate_salary() == 63000
+        manager.set_bonus_strategy(FixedBonusStrategy(500))
+        assert manager.calculate_salary() == 60500
+        
+        manager.bonus_strategy.bonus_amount = 700  # изменение внутри стратегии
+        assert manager.calculate_salary() == 60500
+        manager.invalidate_salary()
+        assert manager.calculate_salary() == 60700
+
+    def test_manager_bonus_inputs_are_declared(self):
+        """Показатели для стратегий бонуса есть и у компактного менеджера,
+        а прочие атрибуты не уведомляют наблюдателей"""
+        compact = CompactManager(1, "Bob", "IT", 60000, ProjectBonusStrategy(1000))
+        compact.projects_count = 2
+        assert compact.calculate_salary() == 62000
+
+        changes = []
+
+        class Observer:
+            def on_employee_changed(self, employee):
+                changes.append(employee)
+
+        emp = Employee(2, "Alice", "IT", 50000)
+        emp.add_salary_observer(Observer())
+        emp.nickname = "Ali"
+        assert changes == []
+
+    def test_from_trusted_rows(self):
+        """Доверенная загрузка: без валидации, но с контрольной суммой"""
+        rows = [(1, "Alice", "IT", 50000, "senior"), (2, "Bob", "IT", 40000, "middle")]
+        checksum = Developer.rows_checksum(rows)
+        
+        developers = Developer.from_trusted_rows(rows, checksum)
+        assert [dev.calculate_salary() for dev in developers] == [100000, 60000]
+        developers[0].add_skill("Python")
+        assert developers[0].get_skills() == ["Python"]
+        
+        with pytest.raises(InvalidDataError):
+            Developer.from_trusted_rows([(1, "Alice", "IT", 50000, "lead")], checksum)
+        # Граница между строками входит в сумму
+        shifted = [(1, "Al\x1fice", "IT", 50000), (2, "Bob", "IT", 40000)]
+        assert Employee.rows_checksum(shifted) != Employee.rows_checksum(
+            [(1, "Al", "IT", 50000), (2, "ice\x1fBob", "IT", 40000)])
+
+    def test_compact_employees_have_no_dict(self):
+        """Compact-классы хранят поля в слотах и сохраняют поведение"""
+        dev = CompactDeveloper(1, "Alice", "IT", 50000, "senior")
+        dev.add_skill("Python")
+        employees = [
+            CompactEmployee(2, "Bob", "IT", 50000),
+            dev,
+            CompactManager(3, "Charlie", "IT", 50000, FixedBonusStrategy(10000)),
+            CompactSalesperson(4, "Diana", "Sales", 30000, 0.1)
+        ]
+        for emp in employees:
+            assert not hasattr(emp, '__dict__')
+        assert dev.to_dict() == {**Developer(1, "Alice", "IT", 50000, "senior").to_dict(),
+                                 'type': 'CompactDeveloper', 'skills': ["Python"]}
+        assert [emp.calculate_salary() for emp in employees] == [50000, 100000, 60000, 30000]
+        # Обычные и компактные классы - параллельные наследники общей основы
+        assert not isinstance(Developer(1, "Alice", "IT", 50000), CompactDeveloper)
+        assert not isinstance(CompactDeveloper(1, "Alice", "IT", 50000), Developer)
 
 
 class TestSalaryCalculator:
@@ -266,6 +651,118 @@ class TestSalaryCalculator:
         assert stats['min'] == 40000
         assert stats['max'] == 60000
         assert stats['count'] == 3
+    
+    def test_get_salary_distribution(self):
+        """Медиана, перцентили и гистограмма зарплат"""
+        employees = [Employee(i, f"E{i}", "IT", salary)
+                     for i, salary in enumerate([10000, 20000, 30000, 40000, 100000], start=1)]
+        
+        distribution = SalaryCalculator.get_salary_distribution(employees, percentiles=(25, 100), bins=3)
+        assert distribution['median'] == 30000
+        assert distribution['percentiles'] == {25: 20000, 100: 100000}
+        assert distribution['histogram']['counts'] == [3, 1, 1]
+        assert distribution['histogram']['edges'] == [10000, 40000, 70000, 100000]
+        assert SalaryCalculator.salary_column(employees) == [10000, 20000, 30000, 40000, 100000]
+    
+    def test_payroll_engine_matches_serial(self):
+        """Расчет движка совпадает с последовательным"""
+        it, sales = Department("IT"), Department("Sales")
+        for i in range(1, 41):
+            it.add_employee(Developer(i, f"Dev{i}", "IT", 40000 + i * 0.1, "middle"))
+            it.add_employee(Manager(100 + i, f"Man{i}", "IT", 60000, PercentageBonusStrategy(0.1)))
+            seller = Salesperson(200 + i, f"Sal{i}", "Sales", 30000, 0.07)
+            seller.set_sales_amount(1000 * i)
+            sales.add_employee(seller)
+        
+        calculator = FinancialCalculator()
+        with PayrollEngine() as engine:
+            result = engine.run([it, sales])
+        
+        budget = calculator.calculate_budget_per_department([it, sales])
+        assert result['by_department'] == pytest.approx(budget)
+        assert result['total'] == math.fsum(
+            emp.calculate_salary() for dept in (it, sales) for emp in dept.get_employees()
+        )
+        assert result['count'] == 120
+    
+    def test_payroll_engine_store_shards_in_processes(self, tmp_path):
+        """Хранилище считается шардами в пуле процессов, итог не зависит от шардов"""
+        path = str(tmp_path / "employees.col")
+        repo = MappedEmployeeRepository(path)
+        for i in range(1, 41):
+            repo.add(Developer(i, f"Dev{i}", "IT", 40000 + i * 0.1, "middle"))
+            seller = Salesperson(100 + i, f"Sal{i}", "Sales", 30000, 0.07)
+            seller.set_sales_amount(1000 * i)
+            repo.add(seller)
+            repo.add(Manager(200 + i, f"Man{i}", "HR", 60000))
+        repo.remove(2)
+        employees = repo.get_all()
+        
+        with PayrollEngine(max_workers=2, shard_size=15, parallel_threshold=0) as engine:
+            result = engine.run_store(path)
+        with PayrollEngine(max_workers=1, shard_size=1000) as engine:
+            assert engine.run_store(path) == result
+        repo.close()
+        
+        assert list(result['by_department']) == ["IT", "Sales", "HR"]
+        assert result['by_department']['HR'] == math.fsum(
+            emp.calculate_salary() for emp in employees if emp.department == "HR"
+        )
+        assert result['total'] == math.fsum(emp.calculate_salary() for emp in employees)
+        assert result['count'] == 119
+    
+    def test_full_report_recomputes_changed_departments(self):
+        """Полный отчет пересчитывает только измененные отделы"""
+        it, hr = Department("IT"), Department("HR")
+        dev = Developer(1, "Alice", "IT", 50000, "junior")
+        it.add_employee(dev)
+        it.add_employee(Employee(2, "Bob", "IT", 70000))
+        hr.add_employee(Employee(3, "Carol", "HR", 40000))
+        company = Company("Acme")
+        company.add_department(it)
+        company.add_department(hr)
+        
+        report = company.get_full_report()
+        assert report['financial_report'] == FinancialCalculator().get_financial_report([it, hr])
+        assert report['financial_report']['average_salary_per_department'] == {'IT': 60000, 'HR': 40000}
+        assert report['total_employees'] == 3
+        
+        hr_version = hr.version
+        dev.level = "senior"  # 100000
+        assert hr.version == hr_version
+        report = company.get_full_report()
+        assert report['financial_report']['budget_by_department'] == {'IT': 170000, 'HR': 40000}
+        assert report['average_salary'] == 70000
+        
+        it.remove_employee(1)
+        assert company.get_financial_report()['average_salary_per_department']['IT'] == 70000
+        it_version = it.version
+        dev.level = "junior"  # сотрудник больше не в отделе
+        assert it.version == it_version
+        assert company.get_total_salary_expenses() == 110000
+    
+    def test_salary_index_follows_salary_changes(self):
+        """Индекс по зарплате: диапазоны, топ-N и пересчет при изменении"""
+        dev = Developer(1, "Alice", "IT", 50000, "junior")
+        sales = Salesperson(2, "Bob", "Sales", 40000, 0.1)
+        emp = Employee(3, "Charlie", "IT", 70000)
+        index = SalaryIndex([dev, sales, emp])
+        
+        assert list(index) == [sales, dev, emp]
+        assert index.between(45000, 70000) == [dev]
+        assert index.top(1) == [emp]
+        assert index.percentile(50) == 50000
+        
+        dev.level = "senior"          # 100000
+        sales.set_sales_amount(500000)  # 90000
+        assert index.top(2) == [dev, sales]
+        assert index.count_between(0, 80000) == 1
+        
+        ranges = [(0, 80000), (80000, float('inf'))]
+        grouped = SalaryCalculator.group_by_salary_range([dev, sales, emp], ranges)
+        indexed = index.group_by_range(ranges)
+        assert {k: set(v) for k, v in grouped.items()} == {k: set(v) for k, v in indexed.items()}
+        assert SalaryCalculator.sort_by_salary([dev, sales, emp]) == list(index)
 
 
 class TestDepartmentManager: